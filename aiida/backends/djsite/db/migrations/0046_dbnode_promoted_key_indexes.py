@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name
+"""Add expression indexes on the text value of frequently filtered keys of the `attributes` and `extras` of nodes.
+
+The `QueryBuilder` writes equality filters on these promoted keys such that they can be served by these indexes.
+"""
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error
+from django.db import migrations
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+
+REVISION = '1.0.46'
+DOWN_REVISION = '1.0.45'
+
+PROMOTED_KEYS = (
+    ('attributes', 'process_state'),
+    ('attributes', 'exit_status'),
+    ('attributes', 'sealed'),
+    ('extras', '_aiida_hash'),
+)
+
+
+class Migration(migrations.Migration):
+    """Migrate to add the expression indexes on the promoted keys of the dbnode table."""
+
+    dependencies = [
+        ('db', '0045_dbgroup_extras'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                f"CREATE INDEX ix_db_dbnode_{column}_{key} ON db_dbnode (({column} ->> '{key}'));"
+                for column, key in PROMOTED_KEYS
+            ],
+            reverse_sql=[f'DROP INDEX ix_db_dbnode_{column}_{key};' for column, key in PROMOTED_KEYS]
+        ),
+        upgrade_schema_version(REVISION, DOWN_REVISION)
+    ]
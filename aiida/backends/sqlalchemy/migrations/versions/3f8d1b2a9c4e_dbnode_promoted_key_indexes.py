@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=no-member,invalid-name
+"""Add expression indexes on the text value of frequently filtered keys of the `attributes` and `extras` of nodes.
+
+The `QueryBuilder` writes equality filters on these promoted keys such that they can be served by these indexes.
+
+Revision ID: 3f8d1b2a9c4e
+Revises: 0edcdd5a30f0
+Create Date: 2021-02-01 10:12:41.516472
+
+"""
+from alembic import op
+from sqlalchemy.sql import text
+
+# revision identifiers, used by Alembic.
+revision = '3f8d1b2a9c4e'
+down_revision = '0edcdd5a30f0'
+branch_labels = None
+depends_on = None
+
+PROMOTED_KEYS = (
+    ('attributes', 'process_state'),
+    ('attributes', 'exit_status'),
+    ('attributes', 'sealed'),
+    ('extras', '_aiida_hash'),
+)
+
+
+def upgrade():
+    """Upgrade: Add the expression indexes on the promoted keys of the 'db_dbnode' table"""
+    for column, key in PROMOTED_KEYS:
+        op.create_index(f'ix_db_dbnode_{column}_{key}', 'db_dbnode', [text(f"({column} ->> '{key}')")])
+
+
+def downgrade():
+    """Downgrade: Drop the expression indexes on the promoted keys of the 'db_dbnode' table"""
+    for column, key in PROMOTED_KEYS:
+        op.drop_index(f'ix_db_dbnode_{column}_{key}', table_name='db_dbnode')
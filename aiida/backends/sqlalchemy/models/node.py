@@ -12,7 +12,7 @@
 
 from sqlalchemy import ForeignKey
 from sqlalchemy.orm import relationship, backref
-from sqlalchemy.schema import Column
+from sqlalchemy.schema import Column, Index
 from sqlalchemy.types import Integer, String, DateTime, Text
 # Specific to PGSQL. If needed to be agnostic
 # http://docs.sqlalchemy.org/en/rel_0_9/core/custom_types.html?highlight=guid#backend-agnostic-guid-type
@@ -144,6 +144,13 @@ class DbNode(Base):
         return f'{simplename} node [{self.pk}]'
 
 
+# Expression indexes on the text value of frequently filtered keys of the attributes and extras, which the
+# `QueryBuilder` uses for equality filters on these keys, see `BackendQueryBuilder.PROMOTED_NODE_KEYS`
+for _column, _key in (('attributes', 'process_state'), ('attributes', 'exit_status'), ('attributes', 'sealed'),
+                      ('extras', '_aiida_hash')):
+    Index(f'ix_db_dbnode_{_column}_{_key}', DbNode.__table__.c[_column][_key].astext)
+
+
 class DbLink(Base):
     """Class to store links between nodes using SQLA backend."""
 
@@ -92,6 +92,34 @@ def database_migrate(force):
             echo.echo_success('migration completed')
 
 
+@verdi_database.command('gin-indexes')
+@click.option('--drop', is_flag=True, help='Drop the GIN indexes instead of creating them.')
+@decorators.with_dbenv()
+def database_gin_indexes(drop):
+    """Create the optional GIN indexes on the attributes and extras of nodes.
+
+    These indexes speed up equality and `contains` filters on attributes and extras in the query builder, at the cost
+    of disk space and of a slower storing of nodes. Creating them may take a while for large databases.
+    """
+    from aiida.manage.database.indexes import create_gin_indexes, drop_gin_indexes, get_gin_indexes
+    from aiida.manage.manager import get_manager
+
+    backend = get_manager().get_backend()
+
+    if drop:
+        drop_gin_indexes(backend)
+        echo.echo_success('dropped the GIN indexes')
+        return
+
+    existing = get_gin_indexes(backend)
+    create_gin_indexes(backend)
+
+    for name in sorted(get_gin_indexes(backend) - existing):
+        echo.echo_info(f'created index `{name}`')
+
+    echo.echo_success('the GIN indexes exist')
+
+
 @verdi_database.group('integrity')
 def verdi_database_integrity():
     """Check the integrity of the database and fix potential issues."""
@@ -80,7 +80,9 @@ def inspect(archive, version, data, meta_data):
 @options.GROUPS()
 @options.NODES()
 @options.ARCHIVE_FORMAT(
-    type=click.Choice(['zip', 'zip-uncompressed', 'zip-lowmemory', 'tar.gz', 'null']),
+    type=click.Choice([
+        'zip', 'zip-uncompressed', 'zip-lowmemory', 'zip-jsonl', 'zip-sqlite', 'tar.gz', 'tar.zst', 'null'
+    ]),
 )
 @options.FORCE(help='overwrite output file if it already exists')
 @click.option(
@@ -103,6 +105,20 @@ def inspect(archive, version, data, meta_data):
     show_default=True,
     help='Include or exclude comments for node(s) in export. (Will also export extra users who commented).'
 )
+@click.option(
+    '--processes',
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='The number of worker processes used to compress the node repositories in zip archives.'
+)
+@click.option(
+    '--incremental-from',
+    multiple=True,
+    type=click.Path(exists=True, readable=True),
+    help='A previous archive, or an export manifest, of this profile. Only the nodes, comments and logs that are new '
+    'or were modified since are exported. Can be specified multiple times.'
+)
 # will only be useful when moving to a new archive format, that does not store all data in memory
 # @click.option(
 #     '-b',
@@ -114,7 +130,8 @@ def inspect(archive, version, data, meta_data):
 @decorators.with_dbenv()
 def create(
     output_file, codes, computers, groups, nodes, archive_format, force, input_calc_forward, input_work_forward,
-    create_backward, return_backward, call_calc_backward, call_work_backward, include_comments, include_logs, verbosity
+    create_backward, return_backward, call_calc_backward, call_work_backward, include_comments, include_logs, processes,
+    incremental_from, verbosity
 ):
     """
     Export subsets of the provenance graph to file for sharing.
@@ -155,6 +172,8 @@ def create(
         'include_comments': include_comments,
         'include_logs': include_logs,
         'overwrite': force,
+        'processes': processes,
+        'incremental_from': incremental_from or None,
     }
 
     if archive_format == 'zip':
@@ -166,8 +185,16 @@ def create(
     elif archive_format == 'zip-lowmemory':
         export_format = ExportFileFormat.ZIP
         kwargs.update({'writer_init': {'cache_zipinfo': True}})
+    elif archive_format == 'zip-jsonl':
+        export_format = ExportFileFormat.ZIP_JSONL
+        kwargs.update({'writer_init': {'cache_zipinfo': True}})
+    elif archive_format == 'zip-sqlite':
+        export_format = ExportFileFormat.ZIP_SQLITE
+        kwargs.update({'writer_init': {'cache_zipinfo': True}})
     elif archive_format == 'tar.gz':
         export_format = ExportFileFormat.TAR_GZIPPED
+    elif archive_format == 'tar.zst':
+        export_format = ExportFileFormat.TAR_ZSTD
     elif archive_format == 'null':
         export_format = 'null'
 
@@ -186,6 +213,32 @@ def create(
         echo.echo_success(f'wrote the export archive file to {output_file}')
 
 
+@verdi_export.command('manifest')
+@arguments.OUTPUT_FILE(type=click.Path(exists=False))
+@click.argument('archives', nargs=-1, required=True, type=click.Path(exists=True, readable=True))
+@options.FORCE(help='overwrite output file if it already exists')
+def manifest(output_file, archives, force):
+    """Write the manifest of the entities in export archives.
+
+    The manifest of ARCHIVES, which can also be other manifests, records the UUIDs and modification times of their
+    nodes, comments and logs. It can be passed to `verdi export create --incremental-from`, instead of the archives.
+    """
+    import os
+    from aiida.tools.importexport import ExportImportException
+    from aiida.tools.importexport.dbexport.utils import get_export_manifest, write_export_manifest
+
+    if os.path.exists(output_file) and not force:
+        echo.echo_critical(f'the output file `{output_file}` already exists')
+
+    try:
+        entries = get_export_manifest(archives)
+    except ExportImportException as exception:
+        echo.echo_critical(f'failed to read the archives: {exception}')
+
+    write_export_manifest(entries, output_file)
+    echo.echo_success(f'wrote the manifest of {len(archives)} archive(s) to {output_file}')
+
+
 @verdi_export.command('migrate')
 @arguments.INPUT_FILE()
 @arguments.OUTPUT_FILE(required=False)
@@ -287,10 +287,37 @@ def format_call_graph(calc_node, info_fn=calc_info):
     :param info_fn: An optional function that takes the node and returns a string
         of information to be displayed for each node.
     """
-    call_tree = build_call_graph(calc_node, info_fn=info_fn)
+    from aiida.orm.utils.links import discard_prefetched_links
+
+    # The prefetched links are only used to build the graph, as they would otherwise hide calls made afterwards
+    nodes = prefetch_call_graph(calc_node)
+    try:
+        call_tree = build_call_graph(calc_node, info_fn=info_fn)
+    finally:
+        discard_prefetched_links(nodes)
     return format_tree_descending(call_tree)
 
 
+def prefetch_call_graph(calc_node):
+    """Prefetch the call links of all processes in the call graph of the given node, with one query per level.
+
+    :param calc_node: The calculation node
+    :return: list of the nodes of the call graph whose call links were prefetched
+    """
+    from aiida.common.links import LinkType
+    from aiida.orm.utils.links import prefetch_links
+
+    nodes = []
+    level = [calc_node]
+
+    while level:
+        prefetch_links(level, link_direction='outgoing', link_type=(LinkType.CALL_CALC, LinkType.CALL_WORK))
+        nodes.extend(level)
+        level = [child for node in level for child in node.called]
+
+    return nodes
+
+
 def build_call_graph(calc_node, info_fn=calc_info):
     """Build the call graph of a given node."""
     info_string = info_fn(calc_node)
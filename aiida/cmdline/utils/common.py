@@ -497,7 +497,13 @@ def check_worker_load(active_slots):
     warning_threshold = 0.9  # 90%
 
     config = get_config()
-    slots_per_worker = config.get_option('daemon.worker_process_slots', config.current_profile.name)
+    profile_name = config.current_profile.name
+
+    # With adaptive process slots, workers only refuse new tasks once they reach the maximum number of slots
+    if config.get_option('daemon.worker_process_slots_adaptive', profile_name):
+        slots_per_worker = config.get_option('daemon.worker_process_slots_max', profile_name)
+    else:
+        slots_per_worker = config.get_option('daemon.worker_process_slots', profile_name)
 
     try:
         active_workers = get_num_workers()
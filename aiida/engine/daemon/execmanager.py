@@ -15,6 +15,7 @@ plugin-specific operations.
 """
 import os
 import shutil
+from uuid import UUID
 
 from aiida.common import AIIDA_LOGGER, exceptions
 from aiida.common.folders import SandboxFolder
@@ -40,7 +41,7 @@ def upload_calculation(node, transport, calc_info, folder, inputs=None, dry_run=
     # pylint: disable=too-many-locals,too-many-branches,too-many-statements
     from logging import LoggerAdapter
     from tempfile import NamedTemporaryFile
-    from aiida.orm import load_node, Code, RemoteData
+    from aiida.orm import load_node, load_nodes, Code, QueryBuilder, RemoteData
 
     # If the calculation already has a `remote_folder`, simply return. The upload was apparently already completed
     # before, which can happen if the daemon is restarted and it shuts down after uploading but before getting the
@@ -53,7 +54,7 @@ def upload_calculation(node, transport, calc_info, folder, inputs=None, dry_run=
     computer = node.computer
 
     codes_info = calc_info.codes_info
-    input_codes = [load_node(_.code_uuid, sub_classes=(Code,)) for _ in codes_info]
+    input_codes = load_nodes([_.code_uuid for _ in codes_info], sub_classes=(Code,))
 
     logger_extra = get_dblogger_extra(node)
     transport.set_logger_extra(logger_extra)
@@ -159,6 +160,13 @@ def upload_calculation(node, transport, calc_info, folder, inputs=None, dry_run=
     remote_symlink_list = calc_info.remote_symlink_list or []
     provenance_exclude_list = calc_info.provenance_exclude_list or []
 
+    # Load all the nodes of the `local_copy_list` that are specified by a valid full UUID with a single query
+    local_copy_uuids = {_normalize_uuid(uuid) for uuid, _, _ in local_copy_list} - {None}
+    local_copy_nodes = {}
+    if local_copy_uuids:
+        builder = QueryBuilder().append(Node, filters={'uuid': {'in': list(local_copy_uuids)}}, project=['uuid', '*'])
+        local_copy_nodes = {str(uuid): data_node for uuid, data_node in builder.iterall()}
+
     for uuid, filename, target in local_copy_list:
         logger.debug(f'[submission of calculation {node.uuid}] copying local file/folder to {target}')
 
@@ -182,9 +190,17 @@ def upload_calculation(node, transport, calc_info, folder, inputs=None, dry_run=
 
             return data_node
 
-        try:
-            data_node = load_node(uuid=uuid)
-        except exceptions.NotExistent:
+        normalized_uuid = _normalize_uuid(uuid)
+
+        if normalized_uuid is not None:
+            data_node = local_copy_nodes.get(normalized_uuid, None)
+        else:
+            try:
+                data_node = load_node(uuid=uuid)
+            except exceptions.NotExistent:
+                data_node = None
+
+        if data_node is None:
             data_node = find_data_node(inputs, uuid)
 
         if data_node is None:
@@ -294,6 +310,18 @@ def upload_calculation(node, transport, calc_info, folder, inputs=None, dry_run=
         remotedata.store()
 
 
+def _normalize_uuid(value):
+    """Return the canonical string representation of a UUID.
+
+    :param value: a UUID or its string representation
+    :return: the canonical string representation or `None` if the value is not a valid full UUID
+    """
+    try:
+        return str(UUID(str(value)))
+    except ValueError:
+        return None
+
+
 def submit_calculation(calculation, transport):
     """Submit a previously uploaded `CalcJob` to the scheduler.
 
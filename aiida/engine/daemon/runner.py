@@ -23,6 +23,8 @@ async def shutdown_runner(runner):
     """Cleanup tasks tied to the service's shutdown."""
     LOGGER.info('Received signal to shut down the daemon runner')
 
+    get_manager().stop_process_slots()
+
     try:
         from asyncio import all_tasks
         from asyncio import current_task
@@ -63,6 +65,7 @@ def start_daemon():
         runner.start()
     except SystemError as exception:
         LOGGER.info('Received a SystemError: %s', exception)
+        manager.stop_process_slots()
         runner.close()
 
     LOGGER.info('Daemon runner stopped')
@@ -8,6 +8,11 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Top level functions that can be used to launch a Process."""
+import collections
+import concurrent.futures
+import multiprocessing
+import os
+import tempfile
 
 from aiida.common import InvalidOperation
 from aiida.manage import manager
@@ -15,7 +20,7 @@ from .processes.functions import FunctionProcess
 from .processes.process import Process
 from .utils import is_process_scoped, instantiate_process
 
-__all__ = ('run', 'run_get_pk', 'run_get_node', 'submit')
+__all__ = ('run', 'run_get_pk', 'run_get_node', 'run_map', 'run_map_get_node', 'submit')
 
 
 def run(process, *args, **inputs):
@@ -123,6 +128,267 @@ def submit(process, **inputs):
     return process.node
 
 
+def run_map(process, inputs_list, max_workers=None):
+    """Run a calculation function for each set of inputs, executing the function bodies in a pool of processes.
+
+    See :func:`~aiida.engine.launch.run_map_get_node` for details.
+
+    :param process: the calculation function to run
+    :param inputs_list: an iterable of dictionaries with the inputs for each invocation of the function
+    :param max_workers: the maximum number of worker processes, by default the number of processors of the machine
+    :return: list of the outputs of each invocation, in the same order as the inputs
+    """
+    return [result for result, _ in run_map_get_node(process, inputs_list, max_workers=max_workers)]
+
+
+def run_map_get_node(process, inputs_list, max_workers=None):
+    """Run a calculation function for each set of inputs, executing the function bodies in a pool of processes.
+
+    Each invocation is represented by a normal `CalcFunctionNode` that is created, linked and sealed in the current
+    interpreter, exactly as if the function had been called directly. Only the body of the decorated function is
+    executed in a worker process, which loads its inputs from the database and sends the unstored output nodes back to
+    the current interpreter, where they are stored and linked. The worker processes are started with the ``spawn``
+    method and load the currently loaded profile, so the calculation function has to be importable, i.e. it has to be
+    defined at the top level of a module.
+
+    If a calculation function is called from within another process, for example a work chain step, the `CALL` links
+    are created exactly as for a direct call.
+
+    The processes are only instantiated as they are submitted to the pool and at most twice as many as there are worker
+    processes are pending at any time, such that the memory usage does not grow with the number of inputs.
+
+    :param process: the calculation function to run
+    :param inputs_list: an iterable of dictionaries with the inputs for each invocation of the function
+    :param max_workers: the maximum number of worker processes, by default the number of processors of the machine
+    :return: list of tuples of the outputs of each invocation and the corresponding process node, in the same order as
+        the inputs
+    :raises ValueError: if `process` is not a calculation function
+    :raises InvalidOperation: if one of the invocations was launched with `store_provenance=False`, in which case the
+        invocations that precede it may already have completed
+    """
+    from aiida.manage.configuration import get_profile, settings
+    from aiida.orm import CalcFunctionNode
+
+    if not getattr(process, 'is_process_function', False) or not issubclass(process.node_class, CalcFunctionNode):
+        raise ValueError(f'`{process}` is not a calculation function')
+
+    runner = manager.get_manager().get_runner()
+    context = multiprocessing.get_context('spawn')
+    max_workers = max_workers or os.cpu_count() or 1
+    initargs = (settings.AIIDA_CONFIG_FOLDER, get_profile().name)
+
+    # The processes are instantiated as they are submitted, and at most `2 * max_workers` are pending at any time
+    pending = collections.deque()
+    results = []
+
+    try:
+        with context.Pool(max_workers, initializer=_initialize_map_worker, initargs=initargs) as pool:
+            for inputs in inputs_list:
+                function_process = instantiate_process(runner, process, **inputs)
+                pending.append((function_process, None))
+
+                if not function_process.metadata.store_provenance:
+                    raise InvalidOperation('cannot run a map of processes with `store_provenance=False`')
+
+                # A process that was taken from the cache already has an exit status and does not need to be executed
+                if function_process.node.exit_status is None:
+                    args, kwargs = function_process.get_function_arguments()
+                    arguments = [_serialize_map_input(value) for value in args]
+                    keywords = {key: _serialize_map_input(value) for key, value in kwargs.items()}
+                    async_result = pool.apply_async(_execute_map_function, (process, arguments, keywords))
+                    pending[-1] = (function_process, async_result)
+
+                if len(pending) > 2 * max_workers:
+                    results.append(_finalize_map_process(*pending.popleft()))
+
+            while pending:
+                results.append(_finalize_map_process(*pending.popleft()))
+
+    except BaseException:
+        message = 'the map of processes was interrupted by an exception'
+        _kill_processes([function_process for function_process, _ in pending], message)
+        raise
+
+    return results
+
+
+def _finalize_map_process(function_process, async_result):
+    """Wait for the result of a calculation function executed in the pool and finish its process in this interpreter.
+
+    :param function_process: the process instance of the calculation function
+    :param async_result: the result of the execution of the function body in the pool, or `None` if it was not executed
+    :return: tuple of the outputs of the process and its node
+    """
+    if async_result is not None:
+        function_future = concurrent.futures.Future()
+
+        try:
+            function_future.set_result(_deserialize_map_output(async_result.get()))
+        except Exception as exception:  # pylint: disable=broad-except
+            function_future.set_exception(exception)
+
+        function_process.set_function_future(function_future)
+
+    return function_process.execute(), function_process.node
+
+
+def _kill_processes(processes, msg):
+    """Kill all processes that have not yet terminated.
+
+    :param processes: list of process instances
+    :param msg: the message to pass to the kill call
+    """
+    for process in processes:
+        if not process.has_terminated():
+            process.kill(msg=msg)
+
+
+def _initialize_map_worker(config_folder, profile_name):
+    """Load the given profile in a worker process of the pool used by :func:`~aiida.engine.launch.run_map_get_node`.
+
+    The configuration folder of the parent interpreter is used, since its location may not follow from the environment,
+    for example for a temporary profile of the test fixtures.
+
+    :param config_folder: the absolute path of the configuration folder
+    :param profile_name: the name of the profile to load
+    """
+    from aiida.manage import configuration
+    from aiida.manage.configuration import settings
+
+    settings.AIIDA_CONFIG_FOLDER = config_folder
+    configuration.reset_config()
+    configuration.load_profile(profile_name)
+
+
+def _execute_map_function(process, arguments, keywords):
+    """Execute the body of a calculation function in a worker process and return its serialized result.
+
+    :param process: the calculation function
+    :param arguments: list of serialized positional arguments
+    :param keywords: dictionary of serialized keyword arguments
+    :return: the serialized result
+    """
+    args = [_deserialize_map_input(value) for value in arguments]
+    kwargs = {key: _deserialize_map_input(value) for key, value in keywords.items()}
+    return _serialize_map_output(process.process_class._func(*args, **kwargs))  # pylint: disable=protected-access
+
+
+def _serialize_map_input(value):
+    """Serialize an input of a calculation function by replacing stored nodes with their pk.
+
+    :param value: a stored node, `None` or a (nested) mapping thereof
+    :return: the serialized value
+    """
+    from aiida.orm import Node
+
+    if isinstance(value, Node):
+        return ('node', value.pk)
+
+    if isinstance(value, collections.abc.Mapping):
+        return ('mapping', {key: _serialize_map_input(sub_value) for key, sub_value in value.items()})
+
+    return ('value', value)
+
+
+def _deserialize_map_input(serialized):
+    """Deserialize an input of a calculation function that was serialized by `_serialize_map_input`.
+
+    :param serialized: the serialized value
+    :return: the deserialized value
+    """
+    from aiida.orm import load_node
+
+    kind, value = serialized
+
+    if kind == 'node':
+        return load_node(value)
+
+    if kind == 'mapping':
+        return {key: _deserialize_map_input(sub_value) for key, sub_value in value.items()}
+
+    return value
+
+
+def _serialize_map_output(value):
+    """Serialize the result of a calculation function such that it can be sent to the parent interpreter.
+
+    Unstored nodes are serialized into their node type, label, description, attributes, extras and the content of their
+    repository, stored nodes by their pk.
+
+    :param value: the result of a calculation function
+    :return: the serialized value
+    """
+    from aiida.orm import Node
+
+    if isinstance(value, Node):
+        if value.is_stored:
+            return ('stored', value.pk)
+
+        base_folder = value._repository._get_base_folder().abspath  # pylint: disable=protected-access
+        objects = {}
+
+        for dirpath, _, filenames in os.walk(base_folder):
+            for filename in filenames:
+                filepath = os.path.join(dirpath, filename)
+                with open(filepath, 'rb') as handle:
+                    objects[os.path.relpath(filepath, base_folder)] = handle.read()
+
+        return ('unstored', {
+            'node_type': value.node_type,
+            'label': value.label,
+            'description': value.description,
+            'attributes': value.attributes,
+            'extras': value.extras,
+            'objects': objects,
+        })
+
+    if isinstance(value, collections.abc.Mapping):
+        return ('mapping', {key: _serialize_map_output(sub_value) for key, sub_value in value.items()})
+
+    return ('value', value)
+
+
+def _deserialize_map_output(serialized):
+    """Deserialize the result of a calculation function that was serialized by `_serialize_map_output`.
+
+    :param serialized: the serialized value
+    :return: the deserialized value, where unstored nodes are recreated as new unstored nodes
+    """
+    from aiida.orm import load_node, User
+    from aiida.orm.convert import get_orm_entity
+
+    kind, value = serialized
+
+    if kind == 'stored':
+        return load_node(value)
+
+    if kind == 'unstored':
+        backend = manager.get_manager().get_backend()
+        user = User.objects(backend).get_default()
+        backend_entity = backend.nodes.create(node_type=value['node_type'], user=user.backend_entity)
+
+        node = get_orm_entity(backend_entity)
+        node.label = value['label']
+        node.description = value['description']
+        node.reset_attributes(value['attributes'])
+        node.reset_extras(value['extras'])
+
+        with tempfile.TemporaryDirectory() as dirpath:
+            for relpath, content in value['objects'].items():
+                filepath = os.path.join(dirpath, relpath)
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                with open(filepath, 'wb') as handle:
+                    handle.write(content)
+            node.put_object_from_tree(dirpath)
+
+        return node
+
+    if kind == 'mapping':
+        return {key: _deserialize_map_output(sub_value) for key, sub_value in value.items()}
+
+    return value
+
+
 # Allow one to also use run.get_node and run.get_pk as a shortcut, without having to import the functions themselves
 run.get_node = run_get_node
 run.get_pk = run_get_pk
@@ -190,9 +190,16 @@ def process_function(node_class):
 
 
 class FunctionProcess(Process):
-    """Function process class used for turning functions into a Process"""
+    """Function process class used for turning functions into a Process
+
+    Process functions are always executed synchronously and block the event loop of their runner until they terminate,
+    which means they can neither be persisted nor respond to RPC messages while running. They therefore do not
+    subscribe to the communicator and the database writes that accompany each state transition are grouped in a single
+    transaction.
+    """
 
     _func_args = None
+    _use_communicator = False
 
     @staticmethod
     def _func(*_args, **_kwargs):
@@ -337,6 +344,7 @@ class FunctionProcess(Process):
         if kwargs.get('enable_persistence', False):
             raise RuntimeError('Cannot persist a function process')
         super().__init__(enable_persistence=False, *args, **kwargs)
+        self._function_future = None
 
     @property
     def process_class(self):
@@ -362,29 +370,33 @@ class FunctionProcess(Process):
 
         return result
 
+    @override
+    def on_entered(self, from_state):
+        """Group all database operations that are performed upon entering a new state in a single transaction."""
+        with self.node.backend.transaction():
+            super().on_entered(from_state)
+
+    @override
+    def _update_process_state_change_timestamp(self):
+        """Only update the process state change timestamp when the process terminates.
+
+        The non-terminal states of a process function are only visible for the duration of the function call, so only
+        recording the final state change avoids writing the global setting multiple times for each function call.
+        """
+        if self._state.is_terminal():
+            super()._update_process_state_change_timestamp()
+
     @override
     def _setup_db_record(self):
         """Set up the database record for the process."""
         super()._setup_db_record()
         self.node.store_source_info(self._func)
 
-    @override
-    def run(self):
-        """Run the process.
+    def get_function_arguments(self):
+        """Split the inputs of the process into the positional and keyword arguments of the wrapped function.
 
-        :rtype: :class:`aiida.engine.ExitCode`
+        :return: tuple of a list of positional arguments and a dictionary of keyword arguments
         """
-        from aiida.orm import Data
-        from .exit_code import ExitCode
-
-        # The following conditional is required for the caching to properly work. Even if the source node has a process
-        # state of `Finished` the cached process will still enter the running state. The process state will have then
-        # been overridden by the engine to `Running` so we cannot check that, but if the `exit_status` is anything other
-        # than `None`, it should mean this node was taken from the cache, so the process should not be rerun.
-        if self.node.exit_status is not None:
-            return self.node.exit_status
-
-        # Split the inputs into positional and keyword arguments
         args = [None] * len(self._func_args)
         kwargs = {}
 
@@ -402,7 +414,40 @@ class FunctionProcess(Process):
             except ValueError:
                 kwargs[name] = value
 
-        result = self._func(*args, **kwargs)
+        return args, kwargs
+
+    def set_function_future(self, future):
+        """Set a future that will resolve to the result of the wrapped function, which was executed elsewhere.
+
+        When the process is run, instead of calling the wrapped function, the result of the future is used as the
+        return value of the function. If the future resolved with an exception, it is reraised within the process.
+
+        :param future: an instance of :class:`concurrent.futures.Future`
+        """
+        self._function_future = future
+
+    @override
+    def run(self):
+        """Run the process.
+
+        :rtype: :class:`aiida.engine.ExitCode`
+        """
+        from aiida.orm import Data
+        from .exit_code import ExitCode
+
+        # The following conditional is required for the caching to properly work. Even if the source node has a process
+        # state of `Finished` the cached process will still enter the running state. The process state will have then
+        # been overridden by the engine to `Running` so we cannot check that, but if the `exit_status` is anything other
+        # than `None`, it should mean this node was taken from the cache, so the process should not be rerun.
+        if self.node.exit_status is not None:
+            return self.node.exit_status
+
+        if self._function_future is not None:
+            # The function was already executed elsewhere, so simply take its result or reraise its exception
+            result = self._function_future.result()
+        else:
+            args, kwargs = self.get_function_arguments()
+            result = self._func(*args, **kwargs)
 
         if result is None or isinstance(result, ExitCode):
             return result
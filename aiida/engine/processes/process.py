@@ -47,6 +47,9 @@ class Process(plumpy.Process):
     _node_class = orm.ProcessNode
     _spec_class = ProcessSpec
 
+    # Whether the process should subscribe to the communicator of its runner to receive RPC and broadcast messages
+    _use_communicator = True
+
     SINGLE_OUTPUT_LINKNAME = 'result'
 
     class SaveKeys(enum.Enum):
@@ -113,7 +116,7 @@ class Process(plumpy.Process):
             inputs=self.spec().inputs.serialize(inputs),
             logger=logger,
             loop=self._runner.loop,
-            communicator=self.runner.communicator)
+            communicator=self.runner.communicator if self._use_communicator else None)
 
         self._node = None
         self._parent_pid = parent_pid
@@ -336,14 +339,17 @@ class Process(plumpy.Process):
         # Update the node attributes every time we enter a new state
 
     def on_entered(self, from_state):
-        # pylint: disable=cyclic-import
-        from aiida.engine.utils import set_process_state_change_timestamp
         self.update_node_state(self._state)
         self._save_checkpoint()
-        # Update the latest process state change timestamp
-        set_process_state_change_timestamp(self)
+        self._update_process_state_change_timestamp()
         super().on_entered(from_state)
 
+    def _update_process_state_change_timestamp(self):
+        """Update the global setting that records the latest process state change timestamp."""
+        # pylint: disable=cyclic-import
+        from aiida.engine.utils import set_process_state_change_timestamp
+        set_process_state_change_timestamp(self)
+
     @override
     def on_terminated(self):
         """Called when a Process enters a terminal state."""
@@ -579,6 +585,9 @@ class Process(plumpy.Process):
     def update_outputs(self):
         """Attach new outputs to the node since the last call.
 
+        All new outputs and their links are stored within a single database transaction, such that processes with a
+        large number of outputs do not have to commit each output separately.
+
         Does nothing, if self.metadata.store_provenance is False.
         """
         if self.metadata.store_provenance is False:
@@ -588,17 +597,26 @@ class Process(plumpy.Process):
         outputs_stored = self.node.get_outgoing(link_type=(LinkType.CREATE, LinkType.RETURN)).all_link_labels()
         outputs_new = set(outputs_flat.keys()) - set(outputs_stored)
 
-        for link_label, output in outputs_flat.items():
+        if not outputs_new:
+            return
 
-            if link_label not in outputs_new:
-                continue
+        if isinstance(self.node, orm.CalculationNode):
+            link_type = LinkType.CREATE
+        elif isinstance(self.node, orm.WorkflowNode):
+            link_type = LinkType.RETURN
+        else:
+            link_type = None
 
-            if isinstance(self.node, orm.CalculationNode):
-                output.add_incoming(self.node, LinkType.CREATE, link_label)
-            elif isinstance(self.node, orm.WorkflowNode):
-                output.add_incoming(self.node, LinkType.RETURN, link_label)
+        with self.node.backend.transaction():
+            for link_label, output in outputs_flat.items():
+
+                if link_label not in outputs_new:
+                    continue
+
+                if link_type is not None:
+                    output.add_incoming(self.node, link_type, link_label)
 
-            output.store()
+                output.store(with_transaction=False)
 
     def _setup_db_record(self):
         """
@@ -68,6 +68,8 @@ class Runner:  # pylint: disable=too-many-public-methods
         self._job_manager = manager.JobManager(self._transport)
         self._persister = persister
         self._plugin_version_provider = PluginVersionProvider()
+        self._poll_callbacks = {}
+        self._poll_handle = None
 
         if communicator is not None:
             self._communicator = plumpy.wrap_communicator(communicator, self._loop)
@@ -271,7 +273,9 @@ class Runner:  # pylint: disable=too-many-public-methods
 
         This method will add a broadcast subscriber that will listen for state changes of the target process to be
         terminated. As a fail-safe, a polling-mechanism is used to check the state of the process, should the broadcast
-        message be missed by the subscriber, in order to prevent the caller to wait indefinitely.
+        message be missed by the subscriber, in order to prevent the caller to wait indefinitely. The polling is shared
+        by all processes awaited through this runner, such that their states are checked with a single query per poll
+        interval.
 
         :param pk: pk of the process
         :param callback: function to be called upon process termination
@@ -294,6 +298,7 @@ class Runner:  # pylint: disable=too-many-public-methods
             finally:
                 event.set()
                 self._communicator.remove_broadcast_subscriber(subscriber_identifier)
+                self._remove_poll_callback(node.pk, subscriber_identifier)
 
         broadcast_filter = kiwipy.BroadcastFilter(functools.partial(inline_callback, event), sender=pk)
         for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]:
@@ -301,7 +306,7 @@ class Runner:  # pylint: disable=too-many-public-methods
 
         LOGGER.info('adding subscriber for broadcasts of %d', pk)
         self._communicator.add_broadcast_subscriber(broadcast_filter, subscriber_identifier)
-        self._poll_process(node, functools.partial(inline_callback, event))
+        self._add_poll_callback(node.pk, subscriber_identifier, functools.partial(inline_callback, event))
 
     def get_process_future(self, pk):
         """Return a future for a process.
@@ -312,15 +317,53 @@ class Runner:  # pylint: disable=too-many-public-methods
         """
         return futures.ProcessFuture(pk, self._loop, self._poll_interval, self._communicator)
 
-    def _poll_process(self, node, callback):
-        """Check whether the process state of the node is terminated and call the callback or reschedule it.
+    def _add_poll_callback(self, pk, identifier, callback):
+        """Register a callback to be called by the polling mechanism once the process with the given pk is terminated.
 
-        :param node: the process node
-        :param callback: callback to be called when process is terminated
+        If no poll is currently scheduled, one is scheduled as soon as possible, such that processes that already
+        terminated before the callback was registered are detected without waiting a full poll interval.
+
+        :param pk: pk of the process
+        :param identifier: identifier of the callback, which can be used to remove it
+        :param callback: callback to be called when the process is terminated
         """
-        if node.is_terminated:
-            args = [node.__class__.__name__, node.pk]
-            LOGGER.info('%s<%d> confirmed to be terminated by backup polling mechanism', *args)
-            self._loop.call_soon(callback)
-        else:
-            self._loop.call_later(self._poll_interval, self._poll_process, node, callback)
+        self._poll_callbacks.setdefault(pk, {})[identifier] = callback
+
+        if self._poll_handle is None:
+            self._poll_handle = self._loop.call_soon(self._poll_processes)
+
+    def _remove_poll_callback(self, pk, identifier):
+        """Remove a callback that was registered through `_add_poll_callback`, if it still exists.
+
+        :param pk: pk of the process
+        :param identifier: identifier of the callback
+        """
+        callbacks = self._poll_callbacks.get(pk, {})
+        callbacks.pop(identifier, None)
+
+        if not callbacks:
+            self._poll_callbacks.pop(pk, None)
+
+    def _poll_processes(self):
+        """Check which of the awaited processes are terminated, call their callbacks and reschedule if necessary.
+
+        The process states of all awaited processes are retrieved with a single query.
+        """
+        from aiida.orm import ProcessNode, QueryBuilder
+
+        self._poll_handle = None
+
+        if not self._poll_callbacks:
+            return
+
+        terminal_states = [state.value for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]]
+        filters = {'id': {'in': list(self._poll_callbacks)}, 'attributes.process_state': {'in': terminal_states}}
+        builder = QueryBuilder().append(ProcessNode, filters=filters, project=['id'])
+
+        for [pk] in builder.iterall():
+            LOGGER.info('Process<%d> confirmed to be terminated by backup polling mechanism', pk)
+            for callback in self._poll_callbacks.pop(pk, {}).values():
+                self._loop.call_soon(callback)
+
+        if self._poll_callbacks:
+            self._poll_handle = self._loop.call_later(self._poll_interval, self._poll_processes)
@@ -16,6 +16,8 @@ NO_DEFAULT = ()
 DEFAULT_DAEMON_WORKERS = 1
 DEFAULT_DAEMON_TIMEOUT = 20  # Default timeout in seconds for circus client calls
 DEFAULT_DAEMON_WORKER_PROCESS_SLOTS = 200
+DEFAULT_DAEMON_WORKER_PROCESS_SLOTS_MIN = 20
+DEFAULT_DAEMON_WORKER_PROCESS_SLOTS_MAX = 1000
 VALID_LOG_LEVELS = ['CRITICAL', 'ERROR', 'WARNING', 'REPORT', 'INFO', 'DEBUG']
 
 Option = collections.namedtuple(
@@ -55,6 +57,59 @@ CONFIG_OPTIONS = {
         'description': 'The maximum number of concurrent process tasks that each daemon worker can handle',
         'global_only': False,
     },
+    'daemon.worker_process_slots_adaptive': {
+        'key': 'daemon_worker_process_slots_adaptive',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Whether daemon workers adapt their number of process slots to their load. The initial number '
+        'of slots is `daemon.worker_process_slots`, which is then varied between `daemon.worker_process_slots_min` and '
+        '`daemon.worker_process_slots_max`',
+        'global_only': False,
+    },
+    'daemon.worker_process_slots_min': {
+        'key': 'daemon_worker_process_slots_min',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': DEFAULT_DAEMON_WORKER_PROCESS_SLOTS_MIN,
+        'description': 'The minimum number of process slots of a daemon worker with adaptive process slots',
+        'global_only': False,
+    },
+    'daemon.worker_process_slots_max': {
+        'key': 'daemon_worker_process_slots_max',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': DEFAULT_DAEMON_WORKER_PROCESS_SLOTS_MAX,
+        'description': 'The maximum number of process slots of a daemon worker with adaptive process slots',
+        'global_only': False,
+    },
+    'daemon.worker_max_loop_lag': {
+        'key': 'daemon_worker_max_loop_lag',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 1000,
+        'description': 'The event loop lag in milliseconds above which a daemon worker with adaptive process slots is '
+        'considered overloaded',
+        'global_only': False,
+    },
+    'daemon.worker_max_cpu_percent': {
+        'key': 'daemon_worker_max_cpu_percent',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 90,
+        'description': 'The CPU usage in percent above which a daemon worker with adaptive process slots is '
+        'considered overloaded',
+        'global_only': False,
+    },
+    'daemon.worker_max_memory_percent': {
+        'key': 'daemon_worker_max_memory_percent',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 90,
+        'description': 'The memory usage of the machine in percent above which a daemon worker with adaptive process '
+        'slots is considered overloaded',
+        'global_only': False,
+    },
     'db.batch_size': {
         'key': 'db_batch_size',
         'valid_type': 'int',
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Optional indexes of the database that are not created by the schema migrations.
+
+The attributes and extras of nodes can be indexed with GIN indexes, which serve the `@>` containment expressions that
+the query builder emits for equality and `contains` filters on their keys. These indexes can be large and slow down the
+storing of nodes, which is why they are not part of the schema and are only created on request.
+"""
+
+__all__ = ('GIN_INDEXES', 'get_gin_indexes', 'create_gin_indexes', 'drop_gin_indexes')
+
+# Name of each optional GIN index mapped onto the table and the JSONB column that it indexes
+GIN_INDEXES = {
+    'ix_db_dbnode_attributes_gin': ('db_dbnode', 'attributes'),
+    'ix_db_dbnode_extras_gin': ('db_dbnode', 'extras'),
+}
+
+
+def get_gin_indexes(backend):
+    """Return the names of the optional GIN indexes that exist in the database.
+
+    :param backend: the database backend
+    :return: set of index names
+    """
+    names = ', '.join(f"'{name}'" for name in GIN_INDEXES)
+    results = backend.execute_raw(f'SELECT indexname FROM pg_indexes WHERE indexname IN ({names});')
+    return {row[0] for row in results or []}
+
+
+def create_gin_indexes(backend):
+    """Create the optional GIN indexes on the attributes and extras of nodes, if they do not exist yet.
+
+    The indexes use the `jsonb_path_ops` operator class, which only supports the containment operator but results in
+    considerably smaller and faster indexes than the default operator class.
+
+    :param backend: the database backend
+    """
+    for name, (table, column) in GIN_INDEXES.items():
+        backend.execute_raw(f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({column} jsonb_path_ops);')
+
+
+def drop_gin_indexes(backend):
+    """Drop the optional GIN indexes on the attributes and extras of nodes, if they exist.
+
+    :param backend: the database backend
+    """
+    for name in GIN_INDEXES:
+        backend.execute_raw(f'DROP INDEX IF EXISTS {name};')
@@ -9,6 +9,7 @@
 ###########################################################################
 # pylint: disable=cyclic-import
 """Components to communicate tasks to RabbitMQ."""
+import asyncio
 import collections
 import logging
 
@@ -18,7 +19,10 @@ import plumpy
 
 from aiida.common.extendeddicts import AttributeDict
 
-__all__ = ('RemoteException', 'CommunicationTimeout', 'DeliveryFailed', 'ProcessLauncher', 'BROKER_DEFAULTS')
+__all__ = (
+    'RemoteException', 'CommunicationTimeout', 'DeliveryFailed', 'ProcessLauncher', 'AdaptiveProcessSlots',
+    'BROKER_DEFAULTS'
+)
 
 # The following statement enables support for RabbitMQ 3.5 because without it, connections established by `aiormq` will
 # fail because the interpretation of the types of integers passed in connection parameters has changed after that
@@ -137,6 +141,18 @@ class ProcessLauncher(plumpy.ProcessLauncher):
     that if it is already marked as terminated, it is not continued but the future is reconstructed and returned
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._num_active_tasks = 0
+
+    @property
+    def num_active_tasks(self):
+        """Return the number of process tasks that are currently being continued by this launcher.
+
+        :return: the number of active tasks
+        """
+        return self._num_active_tasks
+
     @staticmethod
     def handle_continue_exception(node, exception, message):
         """Handle exception raised in `_continue` call.
@@ -202,6 +218,8 @@ class ProcessLauncher(plumpy.ProcessLauncher):
 
             return future.result()
 
+        self._num_active_tasks += 1
+
         try:
             result = await super()._continue(communicator, pid, nowait, tag)
         except ImportError as exception:
@@ -212,6 +230,8 @@ class ProcessLauncher(plumpy.ProcessLauncher):
             message = 'failed to recreate the process instance in order to continue it.'
             self.handle_continue_exception(node, exception, message)
             raise
+        finally:
+            self._num_active_tasks -= 1
 
         # Ensure that the result is serialized such that communication thread won't have to do database operations
         try:
@@ -221,3 +241,194 @@ class ProcessLauncher(plumpy.ProcessLauncher):
             raise
 
         return serialized
+
+
+class AdaptiveProcessSlots:
+    """Adapt the number of process tasks a daemon worker prefetches from RabbitMQ to the actual load of the worker.
+
+    Every ``interval`` seconds, the lag of the event loop, the CPU usage of the worker and the memory usage of the
+    machine are measured. If any of these exceeds its threshold, the worker is considered overloaded and the prefetch
+    count is lowered, such that no new tasks are taken until the load decreases. If the worker is not overloaded but
+    nearly all of its slots are in use, the prefetch count is increased. The prefetch count always remains within the
+    configured bounds. Note that lowering the prefetch count never releases tasks that were already accepted.
+    """
+
+    INCREASE_THRESHOLD = 0.9  # Fraction of used slots above which the number of slots is increased
+    STEP_FRACTION = 0.1  # Fraction of the current number of slots by which the number of slots is increased
+
+    def __init__(
+        self,
+        communicator,
+        launcher,
+        loop,
+        initial,
+        minimum,
+        maximum,
+        max_loop_lag=1.0,
+        max_cpu_percent=90,
+        max_memory_percent=90,
+        interval=10
+    ):
+        """Construct a new instance.
+
+        :param communicator: the communicator whose task prefetch count to adapt
+        :type communicator: :class:`~kiwipy.rmq.RmqThreadCommunicator`
+        :param launcher: the process launcher that is subscribed to the task queue of the communicator
+        :type launcher: :class:`~aiida.manage.external.rmq.ProcessLauncher`
+        :param loop: the event loop of the daemon runner
+        :param initial: the initial number of slots
+        :param minimum: the minimum number of slots
+        :param maximum: the maximum number of slots
+        :param max_loop_lag: the maximum lag of the event loop in seconds before the worker is considered overloaded
+        :param max_cpu_percent: the maximum CPU usage of the worker process before it is considered overloaded
+        :param max_memory_percent: the maximum memory usage of the machine before the worker is considered overloaded
+        :param interval: the interval in seconds between two load measurements
+        """
+        # pylint: disable=too-many-arguments
+        if minimum < 1 or minimum > maximum:
+            raise ValueError(f'invalid bounds for the number of slots: minimum {minimum}, maximum {maximum}')
+
+        self._communicator = communicator
+        self._launcher = launcher
+        self._loop = loop
+        self._minimum = minimum
+        self._maximum = maximum
+        self._slots = min(max(initial, minimum), maximum)
+        self._max_loop_lag = max_loop_lag
+        self._max_cpu_percent = max_cpu_percent
+        self._max_memory_percent = max_memory_percent
+        self._interval = interval
+        self._task = None
+
+    @property
+    def slots(self):
+        """Return the current number of slots, i.e. the task prefetch count of the communicator.
+
+        :return: the number of slots
+        """
+        return self._slots
+
+    def start(self):
+        """Start periodically measuring the load and adapting the number of slots."""
+        if self._task is None:
+            self._task = self._loop.create_task(self._monitor())
+            self._loop.call_soon(self._schedule_prefetch_count)
+
+    def stop(self):
+        """Stop adapting the number of slots."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def is_overloaded(self, loop_lag, cpu_percent, memory_percent):
+        """Return whether the worker is overloaded given the measured load.
+
+        :param loop_lag: the lag of the event loop in seconds
+        :param cpu_percent: the CPU usage of the worker process in percent
+        :param memory_percent: the memory usage of the machine in percent
+        :return: True if any of the measurements exceeds its threshold, False otherwise
+        """
+        return (
+            loop_lag > self._max_loop_lag or cpu_percent > self._max_cpu_percent or
+            memory_percent > self._max_memory_percent
+        )
+
+    def compute_slots(self, overloaded, num_active_tasks):
+        """Return the new number of slots given the load and the number of active tasks.
+
+        :param overloaded: whether the worker is currently overloaded
+        :param num_active_tasks: the number of process tasks that are currently active in the worker
+        :return: the new number of slots, which is always within the configured bounds
+        """
+        step = max(1, int(self._slots * self.STEP_FRACTION))
+
+        if overloaded:
+            slots = min(num_active_tasks, self._slots - step)
+        elif num_active_tasks >= self._slots * self.INCREASE_THRESHOLD:
+            slots = self._slots + step
+        else:
+            slots = self._slots
+
+        return min(max(slots, self._minimum), self._maximum)
+
+    async def _monitor(self):
+        """Periodically measure the load of the worker and adapt the number of slots accordingly."""
+        import psutil
+
+        process = psutil.Process()
+        process.cpu_percent()  # The first call always returns zero and merely sets the reference point
+
+        while True:
+            start = self._loop.time()
+            await asyncio.sleep(self._interval)
+            loop_lag = self._loop.time() - start - self._interval
+
+            try:
+                overloaded = self.is_overloaded(loop_lag, process.cpu_percent(), psutil.virtual_memory().percent)
+                slots = self.compute_slots(overloaded, self._launcher.num_active_tasks)
+
+                if slots != self._slots:
+                    LOGGER.info('changing the number of process slots from %d to %d', self._slots, slots)
+                    self._slots = slots
+
+                # The prefetch count is also set if it did not change, since a new channel after a reconnect of the
+                # communicator starts with the prefetch count that the communicator was created with
+                await self._set_prefetch_count(self._slots)
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception('failed to adapt the number of process slots')
+
+    def _schedule_prefetch_count(self):
+        """Schedule setting the prefetch count to the current number of slots."""
+        self._loop.create_task(self._set_prefetch_count(self._slots))
+
+    async def _set_prefetch_count(self, prefetch_count):
+        """Set the prefetch count of the task queue of the communicator.
+
+        The communicator runs its own event loop in a separate thread, so the coroutine is scheduled on that loop. If
+        the channel of the task queue cannot be accessed with the installed version of ``kiwipy``, adapting the slots is
+        stopped and the number of slots remains the one the communicator was created with.
+
+        :param prefetch_count: the new prefetch count
+        """
+        coroutine = _set_task_queue_prefetch_count(self._communicator, prefetch_count)
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._communicator.loop())
+
+        if not await asyncio.wrap_future(future, loop=self._loop):
+            LOGGER.warning(
+                'the installed version of kiwipy does not expose the channel of the task queue: the number of process '
+                'slots is fixed to the value of the `daemon.worker_process_slots` option'
+            )
+            self.stop()
+
+
+async def _set_task_queue_prefetch_count(communicator, prefetch_count):
+    """Set the prefetch count of the default task queue of a thread communicator with a QoS request on its channel.
+
+    ``kiwipy`` does not expose the channel of the task queue, so this looks up the attributes that lead to it, which is
+    the only place where these are accessed. The state of ``kiwipy`` itself is not modified.
+
+    :param communicator: the communicator whose task prefetch count to set
+    :type communicator: :class:`~kiwipy.rmq.RmqThreadCommunicator`
+    :param prefetch_count: the new prefetch count
+    :return: False if the installed version of ``kiwipy`` does not expose the channel of the task queue, True otherwise
+    """
+    rmq_communicator = getattr(communicator, '_communicator', None)
+
+    if not hasattr(rmq_communicator, 'get_default_task_queue'):
+        return False
+
+    task_queue = await rmq_communicator.get_default_task_queue()
+    subscriber = getattr(task_queue, '_subscriber', None)
+
+    if not hasattr(subscriber, 'channel'):
+        return False
+
+    channel = subscriber.channel()
+
+    # The channel is not set while the communicator is reconnecting, in which case the next call will set the count
+    if channel is not None:
+        await channel.set_qos(prefetch_count=prefetch_count)
+
+    return True
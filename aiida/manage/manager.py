@@ -312,10 +312,36 @@ class Manager:
 
         runner.communicator.add_task_subscriber(task_receiver)
 
+        config = self.get_config()
+        profile = self.get_profile()
+
+        self.stop_process_slots()
+
+        if config.get_option('daemon.worker_process_slots_adaptive', profile.name):
+            self._process_slots = rmq.AdaptiveProcessSlots(
+                communicator=self.get_communicator(),
+                launcher=task_receiver,
+                loop=runner_loop,
+                initial=config.get_option('daemon.worker_process_slots', profile.name),
+                minimum=config.get_option('daemon.worker_process_slots_min', profile.name),
+                maximum=config.get_option('daemon.worker_process_slots_max', profile.name),
+                max_loop_lag=config.get_option('daemon.worker_max_loop_lag', profile.name) / 1000,
+                max_cpu_percent=config.get_option('daemon.worker_max_cpu_percent', profile.name),
+                max_memory_percent=config.get_option('daemon.worker_max_memory_percent', profile.name),
+            )
+            self._process_slots.start()
+
         return runner
 
+    def stop_process_slots(self):
+        """Stop adapting the number of process slots of the daemon runner, if this was started."""
+        if self._process_slots is not None:
+            self._process_slots.stop()
+            self._process_slots = None
+
     def close(self):
         """Reset the global settings entirely and release any global objects."""
+        self.stop_process_slots()
         if self._communicator is not None:
             self._communicator.close()
         if self._runner is not None:
@@ -342,6 +368,7 @@ class Manager:
         self._process_controller = None  # type: plumpy.RemoteProcessThreadController
         self._persister = None  # type: aiida.engine.persistence.AiiDAPersister
         self._runner = None  # type: aiida.engine.runners.Runner
+        self._process_slots = None  # type: aiida.manage.external.rmq.AdaptiveProcessSlots
 
 
 def get_manager():
@@ -126,6 +126,11 @@ class DjangoBackend(SqlBackend[models.Model]):
         """
         with self.cursor() as cursor:
             cursor.execute(query)
+
+            # Statements that do not return rows, such as data definition statements, do not have a description
+            if cursor.description is None:
+                return None
+
             results = cursor.fetchall()
 
         return results
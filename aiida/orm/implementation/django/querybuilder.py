@@ -227,7 +227,13 @@ class DjangoQueryBuilder(BackendQueryBuilder):
         if expr is None:
             if is_attribute:
                 expr = self.get_filter_expr_from_attributes(
-                    operator, value, attr_key, column=column, column_name=column_name, alias=alias
+                    operator,
+                    value,
+                    attr_key,
+                    column=column,
+                    column_name=column_name,
+                    alias=alias,
+                    negation=negation
                 )
             else:
                 if column is None:
@@ -246,7 +252,9 @@ class DjangoQueryBuilder(BackendQueryBuilder):
         """
         return expansions
 
-    def get_filter_expr_from_attributes(self, operator, value, attr_key, column=None, column_name=None, alias=None):
+    def get_filter_expr_from_attributes(
+        self, operator, value, attr_key, column=None, column_name=None, alias=None, negation=False
+    ):
         # Too many everything!
         # pylint: disable=too-many-branches, too-many-arguments, too-many-statements
 
@@ -277,10 +285,21 @@ class DjangoQueryBuilder(BackendQueryBuilder):
         if column is None:
             column = self.get_column(column_name, alias)
 
+        expr = self.get_filter_expr_from_promoted_key(
+            operator, value, attr_key, column, column_name, alias, negation=negation
+        )
+        if expr is not None:
+            return expr
+
         database_entity = column[tuple(attr_key)]
         if operator == '==':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
             expr = case([(type_filter, casted_entity == value)], else_=False)
+            if isinstance(value, (bool, int, float, str)):
+                # A scalar equal to the value also contains it, so the containment, which can use an index, is implied
+                containment = self.get_filter_expr_containment(value, attr_key, column)
+                if containment is not None:
+                    expr = and_(containment, expr)
         elif operator == '>':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
             expr = case([(type_filter, casted_entity > value)], else_=False)
@@ -310,7 +329,14 @@ class DjangoQueryBuilder(BackendQueryBuilder):
             type_filter, casted_entity = cast_according_to_type(database_entity, value[0])
             expr = case([(type_filter, casted_entity.in_(value))], else_=False)
         elif operator == 'contains':
-            expr = database_entity.cast(JSONB).contains(value)
+            expr = None
+            # Only for containers is the containment of nested objects the same as the containment at the path. It is
+            # not used for a negated filter, since it is false instead of null for a missing key, and the negation would
+            # then match the entities that do not have the key at all.
+            if isinstance(value, (dict, list)) and not negation:
+                expr = self.get_filter_expr_containment(value, attr_key, column)
+            if expr is None:
+                expr = database_entity.cast(JSONB).contains(value)
         elif operator == 'has_key':
             expr = database_entity.cast(JSONB).has_key(value)  # noqa
         elif operator == 'of_length':
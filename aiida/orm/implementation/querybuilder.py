@@ -16,11 +16,14 @@ not go through SqlAlchemy, this class will have to be refactored. The SqlAlchemy
 likely be moved to a `SqlAlchemyBasedQueryBuilder` class and restore this abstract class to being a pure agnostic one.
 """
 import abc
+import itertools
 import uuid
 
 # pylint: disable=no-name-in-module, import-error
 from sqlalchemy_utils.types.choice import Choice
-from sqlalchemy.types import Integer, Float, Boolean, DateTime
+from sqlalchemy import and_, func as sa_func
+from sqlalchemy.sql.expression import cast as type_cast
+from sqlalchemy.types import Integer, Float, Boolean, DateTime, Text
 from sqlalchemy.dialects.postgresql import JSONB
 
 from aiida.common import exceptions
@@ -38,6 +41,19 @@ class BackendQueryBuilder:
     outer_to_inner_schema = None
     inner_to_outer_schema = None
 
+    # Keys in the attributes and extras of nodes whose text value is indexed with an expression index, which is created
+    # by the migration that promotes these keys, mapped onto the JSON type of their values.
+    PROMOTED_NODE_KEYS = {
+        'attributes': {
+            'process_state': 'string',
+            'exit_status': 'number',
+            'sealed': 'boolean',
+        },
+        'extras': {
+            '_aiida_hash': 'string',
+        },
+    }
+
     def __init__(self, backend):
         """
         :param backend: the backend
@@ -127,7 +143,9 @@ class BackendQueryBuilder:
         """
 
     @abc.abstractclassmethod
-    def get_filter_expr_from_attributes(cls, operator, value, attr_key, column=None, column_name=None, alias=None):  # pylint: disable=too-many-arguments
+    def get_filter_expr_from_attributes(
+        cls, operator, value, attr_key, column=None, column_name=None, alias=None, negation=False
+    ):  # pylint: disable=too-many-arguments
         """
         Returns an valid SQLAlchemy expression.
 
@@ -140,6 +158,7 @@ class BackendQueryBuilder:
         :param column: Optional, an instance of sqlalchemy.orm.attributes.InstrumentedAttribute or
         :param str column_name: The name of the column, and the backend should get the InstrumentedAttribute.
         :param alias: The aliased class.
+        :param negation: Whether the expression is going to be negated.
 
         :returns: An instance of sqlalchemy.sql.elements.BinaryExpression
         """
@@ -223,6 +242,91 @@ class BackendQueryBuilder:
             raise InputValidationError(f'Unknown operator {operator} for filters on columns')
         return expr
 
+    def get_filter_expr_from_promoted_key(self, operator, value, attr_key, column, column_name, alias, negation=False):
+        """
+        Return a filter expression on a promoted key of the attributes or extras of nodes that can use its index.
+
+        The expression compares the text value of the key, which is what is indexed, and checks the JSON type of the
+        value, such that it matches the same rows as the generic expression of `get_filter_expr_from_attributes`. The
+        expression is NULL for nodes that do not have the key, so it cannot be used for negated filters, as these should
+        match those nodes.
+
+        :param operator: The operator provided by the user ('==',  '>', ...)
+        :param value: The value to compare with
+        :param attr_key: The path to the attribute as a list of keys.
+        :param column: an instance of sqlalchemy.orm.attributes.InstrumentedAttribute
+        :param str column_name: The name of the column, i.e. 'attributes' or 'extras'
+        :param alias: The aliased class.
+        :param bool negation: Whether the expression will be negated.
+
+        :returns: An instance of sqlalchemy.sql.elements.BinaryExpression or None if the filter cannot be applied on a
+            promoted key, in which case the generic expression should be used.
+        """
+        if negation or alias is None or len(attr_key) != 1 or self.get_table_name(alias) != 'db_dbnode':
+            return None
+
+        json_type = self.PROMOTED_NODE_KEYS.get(column_name, {}).get(attr_key[0], None)
+
+        if json_type is None:
+            return None
+
+        if operator == '==':
+            values = [value]
+        elif operator == 'in' and isinstance(value, (list, tuple)):
+            values = list(value)
+        else:
+            return None
+
+        def get_json_type(value):
+            """Return the JSON type of a value whose text representation is the same in Python and PostgreSQL."""
+            if isinstance(value, bool):
+                return 'boolean'
+            if isinstance(value, int):
+                return 'number'
+            if isinstance(value, str):
+                return 'string'
+            return None
+
+        if not values or any(get_json_type(value) != json_type for value in values):
+            return None
+
+        # Non-string values are cast by the database, which results in the same text as the JSON representation
+        values = [value if isinstance(value, str) else type_cast(value, Text) for value in values]
+        entity = column[attr_key[0]].astext
+
+        if operator == '==':
+            expr = entity == values[0]
+        else:
+            expr = entity.in_(values)
+
+        return and_(expr, sa_func.jsonb_typeof(column[attr_key[0]]) == json_type)
+
+    @staticmethod
+    def get_filter_expr_containment(value, attr_key, column):
+        """
+        Return an expression checking that the value at the given path of a JSONB column contains the given value.
+
+        Rather than extracting the value at the path, the containment is expressed on the column as a whole, i.e. as
+        `column @> {key: {...: value}}`, which can be served by a GIN index on the column. The nested object is built in
+        the database from the value, such that the value remains a single bound parameter of the query.
+
+        :param value: The value to check for, which has to be serializable to JSON
+        :param attr_key: The path to the attribute as a list of keys.
+        :param column: an instance of sqlalchemy.orm.attributes.InstrumentedAttribute of a JSONB column
+
+        :returns: An instance of sqlalchemy.sql.elements.BinaryExpression or None if the path contains a key that may
+            index an array, which cannot be expressed as a containment of nested objects.
+        """
+        if any(key.lstrip('-').isdigit() for key in attr_key):
+            return None
+
+        contained = type_cast(value, JSONB)
+
+        for key in reversed(attr_key):
+            contained = sa_func.jsonb_build_object(key, contained)
+
+        return column.contains(contained)
+
     def get_projectable_attribute(self, alias, column_name, attrpath, cast=None, **kwargs):
         """
         :returns: An attribute store in a JSON field of the give column
@@ -272,12 +376,17 @@ class BackendQueryBuilder:
         """
         :param int batch_size: Number of rows to yield per step
 
-        Yields *count* rows at a time
+        Yields *count* rows at a time. The rows are streamed through a server-side (named) cursor, such that at most
+        *count* rows are held in memory by the client at any time, instead of the full result set being transferred
+        when the query is executed. Note that a server-side cursor does not survive the end of the transaction, so the
+        session should not be committed while iterating over the results.
 
         :returns: a generator
         """
         try:
-            return query.yield_per(batch_size)
+            if batch_size is None:
+                return query.yield_per(batch_size)
+            return query.execution_options(stream_results=True, max_row_buffer=batch_size).yield_per(batch_size)
         except Exception:
             self.get_session().close()
             raise
@@ -312,7 +421,7 @@ class BackendQueryBuilder:
             if not tag_to_index_dict:
                 raise Exception(f'Got an empty dictionary: {tag_to_index_dict}')
 
-            results = query.yield_per(batch_size)
+            results = self.yield_per(query, batch_size)
 
             if len(tag_to_index_dict) == 1:
                 # Sqlalchemy, for some strange reason, does not return a list of lsits
@@ -343,7 +452,7 @@ class BackendQueryBuilder:
             if not nr_items:
                 raise ValueError('Got an empty dictionary')
 
-            results = query.yield_per(batch_size)
+            results = self.yield_per(query, batch_size)
             if nr_items > 1:
                 for this_result in results:
                     yield {
@@ -383,6 +492,38 @@ class BackendQueryBuilder:
             self.get_session().close()
             raise
 
+    def itercolumns(self, query, batch_size, tag_to_index_dict):
+        """
+        Iterate over the results of the query in batches of rows, transposed into columns.
+
+        Contrary to `iterall`, the values are returned as they are returned by the ORM, i.e. they are not converted
+        by `get_aiida_res`, such that the caller can decide for each column whether a conversion is needed.
+
+        :return: An iterator over lists with, for each projection, a tuple with the values of a batch of rows.
+        """
+        try:
+            if not tag_to_index_dict:
+                raise ValueError('Got an empty dictionary')
+
+            results = iter(self.yield_per(query, batch_size))
+
+            # Sqlalchemy does not return a row, but the instance itself, if the only projection is an ormclass
+            unpack_rows = list(tag_to_index_dict.values()) != ['*']
+
+            while True:
+                batch = list(itertools.islice(results, batch_size))
+
+                if not batch:
+                    break
+
+                if unpack_rows:
+                    yield list(zip(*batch))
+                else:
+                    yield [tuple(batch)]
+        except Exception:
+            self.get_session().close()
+            raise
+
     @abc.abstractstaticmethod
     def get_table_name(aliased_class):
         """Returns the table name given an Aliased class."""
@@ -168,7 +168,10 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
             raise exceptions.ModificationNotAllowed('source node has to be stored when adding a link from it')
 
         self._add_link(source, link_type, link_label)
-        session.commit()
+
+        # If the caller opened a transaction, the link will be committed together with the rest of the transaction
+        if not session.transaction.nested:
+            session.commit()
 
     def _add_link(self, source, link_type, link_label):
         """Add a link of the given type from a given node to ourself.
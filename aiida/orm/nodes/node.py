@@ -155,6 +155,9 @@ class Node(Entity, EntityAttributesMixin, EntityExtrasMixin, metaclass=AbstractN
 
     # These are to be initialized in the `initialization` method
     _incoming_cache = None
+    # Stored links loaded in bulk by `aiida.orm.utils.links.prefetch_links`, per direction a tuple of the link types
+    # that were loaded, where an empty tuple means all link types, and the list of link triples
+    _prefetched_links = None
     _repository = None
 
     @classmethod
@@ -730,6 +733,9 @@ class Node(Entity, EntityAttributesMixin, EntityExtrasMixin, metaclass=AbstractN
 
         if self.is_stored and source.is_stored:
             self.backend_entity.add_incoming(source.backend_entity, link_type, link_label)
+            # The prefetched links of both nodes no longer reflect the stored links
+            self._prefetched_links = None
+            source._prefetched_links = None  # pylint: disable=protected-access
         else:
             self._add_incoming_cache(source, link_type, link_label)
 
@@ -752,8 +758,9 @@ class Node(Entity, EntityAttributesMixin, EntityExtrasMixin, metaclass=AbstractN
 
         validate_link(source, self, link_type, link_label)
 
-        # Check if the proposed link would introduce a cycle in the graph following ancestor/descendant rules
-        if link_type in [LinkType.CREATE, LinkType.INPUT_CALC, LinkType.INPUT_WORK]:
+        # Check if the proposed link would introduce a cycle in the graph following ancestor/descendant rules. An
+        # unstored node cannot have any descendants yet, so in that case there is no need to query the database.
+        if self.is_stored and link_type in [LinkType.CREATE, LinkType.INPUT_CALC, LinkType.INPUT_WORK]:
             builder = QueryBuilder().append(
                 Node, filters={'id': self.pk}, tag='parent').append(
                 Node, filters={'id': source.pk}, tag='child', with_ancestors='parent')  # yapf:disable
@@ -815,6 +822,23 @@ class Node(Entity, EntityAttributesMixin, EntityExtrasMixin, metaclass=AbstractN
             raise TypeError(f'link_type should be a LinkType or tuple of LinkType: got {link_type}')
 
         node_class = node_class or Node
+
+        prefetched = self._get_prefetched_link_triples(link_direction, link_type)
+
+        if prefetched is not None:
+            link_triples = []
+            for link_triple in prefetched:
+                if not isinstance(link_triple.node, node_class):
+                    continue
+                if link_type and link_triple.link_type not in link_type:
+                    continue
+                if link_label_filter and not sql_string_match(string=link_triple.link_label, pattern=link_label_filter):
+                    continue
+                if only_uuid:
+                    link_triple = LinkTriple(link_triple.node.uuid, link_triple.link_type, link_triple.link_label)
+                link_triples.append(link_triple)
+            return link_triples
+
         node_filters = {'id': {'==': self.id}}
         edge_filters = {}
 
@@ -847,6 +871,37 @@ class Node(Entity, EntityAttributesMixin, EntityExtrasMixin, metaclass=AbstractN
 
         return [LinkTriple(entry[0], LinkType(entry[1]), entry[2]) for entry in builder.all()]
 
+    def _set_prefetched_link_triples(self, link_direction, link_type, link_triples):
+        """Set the stored link triples of the given direction and link types that were loaded in bulk.
+
+        .. note: this should not be called directly but only by `aiida.orm.utils.links.prefetch_links`.
+
+        :param link_direction: `incoming` or `outgoing`
+        :param link_type: tuple of the link types that were loaded, where an empty tuple means all link types
+        :param link_triples: the list of link triples
+        """
+        if self._prefetched_links is None:
+            self._prefetched_links = {}
+
+        self._prefetched_links[link_direction] = (link_type, link_triples)
+
+    def _get_prefetched_link_triples(self, link_direction, link_type):
+        """Return the prefetched link triples of the given direction if they include all links of the link types.
+
+        :param link_direction: `incoming` or `outgoing`
+        :param link_type: tuple of link types, where an empty tuple means all link types
+        :return: the list of prefetched link triples or None if the links were not prefetched
+        """
+        if not self._prefetched_links or link_direction not in self._prefetched_links:
+            return None
+
+        prefetched_link_type, link_triples = self._prefetched_links[link_direction]
+
+        if prefetched_link_type and (not link_type or not set(link_type).issubset(prefetched_link_type)):
+            return None
+
+        return link_triples
+
     def get_incoming(self, node_class=None, link_type=(), link_label_filter=None, only_uuid=False):
         """Return a list of link triples that are (directly) incoming into this node.
 
@@ -1002,6 +1057,10 @@ class Node(Entity, EntityAttributesMixin, EntityExtrasMixin, metaclass=AbstractN
             self._repository.restore()
             raise
 
+        # The prefetched outgoing links of the sources of the cached incoming links no longer reflect the stored links
+        for link_triple in links:
+            link_triple.node._prefetched_links = None  # pylint: disable=protected-access
+
         self._incoming_cache = list()
         self._backend_entity.set_extra(_HASH_EXTRA_KEY, self.get_hash())
 
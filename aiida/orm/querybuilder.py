@@ -20,12 +20,15 @@ An instance of one of the implementation classes becomes a member of the :func:`
 when instantiated by the user.
 """
 from inspect import isclass as inspect_isclass
+import collections
 import copy
 import logging
+import threading
+import uuid
 import warnings
 
-from sqlalchemy import and_, or_, not_, func as sa_func, select, join
-from sqlalchemy.types import Integer
+from sqlalchemy import and_, or_, not_, func as sa_func, select, join, literal, tuple_
+from sqlalchemy.types import BigInteger, Float, Integer
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import cast as type_cast
 from sqlalchemy.dialects.postgresql import array
@@ -312,6 +315,223 @@ def get_group_type_filter(classifiers, subclassing):
     return filters
 
 
+class QueryTemplate:
+    """A built query whose filter values can be substituted, to be reused by query builders of the same shape.
+
+    The shape of a query builder is its queryhelp where the values of the filters, that are only passed on to the
+    database as bound parameters, are replaced by their type. Two query builders with the same shape therefore result in
+    the same SQL query, only with different bound parameters, which allows to build the query only once.
+    """
+
+    # Operators whose scalar values are passed as is to the database as bound parameters, without affecting the query
+    _PARAMETER_OPERATORS = ('==', '>', '<', '>=', '<=', '=>', '=<', 'like', 'ilike', 'in')
+    _PARAMETER_TYPES = (int, float, str)
+
+    def __init__(self, query, parameter_keys, state):
+        """Construct a new template.
+
+        :param query: the query built with unique sentinel values for its parameters
+        :param parameter_keys: for each parameter, the keys of the bound parameters in the query that hold its value
+        :param state: dictionary with the attributes of the query builder that were set when building the query
+        """
+        self.query = query
+        self.parameter_keys = parameter_keys
+        self.state = state
+
+    @classmethod
+    def map_filters(cls, filters, func):
+        """Return a copy of the filters where every value that is a bound parameter is replaced by `func(value)`.
+
+        The filters are traversed in a deterministic order, which does not depend on the order in which they were added,
+        such that `func` is called in the same order for all query builders of the same shape.
+
+        :param filters: the filters of a query builder, i.e. a dictionary of filter specifications per tag
+        :param func: callable that is called with each parameter value and returns its replacement
+        :return: the mapped filters
+        """
+        return {tag: cls._map_filter_spec(filter_spec, func) for tag, filter_spec in sorted(filters.items())}
+
+    @classmethod
+    def _map_filter_spec(cls, filter_spec, func):
+        """Map the parameters of a filter specification as it is interpreted by `QueryBuilder._build_filters`."""
+        mapped = {}
+
+        for path_spec, filter_operation_dict in sorted(filter_spec.items()):
+            if path_spec in ('and', 'or', '~or', '~and', '!and', '!or'):
+                mapped[path_spec] = [cls._map_filter_spec(sub_spec, func) for sub_spec in filter_operation_dict]
+            elif isinstance(filter_operation_dict, dict):
+                mapped[path_spec] = cls._map_operations(filter_operation_dict, func)
+            else:
+                mapped[path_spec] = cls._map_operations({'==': filter_operation_dict}, func)
+
+        return mapped
+
+    @classmethod
+    def _map_operations(cls, operations, func):
+        """Map the parameters of a dictionary of operators and values as interpreted by `get_filter_expr`."""
+        mapped = {}
+
+        for operator, value in sorted(operations.items()):
+            base_operator = operator.lstrip('~!')
+            if base_operator in ('and', 'or') and isinstance(value, (list, tuple)):
+                mapped[operator] = [cls._map_operations(sub_operations, func) for sub_operations in value]
+            elif base_operator == 'in' and isinstance(value, (list, tuple)):
+                mapped[operator] = [cls._map_value(entry, func) for entry in value]
+            elif base_operator in cls._PARAMETER_OPERATORS:
+                mapped[operator] = cls._map_value(value, func)
+            else:
+                mapped[operator] = value
+
+        return mapped
+
+    @classmethod
+    def _map_value(cls, value, func):
+        """Map a single value if it is a parameter."""
+        # Note that the exact type is checked, such that booleans, which affect the query, are not parameters
+        if type(value) in cls._PARAMETER_TYPES:  # pylint: disable=unidiomatic-typecheck
+            return func(value)
+        return value
+
+    @classmethod
+    def map_after(cls, after, func):
+        """Return a copy of the keyset pagination values where every value that is a parameter is replaced.
+
+        :param after: the values of the ordering keys of the last row of the previous page, or None
+        :param func: callable that is called with each parameter value and returns its replacement
+        :return: the mapped values
+        """
+        if after is None:
+            return None
+        return [cls._map_value(value, func) for value in after]
+
+    @classmethod
+    def get_parameters(cls, filters, after=None):
+        """Return the shape of the filters and keyset pagination values and the values of their parameters.
+
+        :param filters: the filters of a query builder
+        :param after: the keyset pagination values of a query builder
+        :return: tuple of a dictionary with the filters and keyset pagination values where every parameter is replaced
+            by its type and the list of parameter values
+        """
+        values = []
+
+        def collect(value):
+            values.append(value)
+            return ('__parameter__', type(value).__name__)
+
+        shape = {'filters': cls.map_filters(filters, collect), 'after': cls.map_after(after, collect)}
+
+        return shape, values
+
+    @classmethod
+    def get_sentinels(cls, filters, after=None):
+        """Return a copy of the filters where every parameter is replaced by a unique sentinel value of the same type.
+
+        :param filters: the filters of a query builder
+        :param after: the keyset pagination values of a query builder
+        :return: tuple of the mapped filters, the mapped keyset pagination values and the list of sentinel values
+        """
+        token = uuid.uuid4().hex
+        sentinels = []
+
+        def sentinel(value):
+            index = len(sentinels)
+            if isinstance(value, str):
+                sentinels.append(f'__{token}_{index}__')
+            elif isinstance(value, int):
+                sentinels.append(-2**62 - index)
+            else:
+                sentinels.append(-2.**100 * (1 + index * 2.**-20))
+            return sentinels[-1]
+
+        return cls.map_filters(filters, sentinel), cls.map_after(after, sentinel), sentinels
+
+    @classmethod
+    def from_query(cls, query, sentinels, state):
+        """Create a template from a query that was built with the given sentinel values for its parameters.
+
+        :param query: the query built with the sentinel values returned by `get_sentinels`
+        :param sentinels: the sentinel values
+        :param state: dictionary with the attributes of the query builder that were set when building the query
+
+        :return: the template or None if not every sentinel was passed unaltered to the query as a bound parameter
+        """
+        from sqlalchemy.sql import visitors
+
+        indices = {(type(value), value): index for index, value in enumerate(sentinels)}
+        parameter_keys = [[] for _ in sentinels]
+        altered = []
+
+        def visit_bindparam(bindparam):
+            value = bindparam.value
+            try:
+                index = indices.get((type(value), value), None)
+            except TypeError:
+                return
+            if index is not None:
+                parameter_keys[index].append(bindparam.key)
+            elif isinstance(value, str) and any(isinstance(s, str) and s in value for s in sentinels):
+                altered.append(value)
+
+        visitors.traverse(query.statement, {}, {'bindparam': visit_bindparam})
+
+        if altered or not all(parameter_keys):
+            return None
+
+        return cls(query, parameter_keys, state)
+
+    def get_query(self, session, values):
+        """Return the query of this template for the given session with the given parameter values substituted.
+
+        :param session: the session to bind the query to
+        :param values: the parameter values in the order returned by `get_parameters`
+        :return: an instance of `sqlalchemy.orm.Query`
+        """
+        params = {key: value for keys, value in zip(self.parameter_keys, values) for key in keys}
+        return self.query.with_session(session).params(params)
+
+
+class QueryTemplateCache:
+    """Least-recently-used cache of query templates, keyed on the shape of the query builder."""
+
+    def __init__(self, maxsize=256):
+        self._maxsize = maxsize
+        self._templates = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._templates)
+
+    def __contains__(self, key):
+        return key in self._templates
+
+    def get(self, key):
+        """Return the template for the given key, which is `None` if the shape cannot be templated.
+
+        :raises KeyError: if there is no entry for the key
+        """
+        with self._lock:
+            template = self._templates[key]
+            self._templates.move_to_end(key)
+            return template
+
+    def set(self, key, template):
+        """Add the template for the given key, evicting the least recently used entry if the cache is full."""
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self._maxsize:
+                self._templates.popitem(last=False)
+
+    def clear(self):
+        """Remove all templates."""
+        with self._lock:
+            self._templates.clear()
+
+
+QUERY_TEMPLATE_CACHE = QueryTemplateCache()
+
+
 class QueryBuilder:
     """
     The class to query the AiiDA database.
@@ -333,6 +553,9 @@ class QueryBuilder:
     # namely tag of first entity + _EDGE_TAG_DELIM + tag of second entity
     _EDGE_TAG_DELIM = '--'
     _VALID_PROJECTION_KEYS = ('func', 'cast')
+    # Joining keywords that join through a recursive query over the links, and the link types that it follows by default
+    _RECURSIVE_JOINING_KEYWORDS = ('with_ancestors', 'with_descendants', 'ancestor_of', 'descendant_of')
+    _RECURSIVE_LINK_TYPES = (LinkType.CREATE.value, LinkType.INPUT_CALC.value)
 
     def __init__(self, backend=None, **kwargs):
         """
@@ -360,9 +583,15 @@ class QueryBuilder:
             for more information.
         :param int offset:
             Set an offset for the results returned. Details in :func:`QueryBuilder.offset`.
+        :param list after:
+            Only return the results that come after the row with these values of the ordering keys.
+            Details in :func:`QueryBuilder.after`.
         :param order_by:
             How to order the results. As the 2 above, can be set also at later stage,
             check :func:`QueryBuilder.order_by` for more information.
+        :param group_by:
+            How to group the results for aggregate functions in the projections.
+            Check :func:`QueryBuilder.group_by` for more information.
 
         """
         backend = backend or get_manager().get_backend()
@@ -454,16 +683,25 @@ class QueryBuilder:
         # The offset returns results after the offset
         self.offset(kwargs.pop('offset', None))
 
+        # The keyset pagination returns results after the row with the given values of the ordering keys
+        self.after(kwargs.pop('after', None))
+
         # The user can also specify the order.
         self._order_by = {}
         order_spec = kwargs.pop('order_by', None)
         if order_spec:
             self.order_by(order_spec)
 
+        # The grouping for projections that apply an aggregate function
+        self._group_by = []
+        group_spec = kwargs.pop('group_by', None)
+        if group_spec:
+            self.group_by(group_spec)
+
         # I've gone through all the keywords, popping each item
         # If kwargs is not empty, there is a problem:
         if kwargs:
-            valid_keys = ('path', 'filters', 'project', 'limit', 'offset', 'order_by')
+            valid_keys = ('path', 'filters', 'project', 'limit', 'offset', 'after', 'order_by', 'group_by')
             raise InputValidationError(
                 'Received additional keywords: {}'
                 '\nwhich I cannot process'
@@ -592,6 +830,9 @@ class QueryBuilder:
         edge_filters=None,
         edge_project=None,
         outerjoin=False,
+        max_depth=None,
+        link_types=None,
+        prune=False,
         **kwargs
     ):
         """
@@ -636,6 +877,17 @@ class QueryBuilder:
             The filters to apply on the edge. Also here, details in :meth:`.add_filter`.
         :param str edge_project:
             The project from the edges. API-details in :meth:`.add_projection`.
+        :param int max_depth:
+            Only for the recursive joins `with_ancestors` and `with_descendants`: the maximum depth of the edges, where
+            a depth of 0 corresponds to a direct link. Unlike a filter on the `depth` of the edge, this stops the
+            recursion itself.
+        :param link_types:
+            Only for the recursive joins: the link types, as `LinkType` or their string values, that are followed.
+            By default, only `create` and `input_calc` links are followed.
+        :param bool prune:
+            Only for the recursive joins: if True, duplicate edges, i.e. nodes reached at the same depth through
+            different paths, are walked only once, which can speed up queries on densely connected graphs considerably.
+            Note that the edges are then unique, such that each node is returned once per depth at which it is reached.
 
         A small usage example how this can be invoked::
 
@@ -833,6 +1085,8 @@ class QueryBuilder:
                 joining_keyword = 'with_incoming'
                 joining_value = self._path[-1]['tag']
 
+            recursion = self._get_recursion_spec(joining_keyword, max_depth, link_types, prune)
+
         except Exception as exception:
             if self._debug:
                 print('DEBUG: Exception caught in append (part joining), cleaning up')
@@ -907,12 +1161,49 @@ class QueryBuilder:
                 joining_keyword=joining_keyword,
                 joining_value=joining_value,
                 outerjoin=outerjoin,
-                edge_tag=edge_tag
+                edge_tag=edge_tag,
+                **recursion
             )
         )
 
         return self
 
+    def _get_recursion_spec(self, joining_keyword, max_depth, link_types, prune):
+        """Validate the options of a recursive join and return those that differ from the defaults.
+
+        :param joining_keyword: the joining keyword of the vertex that is appended
+        :param max_depth: the maximum depth of the recursion or None
+        :param link_types: the link types that are followed or None
+        :param prune: whether duplicate edges are pruned
+        :return: dictionary with the options to be stored in the path
+        :raises InputValidationError: if the options are invalid or the join is not recursive
+        """
+        recursion = {}
+
+        if max_depth is not None:
+            if not isinstance(max_depth, int) or isinstance(max_depth, bool) or max_depth < 0:
+                raise InputValidationError(f'max_depth should be a non-negative integer, got {max_depth}')
+            recursion['max_depth'] = max_depth
+
+        if link_types is not None:
+            if isinstance(link_types, (str, LinkType)):
+                link_types = [link_types]
+            try:
+                recursion['link_types'] = [LinkType(link_type).value for link_type in link_types]
+            except (TypeError, ValueError) as exception:
+                raise InputValidationError(f'invalid link_types {link_types}: {exception}')
+
+        if prune:
+            recursion['prune'] = True
+
+        if recursion and joining_keyword not in self._RECURSIVE_JOINING_KEYWORDS:
+            raise InputValidationError(
+                f'max_depth, link_types and prune can only be used with the joining keywords '
+                f'{self._RECURSIVE_JOINING_KEYWORDS}, not with {joining_keyword}'
+            )
+
+        return recursion
+
     def order_by(self, order_by):
         """
         Set the entity to order by
@@ -1015,6 +1306,68 @@ class QueryBuilder:
             self._order_by.append(_order_spec)
         return self
 
+    def group_by(self, group_by):
+        """
+        Set the entities to group the results by.
+
+        Grouping is used in combination with projections that apply an aggregate function, through the ``func`` key,
+        which are then computed for each group in the database. Valid functions are ``count``, ``sum``, ``avg``,
+        ``min`` and ``max``. All projections that do not apply a function should also be in the grouping.
+
+        :param group_by:
+            A dictionary, or a list of dictionaries, where the keys are tags of vertices in the path and the values are
+            the (list of) properties to group by. As for projections, a value in the attributes or extras can be cast
+            with the ``cast`` key. Grouping by ``*`` groups by the entity itself.
+
+        Usage::
+
+            # Count the number of processes per process state and compute the average of an attribute
+            qb = QueryBuilder()
+            qb.append(
+                ProcessNode,
+                tag='process',
+                project=['attributes.process_state', {'id': {'func': 'count'}}]
+            )
+            qb.group_by({'process': 'attributes.process_state'})
+
+            qb = QueryBuilder()
+            qb.append(Float, tag='float', project=[{'attributes.value': {'func': 'avg', 'cast': 'f'}}])
+            qb.append(CalcJobNode, with_outgoing='float', tag='calcjob', project=['process_type'])
+            qb.group_by({'calcjob': 'process_type'})
+        """
+        self._group_by = []
+        allowed_keys = ('cast',)
+
+        if not isinstance(group_by, (list, tuple)):
+            group_by = [group_by]
+
+        for group_spec in group_by:
+            if not isinstance(group_spec, dict):
+                raise InputValidationError(f'Invalid input for group_by statement: {group_spec}')
+            _group_spec = {}
+            for tagspec, items_to_group_by in group_spec.items():
+                if not isinstance(items_to_group_by, (tuple, list)):
+                    items_to_group_by = [items_to_group_by]
+                tag = self._get_tag_from_specification(tagspec)
+                _group_spec[tag] = []
+                for item_to_group_by in items_to_group_by:
+                    if isinstance(item_to_group_by, str):
+                        item_to_group_by = {item_to_group_by: {}}
+                    elif not isinstance(item_to_group_by, dict):
+                        raise InputValidationError(f'Cannot deal with input to group_by {item_to_group_by}')
+                    for entityname, groupspec in item_to_group_by.items():
+                        if not isinstance(groupspec, dict):
+                            raise InputValidationError(f'Expected a dictionary for {entityname}, got: {groupspec}')
+                        for key in groupspec:
+                            if key not in allowed_keys:
+                                raise InputValidationError(
+                                    f'The allowed keys for a group specification are {allowed_keys}, not {key}'
+                                )
+                    _group_spec[tag].append(item_to_group_by)
+
+            self._group_by.append(_group_spec)
+        return self
+
     def add_filter(self, tagspec, filter_spec):
         """
         Adding a filter to my filters.
@@ -1230,9 +1583,17 @@ class QueryBuilder:
             elif func == 'max':
                 entity_to_project = sa_func.max(entity_to_project)
             elif func == 'min':
-                entity_to_project = sa_func.max(entity_to_project)
+                entity_to_project = sa_func.min(entity_to_project)
             elif func == 'count':
                 entity_to_project = sa_func.count(entity_to_project)
+            elif func == 'sum':
+                # The sum of integers is returned by PostgreSQL as a numeric, which would be returned as a `Decimal`
+                if isinstance(entity_to_project.type, Integer):
+                    entity_to_project = type_cast(sa_func.sum(entity_to_project), BigInteger)
+                else:
+                    entity_to_project = sa_func.sum(entity_to_project)
+            elif func == 'avg':
+                entity_to_project = type_cast(sa_func.avg(entity_to_project), Float)
             else:
                 raise InputValidationError(f'\nInvalid function specification {func}')
             self._query = self._query.add_columns(entity_to_project)
@@ -1331,6 +1692,36 @@ class QueryBuilder:
         self._offset = offset
         return self
 
+    def after(self, values):
+        """
+        Set the values of the ordering keys of the last row that was returned, to only return the rows that come after.
+
+        Contrary to an offset, for which the database has to go through all preceding rows to discard them, this
+        keyset pagination can directly seek to the first row of the page using the index of the ordering keys, such
+        that the cost of retrieving a page does not depend on how deep it is.
+        The values correspond one-to-one to the items specified with :func:`QueryBuilder.order_by`, in the same order.
+        To paginate reliably, the ordering keys should uniquely identify a row and not be null, which is most easily
+        achieved by ordering on the ``id`` as the last key.
+
+        Usage::
+
+            qb = QueryBuilder().append(Node, tag='node', project=['ctime', 'id'])
+            qb.order_by({'node': ['ctime', 'id']}).limit(100)
+            page = qb.all()
+            while page:
+                qb.after(page[-1])
+                page = qb.all()
+
+        :param values: list with the value of each ordering key of the last row of the previous page, or None to return
+            the rows from the start.
+        """
+        if values is not None:
+            if not isinstance(values, (list, tuple)):
+                raise InputValidationError('after has to be a list or tuple of values, or None')
+            values = list(values)
+        self._after = values
+        return self
+
     def _build_filters(self, alias, filter_spec):
         """
         Recurse through the filter specification and apply filter operations.
@@ -1456,10 +1847,24 @@ class QueryBuilder:
         ).join(entity_to_join, aliased_edge.input_id == entity_to_join.id, isouter=isouterjoin)
         return aliased_edge
 
-    def _join_descendants_recursive(self, joined_entity, entity_to_join, isouterjoin, filter_dict, expand_path=False):
+    def _join_descendants_recursive(
+        self,
+        joined_entity,
+        entity_to_join,
+        isouterjoin,
+        filter_dict,
+        expand_path=False,
+        max_depth=None,
+        link_types=None,
+        prune=False
+    ):
         """
         joining descendants using the recursive functionality
-        :TODO: Move the filters to be done inside the recursive query (for example on depth)
+
+        :param max_depth: if not None, the recursion stops at this depth, i.e. only rows with `depth <= max_depth`
+        :param link_types: the values of the link types that are followed, by default `create` and `input_calc` links
+        :param prune: if True, rows are combined with UNION rather than UNION ALL, such that a descendant that can be
+            reached through multiple paths of the same length is only walked once
         :TODO: Pass an option to also show the path, if this is wanted.
         """
 
@@ -1469,6 +1874,7 @@ class QueryBuilder:
         link2 = aliased(self._impl.Link)
         node1 = aliased(self._impl.Node)
         in_recursive_filters = self._build_filters(node1, filter_dict)
+        link_types = link_types or self._RECURSIVE_LINK_TYPES
 
         selection_walk_list = [
             link1.input_id.label('ancestor_id'),
@@ -1481,7 +1887,7 @@ class QueryBuilder:
         walk = select(selection_walk_list).select_from(join(node1, link1, link1.input_id == node1.id)).where(
             and_(
                 in_recursive_filters,  # I apply filters for speed here
-                link1.type.in_((LinkType.CREATE.value, LinkType.INPUT_CALC.value))  # I follow input and create links
+                link1.type.in_(link_types)  # I follow input and create links, unless specified otherwise
             )
         ).cte(recursive=True)
 
@@ -1495,15 +1901,21 @@ class QueryBuilder:
         if expand_path:
             selection_union_list.append((aliased_walk.c.path + array((link2.output_id,))).label('path'))
 
+        recursive_filters = [link2.type.in_(link_types)]
+        if max_depth is not None:
+            recursive_filters.append(aliased_walk.c.depth < max_depth)
+
+        union = aliased_walk.union if prune else aliased_walk.union_all
+
         descendants_recursive = aliased(
-            aliased_walk.union_all(
+            union(
                 select(selection_union_list).select_from(
                     join(
                         aliased_walk,
                         link2,
                         link2.input_id == aliased_walk.c.descendant_id,
                     )
-                ).where(link2.type.in_((LinkType.CREATE.value, LinkType.INPUT_CALC.value)))
+                ).where(and_(*recursive_filters))
             )
         )  # .alias()
 
@@ -1515,10 +1927,24 @@ class QueryBuilder:
                                        )
         return descendants_recursive.c
 
-    def _join_ancestors_recursive(self, joined_entity, entity_to_join, isouterjoin, filter_dict, expand_path=False):
+    def _join_ancestors_recursive(
+        self,
+        joined_entity,
+        entity_to_join,
+        isouterjoin,
+        filter_dict,
+        expand_path=False,
+        max_depth=None,
+        link_types=None,
+        prune=False
+    ):
         """
         joining ancestors using the recursive functionality
-        :TODO: Move the filters to be done inside the recursive query (for example on depth)
+
+        :param max_depth: if not None, the recursion stops at this depth, i.e. only rows with `depth <= max_depth`
+        :param link_types: the values of the link types that are followed, by default `create` and `input_calc` links
+        :param prune: if True, rows are combined with UNION rather than UNION ALL, such that an ancestor that can be
+            reached through multiple paths of the same length is only walked once
         :TODO: Pass an option to also show the path, if this is wanted.
 
         """
@@ -1528,6 +1954,7 @@ class QueryBuilder:
         link2 = aliased(self._impl.Link)
         node1 = aliased(self._impl.Node)
         in_recursive_filters = self._build_filters(node1, filter_dict)
+        link_types = link_types or self._RECURSIVE_LINK_TYPES
 
         selection_walk_list = [
             link1.input_id.label('ancestor_id'),
@@ -1538,7 +1965,7 @@ class QueryBuilder:
             selection_walk_list.append(array((link1.output_id, link1.input_id)).label('path'))
 
         walk = select(selection_walk_list).select_from(join(node1, link1, link1.output_id == node1.id)).where(
-            and_(in_recursive_filters, link1.type.in_((LinkType.CREATE.value, LinkType.INPUT_CALC.value)))
+            and_(in_recursive_filters, link1.type.in_(link_types))
         ).cte(recursive=True)
 
         aliased_walk = aliased(walk)
@@ -1551,16 +1978,22 @@ class QueryBuilder:
         if expand_path:
             selection_union_list.append((aliased_walk.c.path + array((link2.input_id,))).label('path'))
 
+        # I can't follow RETURN or CALL links, unless specified otherwise
+        recursive_filters = [link2.type.in_(link_types)]
+        if max_depth is not None:
+            recursive_filters.append(aliased_walk.c.depth < max_depth)
+
+        union = aliased_walk.union if prune else aliased_walk.union_all
+
         ancestors_recursive = aliased(
-            aliased_walk.union_all(
+            union(
                 select(selection_union_list).select_from(
                     join(
                         aliased_walk,
                         link2,
                         link2.output_id == aliased_walk.c.ancestor_id,
                     )
-                ).where(link2.type.in_((LinkType.CREATE.value, LinkType.INPUT_CALC.value)))
-                # I can't follow RETURN or CALL links
+                ).where(and_(*recursive_filters))
             )
         )
 
@@ -1859,8 +2292,10 @@ class QueryBuilder:
             'filters': self._filters,
             'project': self._projections,
             'order_by': self._order_by,
+            'group_by': self._group_by,
             'limit': self._limit,
             'offset': self._offset,
+            'after': self._after,
         })
 
     def __deepcopy__(self, memo):
@@ -1883,8 +2318,64 @@ class QueryBuilder:
         entity = self._get_projectable_entity(alias, column_name, attrpath, **entityspec)
         order = entityspec.get('order', 'asc')
         if order == 'desc':
-            entity = entity.desc()
-        self._query = self._query.order_by(entity)
+            self._query = self._query.order_by(entity.desc())
+        else:
+            self._query = self._query.order_by(entity)
+
+        return entity, order
+
+    def _build_group(self, alias, entitytag, entityspec):
+        """
+        Build the group by parameter of the query
+        """
+        column_name = entitytag.split('.')[0]
+        attrpath = entitytag.split('.')[1:]
+
+        if column_name == '*':
+            # Grouping by the primary key allows to select all the columns of the entity
+            entity = self._impl.get_column('id', alias)
+        else:
+            entity = self._get_projectable_entity(alias, column_name, attrpath, **entityspec)
+
+        self._query = self._query.group_by(entity)
+
+    @staticmethod
+    def _build_after(order_entities, values):
+        """
+        Build the filter for keyset pagination, selecting the rows that come after the row with the given values.
+
+        :param order_entities: list of tuples of the entity to order by and the order, 'asc' or 'desc'
+        :param values: list of the values of the ordering keys of the last row of the previous page
+        :returns: an instance of *sqlalchemy.sql.elements.BinaryExpression*.
+        """
+        if not order_entities:
+            raise InputValidationError('keyset pagination with `after` requires the query to be ordered')
+
+        if len(values) != len(order_entities):
+            raise InputValidationError(
+                f'`after` specifies {len(values)} values but the query is ordered by {len(order_entities)} keys'
+            )
+
+        orders = {order for _, order in order_entities}
+
+        # If all keys are ordered in the same direction, a row value comparison can be used, which the database can
+        # match directly with a multi-column index
+        if len(orders) == 1:
+            entities = [entity for entity, _ in order_entities]
+            if len(entities) == 1:
+                left, right = entities[0], values[0]
+            else:
+                left = tuple_(*entities)
+                right = tuple_(*[literal(value, entity.type) for entity, value in zip(entities, values)])
+            return left > right if orders == {'asc'} else left < right
+
+        expressions = []
+        for index, (entity, order) in enumerate(order_entities):
+            equalities = [order_entities[i][0] == values[i] for i in range(index)]
+            comparison = entity > values[index] if order == 'asc' else entity < values[index]
+            expressions.append(and_(*equalities, comparison))
+
+        return or_(*expressions)
 
     def _build(self):
         """
@@ -1907,7 +2398,7 @@ class QueryBuilder:
             isouterjoin = verticespec.get('outerjoin')
             edge_tag = verticespec['edge_tag']
 
-            if verticespec['joining_keyword'] in ('with_ancestors', 'with_descendants', 'ancestor_of', 'descendant_of'):
+            if verticespec['joining_keyword'] in self._RECURSIVE_JOINING_KEYWORDS:
                 # I treat those two cases in a special way.
                 # I give them a filter_dict, to help the recursive function find a good
                 # starting point. TODO: document this!
@@ -1918,7 +2409,14 @@ class QueryBuilder:
                 expand_path = ((self._filters[edge_tag].get('path', None) is not None) or
                                any(['path' in d.keys() for d in self._projections[edge_tag]]))
                 aliased_edge = connection_func(
-                    toconnectwith, alias, isouterjoin=isouterjoin, filter_dict=filter_dict, expand_path=expand_path
+                    toconnectwith,
+                    alias,
+                    isouterjoin=isouterjoin,
+                    filter_dict=filter_dict,
+                    expand_path=expand_path,
+                    max_depth=verticespec.get('max_depth', None),
+                    link_types=verticespec.get('link_types', None),
+                    prune=verticespec.get('prune', False),
                 )
             else:
                 aliased_edge = connection_func(toconnectwith, alias, isouterjoin=isouterjoin)
@@ -1976,13 +2474,26 @@ class QueryBuilder:
                 if edge_tag is not None:
                     self._build_projections(edge_tag)
 
+        # GROUP ################################
+        for group_spec in self._group_by:
+            for tag, entity_list in group_spec.items():
+                alias = self.tag_to_alias_map[tag]
+                for entitydict in entity_list:
+                    for entitytag, entityspec in entitydict.items():
+                        self._build_group(alias, entitytag, entityspec)
+
         # ORDER ################################
+        order_entities = []
         for order_spec in self._order_by:
             for tag, entity_list in order_spec.items():
                 alias = self.tag_to_alias_map[tag]
                 for entitydict in entity_list:
                     for entitytag, entityspec in entitydict.items():
-                        self._build_order(alias, entitytag, entityspec)
+                        order_entities.append(self._build_order(alias, entitytag, entityspec))
+
+        # KEYSET ################################
+        if self._after is not None:
+            self._query = self._query.filter(self._build_after(order_entities, self._after))
 
         # LIMIT ################################
         if self._limit is not None:
@@ -2085,7 +2596,7 @@ class QueryBuilder:
             need_to_build = True
 
         if need_to_build:
-            query = self._build()
+            query = self._build_from_template()
             self._hash = queryhelp_hash
         else:
             try:
@@ -2096,6 +2607,75 @@ class QueryBuilder:
                 self._hash = queryhelp_hash
         return query
 
+    def _build_from_template(self):
+        """Build the query from the cached template of the shape of this query builder, creating it if necessary.
+
+        Query builders that only differ in the values of their filters and keyset pagination, share the same template,
+        such that the query only needs to be built once and the values are substituted as bound parameters. If the
+        shape of the query builder cannot be templated, the query is built as normal.
+
+        :returns: an instance of sqlalchemy.orm.Query that is specific to the backend used.
+        """
+        from aiida.common.hashing import make_hash
+
+        parameters, values = QueryTemplate.get_parameters(self._filters, self._after)
+
+        try:
+            shape = make_hash({
+                'path': self._path,
+                'parameters': parameters,
+                'project': self._projections,
+                'order_by': self._order_by,
+                'group_by': self._group_by,
+                'limit': self._limit,
+                'offset': self._offset,
+            })
+        except ValueError:
+            return self._build()
+
+        key = (type(self._impl), shape)
+
+        try:
+            template = QUERY_TEMPLATE_CACHE.get(key)
+        except KeyError:
+            template = self._build_template()
+            QUERY_TEMPLATE_CACHE.set(key, template)
+
+        if template is None:
+            return self._build()
+
+        self.tag_to_alias_map = dict(template.state['tag_to_alias_map'])
+        self.tag_to_projected_property_dict = copy.deepcopy(template.state['tag_to_projected_property_dict'])
+        self.nr_of_projections = template.state['nr_of_projections']
+        self._attrkeys_as_in_sql_result = dict(template.state['attrkeys_as_in_sql_result'])
+        self._query = template.get_query(self._impl.get_session(), values)
+
+        return self._query
+
+    def _build_template(self):
+        """Build the query with sentinel values for the parameters of the filters and turn it into a template.
+
+        :returns: the `QueryTemplate` or None if the shape of this query builder cannot be templated.
+        """
+        filters, after = self._filters, self._after
+        self._filters, self._after, sentinels = QueryTemplate.get_sentinels(filters, after)
+
+        try:
+            query = self._build()
+        except Exception:  # pylint: disable=broad-except
+            return None
+        finally:
+            self._filters, self._after = filters, after
+
+        state = {
+            'tag_to_alias_map': dict(self.tag_to_alias_map),
+            'tag_to_projected_property_dict': copy.deepcopy(self.tag_to_projected_property_dict),
+            'nr_of_projections': self.nr_of_projections,
+            'attrkeys_as_in_sql_result': dict(self._attrkeys_as_in_sql_result),
+        }
+
+        return QueryTemplate.from_query(query, sentinels, state)
+
     @staticmethod
     def get_aiida_entity_res(value):
         """Convert a projected query result to front end class if it is an instance of a `BackendEntity`.
@@ -2195,7 +2775,8 @@ class QueryBuilder:
     def iterall(self, batch_size=100):
         """
         Same as :meth:`.all`, but returns a generator.
-        Be aware that this is only safe if no commit will take place during this
+        The results are streamed from the database through a server-side cursor, such that only one batch of rows is
+        kept in memory at a time. Be aware that this is only safe if no commit will take place during this
         transaction. You might also want to read the SQLAlchemy documentation on
         http://docs.sqlalchemy.org/en/latest/orm/query.html#sqlalchemy.orm.query.Query.yield_per
 
@@ -2310,6 +2891,90 @@ class QueryBuilder:
         """
         return list(self.iterdict(batch_size=batch_size))
 
+    def columnar(self, batch_size=1000, output='numpy'):
+        """Executes the full query and return the results per projection instead of per row.
+
+        The rows are streamed from the database in batches and transposed into one array per projection. Contrary to
+        :meth:`.all` and :meth:`.dict`, values are only converted to AiiDA instances for projections that require it,
+        i.e. entire entities (``'*'``), UUIDs and choices. Columns of scalars, such as ids or numeric attributes, are
+        filled directly into typed arrays without any per-value conversion.
+
+        :param int batch_size: the number of rows to fetch from the database in one go.
+        :param str output: the output format, either ``'numpy'`` or ``'pandas'``.
+        :returns: for the ``'numpy'`` output, a dictionary with the same nesting as the rows returned by :meth:`.dict`,
+            i.e. the key is the tag of the vertex and the value a dictionary whose keys are the projections and values
+            one-dimensional numpy arrays with the values of all rows. For the ``'pandas'`` output, a
+            :class:`pandas.DataFrame` whose columns are named ``<tag>.<projection>``.
+        :raises ValueError: if an unsupported output format is specified.
+
+        Usage::
+
+            qb = QueryBuilder()
+            qb.append(Dict, project=['id', 'attributes.energy'], tag='result')
+            columns = qb.columnar()
+            columns['result']['attributes.energy'].mean()
+        """
+        if output not in ['numpy', 'pandas']:
+            raise ValueError(f'unsupported output format `{output}`, choose either `numpy` or `pandas`')
+
+        query = self.get_query()
+        values = [[] for _ in range(self.nr_of_projections)]
+
+        for batch in self._impl.itercolumns(query, batch_size, self._attrkeys_as_in_sql_result):
+            for index, column in enumerate(batch):
+                values[index].extend(column)
+
+        columns = {}
+
+        for tag, projected_entities_dict in self.tag_to_projected_property_dict.items():
+            table_name = self._impl.get_table_name(self.tag_to_alias_map[tag])
+            columns[tag] = {}
+            for attrkey, index_in_sql_result in projected_entities_dict.items():
+                key = self._impl.get_corresponding_property(table_name, attrkey, self._impl.inner_to_outer_schema)
+                columns[tag][key] = self._get_column_array(values[index_in_sql_result])
+
+        if output == 'numpy':
+            return columns
+
+        try:
+            import pandas
+        except ImportError as exc:
+            raise ImportError(f'{str(exc)}. You need to install the pandas package.')
+
+        return pandas.DataFrame({
+            f'{tag}.{key}': column for tag, tag_columns in columns.items() for key, column in tag_columns.items()
+        })
+
+    def _get_column_array(self, values):
+        """Convert the raw values of a projection to a one-dimensional numpy array.
+
+        Whether the values need to be converted to AiiDA instances is decided once for the entire column based on its
+        first value that is not ``None``, since the ORM returns the instances of an entity projection all as models.
+        A typed array is only returned if all values are booleans, integers, floats or strings of the same type, since
+        the values of projections of attributes and extras can be of any type, which numpy would otherwise coerce.
+
+        :param values: list of values of a projection as returned by the ORM.
+        :returns: a one-dimensional numpy array
+        """
+        import numpy
+
+        sample = next((value for value in values if value is not None), None)
+
+        if sample is not None and self.get_aiida_entity_res(self._impl.get_aiida_res(sample)) is not sample:
+            values = [self.get_aiida_entity_res(self._impl.get_aiida_res(value)) for value in values]
+
+        value_types = {type(value) for value in values}
+
+        if len(value_types) == 1 and value_types.issubset({bool, int, float, str}):
+            return numpy.array(values)
+
+        # Values such as dictionaries, lists or AiiDA instances, are stored as is in an array of type `object`
+        array = numpy.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            array[index] = value
+
+        return array
+
     def inputs(self, **kwargs):
         """
         Join to inputs of previous vertice in path.
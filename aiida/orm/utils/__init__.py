@@ -9,7 +9,7 @@
 ###########################################################################
 """Utilities related to the ORM."""
 
-__all__ = ('load_code', 'load_computer', 'load_group', 'load_node')
+__all__ = ('load_code', 'load_computer', 'load_group', 'load_node', 'load_nodes')
 
 
 def load_entity(
@@ -203,3 +203,37 @@ def load_node(identifier=None, pk=None, uuid=None, label=None, sub_classes=None,
         sub_classes=sub_classes,
         query_with_dashes=query_with_dashes
     )
+
+
+def load_nodes(identifiers=None, pks=None, uuids=None, sub_classes=None):
+    """
+    Load multiple nodes by their pks or uuids with a single query. If the type of the identifiers is unknown simply
+    pass them without a keyword and the loader will attempt to infer the type of each identifier.
+
+    Nodes that were already loaded within an active :func:`~aiida.orm.utils.loaders.identity_map` are returned from
+    the identity map instead of being queried for again.
+
+    :param identifiers: iterable of pks (integer) or full uuids (string)
+    :param pks: iterable of pks of nodes
+    :param uuids: iterable of full uuids of nodes
+    :param sub_classes: an optional tuple of orm classes to narrow the queryset. Each class should be a strict sub class
+        of the ORM class of the given entity loader.
+    :returns: list of the node instances, in the order of the identifiers
+    :raise ValueError: if none or more than one of the identifiers are supplied, or an identifier is not a pk or a full
+        uuid
+    :raise aiida.common.NotExistent: if no matching Node is found for any of the identifiers
+    """
+    from aiida.orm.utils.loaders import NodeEntityLoader, IdentifierType
+
+    inputs_provided = [value is not None for value in (identifiers, pks, uuids)].count(True)
+
+    if inputs_provided != 1:
+        raise ValueError("exactly one of the parameters 'identifiers', 'pks' or 'uuids' has to be specified")
+
+    if pks is not None:
+        return NodeEntityLoader.load_entities(pks, IdentifierType.ID, sub_classes=sub_classes)
+
+    if uuids is not None:
+        return NodeEntityLoader.load_entities(uuids, IdentifierType.UUID, sub_classes=sub_classes)
+
+    return NodeEntityLoader.load_entities(identifiers, sub_classes=sub_classes)
@@ -14,7 +14,7 @@ from collections.abc import Mapping
 from aiida.common import exceptions
 from aiida.common.lang import type_check
 
-__all__ = ('LinkPair', 'LinkTriple', 'LinkManager', 'validate_link')
+__all__ = ('LinkPair', 'LinkTriple', 'LinkManager', 'validate_link', 'prefetch_links', 'discard_prefetched_links')
 
 LinkPair = namedtuple('LinkPair', ['link_type', 'link_label'])
 LinkTriple = namedtuple('LinkTriple', ['node', 'link_type', 'link_label'])
@@ -50,6 +50,74 @@ def link_triple_exists(source, target, link_type, link_label):
     return builder.count() != 0
 
 
+def prefetch_links(nodes, link_direction='both', link_type=()):
+    """Load the stored links of the given nodes with a single query per direction and attach them to the nodes.
+
+    Subsequent calls of `get_incoming`, `get_outgoing` and `get_stored_link_triples` of these nodes, for the link
+    types that were prefetched, are served from the prefetched links without querying the database. The prefetched
+    links are a snapshot: they are discarded when a link is added through one of the node instances, but links that
+    are added by any other means are not reflected. If an identity map is active, the linked nodes are registered in
+    it, such that prefetching the links of the linked nodes in turn attaches them to the same instances.
+
+    :param nodes: iterable of nodes, of which the unstored ones are ignored
+    :param link_direction: `incoming`, `outgoing` or `both` to prefetch the incoming or outgoing links, or both
+    :param link_type: a `LinkType` or tuple of `LinkType` to only prefetch links of those types, by default all
+    :raise TypeError: if `link_type` is not a `LinkType` or tuple of `LinkType`
+    :raise ValueError: if `link_direction` is invalid
+    """
+    from aiida.common.links import LinkType
+    from aiida.orm import Node, QueryBuilder
+    from aiida.orm.utils.loaders import get_identity_map
+
+    if not isinstance(link_type, tuple):
+        link_type = (link_type,)
+
+    if link_type and not all(isinstance(entry, LinkType) for entry in link_type):
+        raise TypeError(f'link_type should be a LinkType or tuple of LinkType: got {link_type}')
+
+    if link_direction == 'both':
+        link_directions = ('incoming', 'outgoing')
+    elif link_direction in ('incoming', 'outgoing'):
+        link_directions = (link_direction,)
+    else:
+        raise ValueError(f'link_direction should be `incoming`, `outgoing` or `both`: got {link_direction}')
+
+    nodes = {node.pk: node for node in nodes if node.is_stored}
+    entity_map = get_identity_map()
+    edge_filters = {'type': {'in': [entry.value for entry in link_type]}} if link_type else {}
+
+    for direction in link_directions:
+
+        link_triples = {pk: [] for pk in nodes}
+
+        if nodes:
+            joining = {'with_outgoing': 'main'} if direction == 'incoming' else {'with_incoming': 'main'}
+            builder = QueryBuilder()
+            builder.append(Node, filters={'id': {'in': list(nodes)}}, project=['id'], tag='main')
+            builder.append(Node, project=['*'], edge_project=['type', 'label'], edge_filters=edge_filters, **joining)
+
+            for pk, node, link_type_value, link_label in builder.iterall():
+                if entity_map is not None:
+                    node = entity_map.add(Node, node)
+                link_triples[pk].append(LinkTriple(node, LinkType(link_type_value), link_label))
+
+        for pk, node in nodes.items():
+            # pylint: disable=protected-access
+            node._set_prefetched_link_triples(direction, link_type, link_triples[pk])
+
+
+def discard_prefetched_links(nodes):
+    """Discard the links of the given nodes that were loaded by `prefetch_links`.
+
+    Subsequent calls of `get_incoming`, `get_outgoing` and `get_stored_link_triples` of these nodes query the database
+    again, such that they also return the links that were added after the links were prefetched.
+
+    :param nodes: iterable of nodes
+    """
+    for node in nodes:
+        node._prefetched_links = None  # pylint: disable=protected-access
+
+
 def validate_link(source, target, link_type, link_label):
     """
     Validate adding a link of the given type and label from a given node to ourself.
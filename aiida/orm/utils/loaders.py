@@ -10,6 +10,9 @@
 """Module with `OrmEntityLoader` and its sub classes that simplify loading entities through their identifiers."""
 from abc import abstractclassmethod
 from enum import Enum
+import contextlib
+import threading
+import uuid as uuid_module
 
 from aiida.common.exceptions import MultipleObjectsError, NotExistent
 from aiida.common.lang import classproperty
@@ -17,9 +20,11 @@ from aiida.orm.querybuilder import QueryBuilder
 
 __all__ = (
     'get_loader', 'OrmEntityLoader', 'CalculationEntityLoader', 'CodeEntityLoader', 'ComputerEntityLoader',
-    'GroupEntityLoader', 'NodeEntityLoader'
+    'GroupEntityLoader', 'NodeEntityLoader', 'IdentityMap', 'identity_map', 'get_identity_map'
 )
 
+_IDENTITY_MAP_STATE = threading.local()
+
 
 def get_loader(orm_class):
     """Return the correct OrmEntityLoader for the given orm class.
@@ -45,6 +50,101 @@ def get_loader(orm_class):
     raise ValueError(f'no OrmEntityLoader available for {orm_class}')
 
 
+class IdentityMap:
+    """Map of loaded entities onto their pk and uuid, such that loading the same entity again returns the same instance.
+
+    The entities are registered per orm base class, because the pks of the various entity types are not unique.
+    """
+
+    def __init__(self):
+        self._entities = {}
+        self._uuids = {}
+
+    def __len__(self):
+        return len(self._entities)
+
+    def get(self, orm_base_class, identifier, identifier_type):
+        """Return the registered entity that corresponds to the identifier, if any.
+
+        Only identifiers that uniquely define an entity, i.e. an ID or a full UUID, can be looked up.
+
+        :param orm_base_class: the orm base class of the entity
+        :param identifier: the identifier
+        :param identifier_type: the type of the identifier
+        :returns: the registered entity or None
+        """
+        if identifier_type == IdentifierType.ID:
+            try:
+                return self._entities.get((orm_base_class, int(identifier)), None)
+            except (TypeError, ValueError):
+                return None
+
+        if identifier_type == IdentifierType.UUID:
+            try:
+                uuid = str(uuid_module.UUID(identifier))
+            except (AttributeError, TypeError, ValueError):
+                return None
+            pk = self._uuids.get((orm_base_class, uuid), None)
+            return self._entities.get((orm_base_class, pk), None)
+
+        return None
+
+    def add(self, orm_base_class, entity):
+        """Register a loaded entity.
+
+        :param orm_base_class: the orm base class of the entity
+        :param entity: the stored entity
+        :returns: the entity that is registered for the pk of the given entity, which is the given entity unless another
+            instance was registered before
+        """
+        key = (orm_base_class, entity.pk)
+        registered = self._entities.setdefault(key, entity)
+
+        uuid = getattr(entity, 'uuid', None)
+        if uuid is not None:
+            self._uuids[(orm_base_class, str(uuid))] = entity.pk
+
+        return registered
+
+    def clear(self):
+        """Remove all registered entities."""
+        self._entities.clear()
+        self._uuids.clear()
+
+
+def get_identity_map():
+    """Return the identity map that is active in the current thread, or None if there is none.
+
+    :returns: instance of `IdentityMap` or None
+    """
+    return getattr(_IDENTITY_MAP_STATE, 'identity_map', None)
+
+
+@contextlib.contextmanager
+def identity_map():
+    """Context manager within which entities loaded through the entity loaders are registered in an identity map.
+
+    Loading an entity that was already loaded within the context by its pk or full uuid, through `load_entity` or
+    `load_entities`, returns the same instance without querying the database. Note that changes made to the database
+    by other means than through these instances, e.g. by other processes, are therefore not reflected. The identity map
+    is per thread, just like the database session, and nested contexts share the identity map of the outermost one.
+
+    :returns: the active `IdentityMap`
+    """
+    active = get_identity_map()
+
+    if active is not None:
+        yield active
+        return
+
+    _IDENTITY_MAP_STATE.identity_map = IdentityMap()
+
+    try:
+        yield _IDENTITY_MAP_STATE.identity_map
+    finally:
+        _IDENTITY_MAP_STATE.identity_map = None
+
+
 class IdentifierType(Enum):
     """
     The enumeration that defines the three types of identifier that can be used to identify an orm entity.
@@ -205,6 +305,15 @@ class OrmEntityLoader:
         builder, query_parameters = cls.get_query_builder(identifier, identifier_type, sub_classes, query_with_dashes)
         builder.limit(2)
 
+        entity_map = get_identity_map()
+
+        if entity_map is not None:
+            entity = entity_map.get(
+                cls.orm_base_class, query_parameters['identifier'], query_parameters['identifier_type']
+            )
+            if entity is not None and isinstance(entity, query_parameters['classes']):
+                return entity
+
         classes = ' or '.join([sub_class.__name__ for sub_class in query_parameters['classes']])
         identifier = query_parameters['identifier']
         identifier_type = query_parameters['identifier_type'].value
@@ -218,8 +327,78 @@ class OrmEntityLoader:
             error = f'no {classes} found with {identifier_type}<{identifier}>: {exception}'
             raise NotExistent(error)
 
+        if entity_map is not None:
+            entity = entity_map.add(cls.orm_base_class, entity)
+
         return entity
 
+    @classmethod
+    def load_entities(cls, identifiers, identifier_type=None, sub_classes=None):
+        """
+        Load the entities that correspond to the provided identifiers with a single query.
+
+        Unlike `load_entity`, only identifiers that uniquely define an entity are supported, i.e. IDs and full UUIDs.
+        Entities that are registered in the active identity map, if any, are not queried for again.
+
+        :param identifiers: an iterable of identifiers
+        :param identifier_type: the type of the identifiers, which is inferred for each identifier if not defined
+        :param sub_classes: an optional tuple of orm classes, that should each be strict sub classes of the
+            base orm class of the loader, that will narrow the queryset
+        :returns: list of the loaded entities in the order of the identifiers
+        :raises ValueError: if an identifier is not an ID or a full UUID
+        :raises aiida.common.NotExistent: if any of the identifiers does not map onto an entity
+        """
+        classes = cls.get_query_classes(sub_classes)
+        entity_map = get_identity_map()
+        keys = []
+
+        for identifier in identifiers:
+            if identifier_type is None:
+                identifier, key_type = cls.infer_identifier_type(identifier)
+            else:
+                key_type = identifier_type
+
+            if key_type == IdentifierType.ID:
+                keys.append(('id', int(identifier)))
+            elif key_type == IdentifierType.UUID:
+                try:
+                    keys.append(('uuid', str(uuid_module.UUID(identifier))))
+                except (AttributeError, TypeError, ValueError):
+                    raise ValueError(f'`{identifier}` is not a full UUID, which is required to load multiple entities')
+            else:
+                raise ValueError(f'`{identifier}` is not an ID or a UUID, which is required to load multiple entities')
+
+        loaded = {}
+
+        if entity_map is not None:
+            key_types = {'id': IdentifierType.ID, 'uuid': IdentifierType.UUID}
+            for key in keys:
+                entity = entity_map.get(cls.orm_base_class, key[1], key_types[key[0]])
+                if entity is not None and isinstance(entity, classes):
+                    loaded[key] = entity
+
+        pks = {value for field, value in keys if field == 'id' and (field, value) not in loaded}
+        uuids = {value for field, value in keys if field == 'uuid' and (field, value) not in loaded}
+        filters = [{field: {'in': list(values)}} for field, values in (('id', pks), ('uuid', uuids)) if values]
+
+        if filters:
+            builder = QueryBuilder()
+            builder.append(cls=classes, tag='entity', project=['*'], filters={'or': filters})
+
+            for entity, in builder.iterall():
+                if entity_map is not None:
+                    entity = entity_map.add(cls.orm_base_class, entity)
+                loaded[('id', entity.pk)] = entity
+                loaded[('uuid', str(entity.uuid))] = entity
+
+        missing = [value for field, value in keys if (field, value) not in loaded]
+
+        if missing:
+            names = ' or '.join([sub_class.__name__ for sub_class in classes])
+            raise NotExistent(f'no {names} found with identifiers: {", ".join(str(value) for value in missing)}')
+
+        return [loaded[key] for key in keys]
+
     @classmethod
     def get_query_classes(cls, sub_classes=None):
         """
@@ -25,6 +25,9 @@ __all__ = ('ArchiveMetadata', 'detect_archive_type', 'null_callback', 'CacheFold
 
 ARCHIVE_LOGGER = AIIDA_LOGGER.getChild('archive')
 
+# the first bytes of a Zstandard compressed file
+ZSTD_MAGIC_NUMBER = b'\x28\xb5\x2f\xfd'
+
 
 @dataclasses.dataclass
 class ArchiveMetadata:
@@ -58,17 +61,30 @@ def detect_archive_type(in_path: str) -> str:
     """For back-compatibility, but should be replaced with direct comparison of classes.
 
     :param in_path: the path to the file
-    :returns: the archive type identifier (currently one of 'zip', 'tar.gz', 'folder')
+    :returns: the archive type identifier
+        (currently one of 'zip', 'zip-jsonl', 'zip-sqlite', 'tar.gz', 'tar.zst', 'folder')
 
     """
-    from aiida.tools.importexport.common.config import ExportFileFormat
+    from archive_path import read_file_in_zip
+
+    from aiida.tools.importexport.common.config import ExportFileFormat, JSONL_DATA_FORMAT, SQLITE_DATA_FORMAT
     from aiida.tools.importexport.common.exceptions import ImportValidationError
 
     if os.path.isdir(in_path):
         return 'folder'
+    with open(in_path, 'rb') as handle:
+        if handle.read(len(ZSTD_MAGIC_NUMBER)) == ZSTD_MAGIC_NUMBER:
+            return ExportFileFormat.TAR_ZSTD
     if tarfile.is_tarfile(in_path):
         return ExportFileFormat.TAR_GZIPPED
     if zipfile.is_zipfile(in_path):
+        try:
+            metadata = json.loads(read_file_in_zip(in_path, 'metadata.json'))
+        except (IOError, ValueError):
+            return ExportFileFormat.ZIP
+        zip_formats = {JSONL_DATA_FORMAT: ExportFileFormat.ZIP_JSONL, SQLITE_DATA_FORMAT: ExportFileFormat.ZIP_SQLITE}
+        if isinstance(metadata, dict) and metadata.get('data_format', None) in zip_formats:
+            return zip_formats[metadata['data_format']]
         return ExportFileFormat.ZIP
     raise ImportValidationError(
         'Unable to detect the input file format, it is neither a '
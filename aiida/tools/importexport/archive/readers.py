@@ -9,21 +9,31 @@
 ###########################################################################
 """Archive reader classes."""
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import io
 import json
 import os
 from pathlib import Path
+import posixpath
+import shutil
+import sqlite3
 import tarfile
+import threading
 from types import TracebackType
-from typing import Any, Callable, cast, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type
+from typing import Any, Callable, cast, Deque, Dict, IO, Iterable, Iterator, List, Optional, Set, Tuple, Type
 import zipfile
 
 from distutils.version import StrictVersion
-from archive_path import TarPath, ZipPath, read_file_in_tar, read_file_in_zip
+from archive_path import FilteredZipInfo, TarPath, ZipFileExtra, ZipPath, read_file_in_tar, read_file_in_zip
 
 from aiida.common.log import AIIDA_LOGGER
 from aiida.common.exceptions import InvalidOperation
 from aiida.common.folders import Folder, SandboxFolder
-from aiida.tools.importexport.common.config import EXPORT_VERSION, ExportFileFormat, NODES_EXPORT_SUBFOLDER
+from aiida.tools.importexport.common.config import (
+    EXPORT_VERSION, ExportFileFormat, NODES_EXPORT_SUBFOLDER, RECORDS_EXPORT_SUBFOLDER
+)
 from aiida.tools.importexport.common.exceptions import (CorruptArchive, IncompatibleArchiveVersionError)
 from aiida.tools.importexport.archive.common import (ArchiveMetadata, null_callback)
 from aiida.tools.importexport.common.config import NODE_ENTITY_NAME, GROUP_ENTITY_NAME
@@ -35,7 +45,10 @@ __all__ = (
     'ReaderJsonBase',
     'ReaderJsonFolder',
     'ReaderJsonTar',
+    'ReaderJsonTarZstd',
     'ReaderJsonZip',
+    'ReaderJsonLinesZip',
+    'ReaderSqliteZip',
     'get_reader',
 )
 
@@ -47,6 +60,9 @@ def get_reader(file_format: str) -> Type['ArchiveReaderAbstract']:
     readers = {
         ExportFileFormat.ZIP: ReaderJsonZip,
         ExportFileFormat.TAR_GZIPPED: ReaderJsonTar,
+        ExportFileFormat.ZIP_JSONL: ReaderJsonLinesZip,
+        ExportFileFormat.ZIP_SQLITE: ReaderSqliteZip,
+        ExportFileFormat.TAR_ZSTD: ReaderJsonTarZstd,
         'folder': ReaderJsonFolder,
     }
 
@@ -212,6 +228,28 @@ class ArchiveReaderAbstract(ABC):
         """
         return next(self.iter_node_repos([uuid]))
 
+    def copy_node_repos(self,
+                        uuids: List[str],
+                        destination: Callable[[str], Folder],
+                        max_workers: int = 1) -> Iterator[str]:
+        """Copy the repositories of the given nodes to their destination folders.
+
+        By default, the repositories are extracted to temporary folders by :meth:`iter_node_repos` and then moved.
+        Readers should override this method to copy the files directly from the archive, if the format allows it.
+
+        :param uuids: UUIDs of the nodes whose repositories to copy
+        :param destination: a function returning the folder to copy the repository of a node to, given its UUID;
+            the current content of this folder is replaced
+        :param max_workers: the maximum number of threads to use, if the reader can copy repositories concurrently
+        :return: an iterator over the UUIDs of the nodes, once their repository is copied
+
+        :raises `~aiida.tools.importexport.common.exceptions.CorruptArchive`: If a repository does not exist.
+        """
+        # pylint: disable=unused-argument
+        for uuid, folder in zip(uuids, self.iter_node_repos(uuids)):
+            destination(uuid).replace_with_folder(folder.abspath, move=True, overwrite=True)
+            yield uuid
+
 
 class ReaderJsonBase(ArchiveReaderAbstract):
     """A reader base for the JSON compressed formats."""
@@ -418,6 +456,280 @@ class ReaderJsonZip(ReaderJsonBase):
         except NotADirectoryError as error:
             raise CorruptArchive(f'Unable to find required folder in archive: {error}')
 
+    def copy_node_repos(self,
+                        uuids: List[str],
+                        destination: Callable[[str], Folder],
+                        max_workers: int = 1) -> Iterator[str]:
+        """Copy the repositories of the given nodes directly from the zip file to their destination folders.
+
+        The members of each repository are decompressed by a pool of threads, which share the zip file.
+        """
+        self.assert_within_context()
+        prefixes = _get_repository_prefixes(self.REPO_FOLDER, uuids)
+        if not prefixes:
+            return
+        depth = len(next(iter(prefixes)).split('/'))
+        try:
+            zip_file = zipfile.ZipFile(self.filename, 'r', allow_zip64=True)
+        except zipfile.BadZipfile as error:
+            raise CorruptArchive(f'The input file cannot be read: {error}')
+
+        with zip_file:
+            members: Dict[str, List[zipfile.ZipInfo]] = {prefix: [] for prefix in prefixes}
+            for info in zip_file.infolist():
+                prefix = '/'.join(info.filename.split('/')[:depth])
+                if prefix in members:
+                    members[prefix].append(info)
+            for prefix, infos in members.items():
+                if not infos:
+                    raise CorruptArchive(f'Unable to find required folder in archive: {prefix}')
+
+            # opening and closing the members is not thread-safe, only reading them is
+            lock = threading.Lock()
+            pending: Deque[Tuple[str, Future]] = deque()
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                try:
+                    for prefix, uuid in prefixes.items():
+                        pending.append((
+                            uuid,
+                            executor.submit(
+                                _copy_zip_members, zip_file, lock, members.pop(prefix), prefix, destination(uuid)
+                            )
+                        ))
+                        if len(pending) > 2 * max_workers:
+                            uuid, future = pending.popleft()
+                            future.result()
+                            yield uuid
+                    while pending:
+                        uuid, future = pending.popleft()
+                        future.result()
+                        yield uuid
+                except BaseException:
+                    for _, future in pending:
+                        future.cancel()
+                    raise
+
+
+class ReaderJsonLinesZip(ReaderJsonZip):
+    """A reader for a JSON lines zip compressed format.
+
+    The database records are streamed from the archive line by line, so that they are never loaded in memory at once.
+    """
+
+    FILENAME_LINKS = 'links.jsonl'
+    FILENAME_GROUPS = 'groups.jsonl'
+    FILENAME_INDEX = 'index.json'
+
+    def __init__(self, filename: str, sandbox_in_repo: bool = False, **kwargs: Any):
+        super().__init__(filename, sandbox_in_repo=sandbox_in_repo, **kwargs)
+        self._index: Optional[Dict[str, Any]] = None
+
+    def __exit__(
+        self, exctype: Optional[Type[BaseException]], excinst: Optional[BaseException], exctb: Optional[TracebackType]
+    ):
+        self._index = None
+        super().__exit__(exctype, excinst, exctb)
+
+    @property
+    def file_format_verbose(self) -> str:
+        return 'JSON lines (zip compressed)'
+
+    def _get_index(self) -> Dict[str, Any]:
+        """Retrieve the index of the database records."""
+        if self._index is None:
+            try:
+                self._index = json.loads(
+                    read_file_in_zip(self.filename, f'{RECORDS_EXPORT_SUBFOLDER}/{self.FILENAME_INDEX}')
+                )
+            except (IOError, FileNotFoundError) as error:
+                raise CorruptArchive(str(error))
+        return self._index  # type: ignore
+
+    def _iter_records(self, filename: str) -> Iterator[Any]:
+        """Iterate over the records of a record file, reading the file line by line."""
+        path = f'{RECORDS_EXPORT_SUBFOLDER}/{filename}'
+        try:
+            with ZipFileExtra(self.filename, 'r', name_to_info=FilteredZipInfo({path})) as zip_file:
+                try:
+                    handle = zip_file.open(path)
+                except KeyError:
+                    raise CorruptArchive(f'required file `{path}` is not included')
+                with io.TextIOWrapper(handle, encoding='utf8') as text_handle:
+                    for line in text_handle:
+                        yield json.loads(line)
+        except zipfile.BadZipfile as error:
+            raise CorruptArchive(f'The input file cannot be read: {error}')
+
+    def _get_data(self):
+        """Retrieve the data in the format of the ``data.json`` of the JSON formats.
+
+        .. warning:: this loads all database records in memory and should only be used for inspection.
+        """
+        if self._data is None:
+            data: Dict[str, Any] = {
+                'node_attributes': {},
+                'node_extras': {},
+                'export_data': {},
+                'links_uuid': list(self.iter_link_data()),
+                'groups_uuid': dict(self._iter_records(self.FILENAME_GROUPS)),
+            }
+            for name in self._get_index()['entity_counts']:
+                for pk, fields in self._iter_records(f'{name}.jsonl'):
+                    if name == NODE_ENTITY_NAME:
+                        data['node_attributes'][str(pk)] = fields.pop('attributes')
+                        data['node_extras'][str(pk)] = fields.pop('extras')
+                    data['export_data'].setdefault(name, {})[str(pk)] = fields
+            self._data = data  # type: ignore
+        return self._data
+
+    def entity_count(self, name: str) -> int:
+        return self._get_index()['entity_counts'].get(name, 0)
+
+    @property
+    def link_count(self) -> int:
+        return self._get_index()['link_count']
+
+    def iter_entity_fields(self,
+                           name: str,
+                           fields: Optional[Tuple[str, ...]] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        if name not in self.entity_names:
+            raise ValueError(f'Unknown entity name: {name}')
+        if not self.entity_count(name):
+            return
+        for pk, all_fields in self._iter_records(f'{name}.jsonl'):
+            if name == NODE_ENTITY_NAME:
+                if 'attributes' not in all_fields:
+                    raise CorruptArchive(f'Unable to find attributes info for Node with Pk={pk}')
+                if 'extras' not in all_fields:
+                    raise CorruptArchive(f'Unable to find extra info for Node with Pk={pk}')
+            if fields is not None:
+                all_fields = {k: v for k, v in all_fields.items() if k in fields}
+            yield int(pk), all_fields
+
+    def iter_group_uuids(self) -> Iterator[Tuple[str, Set[str]]]:
+        yielded = set()
+        for group_uuid, node_uuids in self._iter_records(self.FILENAME_GROUPS):
+            yielded.add(group_uuid)
+            yield group_uuid, set(node_uuids)
+        # groups that contain no nodes have no record
+        for _, fields in self.iter_entity_fields(GROUP_ENTITY_NAME, fields=('uuid',)):
+            if fields['uuid'] not in yielded:
+                yield fields['uuid'], set()
+
+    def iter_link_data(self) -> Iterator[dict]:
+        for value in self._iter_records(self.FILENAME_LINKS):
+            yield value
+
+
+class ReaderSqliteZip(ReaderJsonZip):
+    """A reader for an SQLite zip compressed format.
+
+    Only the SQLite database is extracted from the archive to answer queries on the database records,
+    the node repositories are extracted on demand.
+    """
+
+    FILENAME_DATABASE = 'data.sqlite'
+
+    def __init__(self, filename: str, sandbox_in_repo: bool = False, **kwargs: Any):
+        super().__init__(filename, sandbox_in_repo=sandbox_in_repo, **kwargs)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def __exit__(
+        self, exctype: Optional[Type[BaseException]], excinst: Optional[BaseException], exctb: Optional[TracebackType]
+    ):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        super().__exit__(exctype, excinst, exctb)
+
+    @property
+    def file_format_verbose(self) -> str:
+        return 'SQLite (zip compressed)'
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return a connection to the archive database, extracting it from the archive if necessary."""
+        self.assert_within_context()
+        assert self._sandbox is not None  # required by mypy
+        if self._connection is None:
+            path = f'{RECORDS_EXPORT_SUBFOLDER}/{self.FILENAME_DATABASE}'
+            database_path = os.path.join(self._sandbox.abspath, self.FILENAME_DATABASE)
+            try:
+                with ZipFileExtra(self.filename, 'r', name_to_info=FilteredZipInfo({path})) as zip_file:
+                    with zip_file.open(path) as source, open(database_path, 'wb') as target:
+                        shutil.copyfileobj(source, target)
+            except zipfile.BadZipfile as error:
+                raise CorruptArchive(f'The input file cannot be read: {error}')
+            except KeyError:
+                raise CorruptArchive(f'required file `{path}` is not included')
+            self._connection = sqlite3.connect(database_path)
+        return self._connection
+
+    def _get_data(self):
+        """Retrieve the data in the format of the ``data.json`` of the JSON formats.
+
+        .. warning:: this loads all database records in memory and should only be used for inspection.
+        """
+        if self._data is None:
+            data: Dict[str, Any] = {
+                'node_attributes': {},
+                'node_extras': {},
+                'export_data': {},
+                'links_uuid': list(self.iter_link_data()),
+                'groups_uuid': {},
+            }
+            for name, pk, fields in self._get_connection().execute('SELECT name, pk, fields FROM entities'):
+                fields = json.loads(fields)
+                if name == NODE_ENTITY_NAME:
+                    data['node_attributes'][str(pk)] = fields.pop('attributes')
+                    data['node_extras'][str(pk)] = fields.pop('extras')
+                data['export_data'].setdefault(name, {})[str(pk)] = fields
+            query = self._get_connection().execute('SELECT group_uuid, node_uuid FROM group_nodes')
+            for group_uuid, node_uuid in query:
+                data['groups_uuid'].setdefault(group_uuid, []).append(node_uuid)
+            self._data = data  # type: ignore
+        return self._data
+
+    def entity_count(self, name: str) -> int:
+        return self._get_connection().execute('SELECT COUNT(*) FROM entities WHERE name = ?', (name,)).fetchone()[0]
+
+    @property
+    def link_count(self) -> int:
+        return self._get_connection().execute('SELECT COUNT(*) FROM links').fetchone()[0]
+
+    def iter_entity_fields(self,
+                           name: str,
+                           fields: Optional[Tuple[str, ...]] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        if name not in self.entity_names:
+            raise ValueError(f'Unknown entity name: {name}')
+        query = self._get_connection().execute('SELECT pk, fields FROM entities WHERE name = ? ORDER BY pk', (name,))
+        for pk, all_fields in query:
+            all_fields = json.loads(all_fields)
+            if name == NODE_ENTITY_NAME:
+                if 'attributes' not in all_fields:
+                    raise CorruptArchive(f'Unable to find attributes info for Node with Pk={pk}')
+                if 'extras' not in all_fields:
+                    raise CorruptArchive(f'Unable to find extra info for Node with Pk={pk}')
+            if fields is not None:
+                all_fields = {k: v for k, v in all_fields.items() if k in fields}
+            yield pk, all_fields
+
+    def iter_node_uuids(self) -> Iterator[str]:
+        query = self._get_connection().execute('SELECT identifier FROM entities WHERE name = ?', (NODE_ENTITY_NAME,))
+        for uuid, in query:
+            yield uuid
+
+    def iter_group_uuids(self) -> Iterator[Tuple[str, Set[str]]]:
+        connection = self._get_connection()
+        for group_uuid, in connection.execute('SELECT identifier FROM entities WHERE name = ?', (GROUP_ENTITY_NAME,)):
+            query = connection.execute('SELECT node_uuid FROM group_nodes WHERE group_uuid = ?', (group_uuid,))
+            yield group_uuid, {node_uuid for node_uuid, in query}
+
+    def iter_link_data(self) -> Iterator[dict]:
+        for input_uuid, output_uuid, label, link_type in self._get_connection().execute(
+            'SELECT input, output, label, type FROM links'
+        ):
+            yield {'input': input_uuid, 'output': output_uuid, 'label': label, 'type': link_type}
+
 
 class ReaderJsonTar(ReaderJsonBase):
     """A reader for a JSON tar compressed format."""
@@ -428,20 +740,81 @@ class ReaderJsonTar(ReaderJsonBase):
 
     def _get_metadata(self):
         if self._metadata is None:
-            try:
-                self._metadata = json.loads(read_file_in_tar(self.filename, self.FILENAME_METADATA))
-            except (IOError, FileNotFoundError) as error:
-                raise CorruptArchive(str(error))
+            self._metadata = json.loads(self._read_file(self.FILENAME_METADATA))
         return self._metadata
 
     def _get_data(self):
         if self._data is None:
-            try:
-                self._data = json.loads(read_file_in_tar(self.filename, self.FILENAME_DATA))
-            except (IOError, FileNotFoundError) as error:
-                raise CorruptArchive(str(error))
+            self._data = json.loads(self._read_file(self.FILENAME_DATA))
         return self._data
 
+    def _read_file(self, path: str) -> str:
+        """Read a text file from the tar file."""
+        try:
+            return cast(str, read_file_in_tar(self.filename, path))
+        except (IOError, FileNotFoundError) as error:
+            raise CorruptArchive(str(error))
+
+    @contextmanager
+    def _open_tar(self) -> Iterator[Tuple[tarfile.TarFile, IO[bytes]]]:
+        """Open the tar file as a stream, and return it together with the handle of the compressed file."""
+        try:
+            with open(self.filename, 'rb') as handle:
+                with tarfile.open(fileobj=handle, mode='r|*', format=tarfile.PAX_FORMAT) as tar:
+                    yield tar, handle
+        except tarfile.TarError as error:
+            raise CorruptArchive(f'The input file cannot be read: {error}')
+
+    def copy_node_repos(self,
+                        uuids: List[str],
+                        destination: Callable[[str], Folder],
+                        max_workers: int = 1) -> Iterator[str]:
+        """Copy the repositories of the given nodes directly from the tar file to their destination folders.
+
+        The tar file is read once, as a stream, and the repositories are yielded in the order of the archive.
+        """
+        self.assert_within_context()
+        prefixes = _get_repository_prefixes(self.REPO_FOLDER, uuids)
+        if not prefixes:
+            return
+        depth = len(next(iter(prefixes)).split('/'))
+        folders: Dict[str, Folder] = {}
+        current = None
+
+        with self._open_tar() as (tar, _):
+            while True:
+                member = tar.next()
+                if member is None:
+                    break
+                # only the current member of the stream is required
+                tar.members = []
+                name = posixpath.normpath(member.name)
+                prefix = '/'.join(name.split('/')[:depth])
+                if prefix not in prefixes:
+                    continue
+                if prefix != current:
+                    if current is not None:
+                        yield prefixes[current]
+                    current = prefix
+                if prefix not in folders:
+                    folders[prefix] = destination(prefixes[prefix])
+                    folders[prefix].erase()
+                    folders[prefix].create()
+                path = _join_member_path(folders[prefix].abspath, name[len(prefix):])
+                # links and devices are skipped, as when extracting the archive
+                if member.isdir():
+                    os.makedirs(path, exist_ok=True)
+                elif member.isfile():
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with cast(IO[bytes], tar.extractfile(member)) as source, open(path, 'wb') as handle:
+                        shutil.copyfileobj(source, handle)
+
+        for prefix in prefixes:
+            if prefix not in folders:
+                raise CorruptArchive(f'Unable to find required folder in archive: {prefix}')
+        if current is not None:
+            yield prefixes[current]
+
     def _extract(self, *, path_prefix: str, callback: Callable[[str, Any], None] = null_callback):
         self.assert_within_context()
         assert self._sandbox is not None  # required by mypy
@@ -459,6 +832,69 @@ class ReaderJsonTar(ReaderJsonBase):
             raise CorruptArchive(f'Unable to find required folder in archive: {error}')
 
 
+class ReaderJsonTarZstd(ReaderJsonTar):
+    """A reader for a JSON tar format compressed with Zstandard.
+
+    Since a Zstandard compressed file can only be decompressed sequentially, the tar file is read as a stream.
+    """
+
+    @property
+    def file_format_verbose(self) -> str:
+        return 'JSON (tar.zst compressed)'
+
+    @contextmanager
+    def _open_tar(self) -> Iterator[Tuple[tarfile.TarFile, IO[bytes]]]:
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError(f'{str(exc)}. You need to install the zstandard package.')
+        try:
+            with open(self.filename, 'rb') as handle:
+                with zstandard.ZstdDecompressor().stream_reader(handle) as stream:
+                    with tarfile.open(fileobj=stream, mode='r|', format=tarfile.PAX_FORMAT) as tar:
+                        yield tar, handle
+        except (tarfile.TarError, zstandard.ZstdError) as error:
+            raise CorruptArchive(f'The input file cannot be read: {error}')
+
+    def _read_file(self, path: str) -> str:
+        with self._open_tar() as (tar, _):
+            while True:
+                member = tar.next()
+                if member is None:
+                    break
+                if member.name == path and member.isfile():
+                    return cast(IO[bytes], tar.extractfile(member)).read().decode('utf8')
+                # only the current member of the stream is required
+                tar.members = []
+        raise CorruptArchive(f'required file `{path}` is not included')
+
+    def _extract(self, *, path_prefix: str, callback: Callable[[str, Any], None] = null_callback):
+        self.assert_within_context()
+        assert self._sandbox is not None  # required by mypy
+        path_prefix = path_prefix.rstrip('/')
+        found = False
+        callback('init', {'total': os.path.getsize(self.filename), 'description': 'Extracting repository files'})
+        with self._open_tar() as (tar, handle):
+            position = 0
+            while True:
+                member = tar.next()
+                if member is None:
+                    break
+                callback('update', handle.tell() - position)
+                position = handle.tell()
+                tar.members = []
+                if member.name != path_prefix and not member.name.startswith(f'{path_prefix}/'):
+                    continue
+                found = True
+                if member.isdev() or member.islnk() or member.issym():
+                    continue
+                if os.path.isabs(member.name) or '..' in member.name.split('/'):
+                    raise CorruptArchive(f'Invalid path in archive: {member.name}')
+                tar.extract(member, self._sandbox.abspath)
+        if not found:
+            raise CorruptArchive(f'Unable to find required folder in archive: {path_prefix}')
+
+
 class ReaderJsonFolder(ReaderJsonBase):
     """A reader for a JSON plain folder format."""
 
@@ -489,3 +925,55 @@ class ReaderJsonFolder(ReaderJsonBase):
         # By copying the contents of the source directory, we do not risk to modify the source files accidentally
         # Use path_prefix? or is this quick enough to not worry
         self._sandbox.replace_with_folder(self.filename, overwrite=True)
+
+    def copy_node_repos(self,
+                        uuids: List[str],
+                        destination: Callable[[str], Folder],
+                        max_workers: int = 1) -> Iterator[str]:
+        """Copy the repositories of the given nodes directly from the folder to their destination folders."""
+        self.assert_within_context()
+        for prefix, uuid in _get_repository_prefixes(self.REPO_FOLDER, uuids).items():
+            source = os.path.join(self.filename, *prefix.split('/'))
+            if not os.path.isdir(source):
+                raise CorruptArchive(f'Unable to find required folder in archive: {prefix}')
+            destination(uuid).replace_with_folder(source, overwrite=True)
+            yield uuid
+
+
+def _get_repository_prefixes(repo_folder: str, uuids: Iterable[str]) -> Dict[str, str]:
+    """Return the mapping of the paths of the node repositories within the archive to the node UUIDs."""
+    return {f'{repo_folder}/{export_shard_uuid(uuid)}': uuid for uuid in uuids}
+
+
+def _join_member_path(folder: str, relpath: str) -> str:
+    """Return the path, within the folder a node repository is copied to, of a member of this repository.
+
+    :param relpath: the path of the member relative to the node repository, with posix separators
+    :raises `~aiida.tools.importexport.common.exceptions.CorruptArchive`: If the path is outside of the repository.
+    """
+    parts = [part for part in relpath.split('/') if part not in ('', '.')]
+    if '..' in parts:
+        raise CorruptArchive(f'Invalid path in archive: {relpath}')
+    return os.path.join(folder, *parts)
+
+
+def _copy_zip_members(
+    zip_file: zipfile.ZipFile, lock: threading.Lock, members: List[zipfile.ZipInfo], prefix: str, folder: Folder
+):
+    """Copy the members of a node repository from a zip file to the folder of the repository."""
+    folder.erase()
+    folder.create()
+    for info in members:
+        path = _join_member_path(folder.abspath, info.filename[len(prefix):])
+        if info.is_dir():
+            os.makedirs(path, exist_ok=True)
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with lock:
+            source = zip_file.open(info)
+        try:
+            with open(path, 'wb') as handle:
+                shutil.copyfileobj(source, handle)
+        finally:
+            with lock:
+                source.close()
@@ -9,29 +9,40 @@
 ###########################################################################
 """Archive writer classes."""
 from abc import ABC, abstractmethod
+from collections import deque
 from copy import deepcopy
+import io
+import multiprocessing
+from multiprocessing.pool import AsyncResult
 import os
 from pathlib import Path
 import shelve
 import shutil
+import sqlite3
+import struct
 import time
 import tempfile
 from types import TracebackType
-from typing import Any, cast, Dict, List, Optional, Type, Union
+from typing import Any, Callable, cast, Deque, Dict, IO, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
 import zipfile
+import zlib
 
 from archive_path import TarPath, ZipPath
 
 from aiida.common import json
 from aiida.common.exceptions import InvalidOperation
 from aiida.common.folders import Folder
-from aiida.tools.importexport.archive.common import ArchiveMetadata
+from aiida.tools.importexport.archive.common import ArchiveMetadata, null_callback
 from aiida.tools.importexport.common.config import (
-    EXPORT_VERSION, NODE_ENTITY_NAME, NODES_EXPORT_SUBFOLDER, ExportFileFormat
+    EXPORT_VERSION, JSONL_DATA_FORMAT, NODE_ENTITY_NAME, NODES_EXPORT_SUBFOLDER, RECORDS_EXPORT_SUBFOLDER,
+    SQLITE_DATA_FORMAT, ExportFileFormat
 )
 from aiida.tools.importexport.common.utils import export_shard_uuid
 
-__all__ = ('ArchiveWriterAbstract', 'get_writer', 'WriterJsonZip', 'WriterJsonTar', 'WriterJsonFolder')
+__all__ = (
+    'ArchiveWriterAbstract', 'get_writer', 'WriterJsonZip', 'WriterJsonLinesZip', 'WriterSqliteZip', 'WriterJsonTar',
+    'WriterJsonTarZstd', 'WriterJsonFolder'
+)
 
 
 def get_writer(file_format: str) -> Type['ArchiveWriterAbstract']:
@@ -39,6 +50,9 @@ def get_writer(file_format: str) -> Type['ArchiveWriterAbstract']:
     writers = {
         ExportFileFormat.ZIP: WriterJsonZip,
         ExportFileFormat.TAR_GZIPPED: WriterJsonTar,
+        ExportFileFormat.ZIP_JSONL: WriterJsonLinesZip,
+        ExportFileFormat.ZIP_SQLITE: WriterSqliteZip,
+        ExportFileFormat.TAR_ZSTD: WriterJsonTarZstd,
         'folder': WriterJsonFolder,
         'null': WriterNull,
     }
@@ -193,6 +207,27 @@ class ArchiveWriterAbstract(ABC):
 
         """
 
+    def write_node_repo_folders(
+        self,
+        folders: Iterable[Tuple[str, Union[str, Path]]],
+        processes: int = 1,
+        callback: Callable[[str, Any], None] = null_callback
+    ):
+        """Write multiple node repositories to the archive.
+
+        By default the repositories are written one by one, with :meth:`write_node_repo_folder`.
+        Writers that can pack the repositories concurrently should override this method.
+
+        :param folders: iterable of (UUID of the node, path to the repository folder on disk)
+        :param processes: The maximum number of worker processes to use
+        :param callback: a callback to report on the process, called as ``callback('update', 1)``
+            once a repository is written
+
+        """
+        for uuid, path in folders:
+            self.write_node_repo_folder(uuid, path)
+            callback('update', 1)
+
 
 class WriterNull(ArchiveWriterAbstract):
     """A null archive writer, which does not do anything."""
@@ -232,6 +267,9 @@ class WriterJsonZip(ArchiveWriterAbstract):
     which writes database data as a single JSON and repository data in a zipped folder system.
     """
 
+    # the value of the ``data_format`` key in ``metadata.json``, if the database data is not stored as ``data.json``
+    DATA_FORMAT: Optional[str] = None
+
     def __init__(
         self, filepath: Union[str, Path], *, use_compression: bool = True, cache_zipinfo: bool = False, **kwargs
     ):
@@ -269,6 +307,8 @@ class WriterJsonZip(ArchiveWriterAbstract):
         self._archivepath: ZipPath = ZipPath(
             self._temp_path / 'export', mode='w', compression=self._compression, name_to_info=self._zipinfo_cache
         )
+        # the members deflated by worker processes, which are merged with the zip file on close
+        self._deflated: Optional[_DeflatedZipMembers] = None
         # setup data to store
         self._data: Dict[str, Any] = {
             'node_attributes': {},
@@ -282,22 +322,30 @@ class WriterJsonZip(ArchiveWriterAbstract):
         self.assert_within_context()
         if excepted:
             self._archivepath.close()
+            if self._deflated is not None:
+                self._deflated.close()
             shutil.rmtree(self._temp_path)
             return
-        # write data.json
-        with self._archivepath.joinpath('data.json').open('wb') as handle:
-            json.dump(self._data, handle)
+        self._write_data()
         # close the zipfile to finalise write
         self._archivepath.close()
         if getattr(self, '_zipinfo_cache', None) is not None:
             self._zipinfo_cache.close()  # type: ignore
             delattr(self, '_zipinfo_cache')
+        archive_path = self._archivepath.filepath
+        if self._deflated is not None:
+            archive_path = self._deflated.merge(archive_path)
         # move the compressed file to the final path
         self._remove_filepath()
-        shutil.move(str(self._archivepath.filepath), str(self.filepath))
+        shutil.move(str(archive_path), str(self.filepath))
         # remove the temporary folder
         shutil.rmtree(self._temp_path)
 
+    def _write_data(self):
+        """Write the database data to the archive, before it is closed."""
+        with self._archivepath.joinpath('data.json').open('wb') as handle:
+            json.dump(self._data, handle)
+
     def write_metadata(self, data: ArchiveMetadata):
         metadata = {
             'export_version': self.export_version,
@@ -312,6 +360,8 @@ class WriterJsonZip(ArchiveWriterAbstract):
             },
             'conversion_info': data.conversion_info
         }
+        if self.DATA_FORMAT is not None:
+            metadata['data_format'] = self.DATA_FORMAT
         with self._archivepath.joinpath('metadata.json').open('wb') as handle:
             json.dump(metadata, handle)
 
@@ -332,6 +382,267 @@ class WriterJsonZip(ArchiveWriterAbstract):
         self.assert_within_context()
         (self._archivepath / NODES_EXPORT_SUBFOLDER / export_shard_uuid(uuid)).puttree(path, check_exists=not overwrite)
 
+    def write_node_repo_folders(
+        self,
+        folders: Iterable[Tuple[str, Union[str, Path]]],
+        processes: int = 1,
+        callback: Callable[[str, Any], None] = null_callback
+    ):
+        """Write multiple node repositories to the archive.
+
+        If ``processes > 1`` and the archive is compressed, the repository files are read and deflated by worker
+        processes, and only the write of the compressed members is done in this process. Since the zip file can only
+        be written with members that it compresses itself, these members are written to a separate file, which is
+        merged with the zip file on close.
+        The number of repositories pending in the workers is bounded, to limit the memory usage.
+
+        :param folders: iterable of (UUID of the node, path to the repository folder on disk)
+        :param processes: The maximum number of worker processes to use
+        :param callback: a callback to report on the process, called as ``callback('update', 1)``
+            once a repository is written
+
+        """
+        self.assert_within_context()
+        if processes <= 1 or self._compression != zipfile.ZIP_DEFLATED:
+            super().write_node_repo_folders(folders, processes, callback)
+            return
+        if self._deflated is None:
+            self._deflated = _DeflatedZipMembers(self._temp_path / 'deflated')
+        spool_path = tempfile.mkdtemp(dir=self._temp_path)
+        pending: Deque[AsyncResult] = deque()
+        # the worker processes are spawned rather than forked, since this process may hold database connections and
+        # threads; on exit, the pool terminates the workers that are still running
+        with multiprocessing.get_context('spawn').Pool(processes) as pool:
+            for uuid, path in folders:
+                arcname = f'{NODES_EXPORT_SUBFOLDER}/{export_shard_uuid(uuid)}'
+                pending.append(pool.apply_async(_deflate_folder, (str(path), arcname, spool_path)))
+                if len(pending) > 2 * processes:
+                    self._deflated.write(pending.popleft().get())
+                    callback('update', 1)
+            while pending:
+                self._deflated.write(pending.popleft().get())
+                callback('update', 1)
+        shutil.rmtree(spool_path)
+
+
+class WriterJsonLinesZip(WriterJsonZip):
+    """An archive writer,
+    which streams database data as JSON lines records and writes repository data in a zipped folder system.
+
+    Contrary to ``WriterJsonZip``, no database data is held in memory: every entity, link and group record is appended
+    to a record file in a temporary folder as soon as it is written. The record files are added to the zip file before
+    the first node repository, or on close, so that readers can find them quickly in the zip file index.
+    The record files are stored in the ``data`` folder of the archive:
+
+    - ``<ENTITY_NAME>.jsonl``: one ``[pk, fields]`` record per entity (node fields include attributes and extras)
+    - ``links.jsonl``: one ``{'input': <UUID>, 'output': <UUID>, 'label': <LABEL>, 'type': <TYPE>}`` record per link
+    - ``groups.jsonl``: one ``[group_uuid, [node_uuid, ...]]`` record per group
+    - ``index.json``: the number of records per entity and the number of links
+
+    """
+
+    DATA_FORMAT = JSONL_DATA_FORMAT
+    FILENAME_LINKS = 'links.jsonl'
+    FILENAME_GROUPS = 'groups.jsonl'
+    FILENAME_INDEX = 'index.json'
+
+    @property
+    def file_format_verbose(self) -> str:
+        return f'JSON lines Zip (compression={self._compression})'
+
+    def open(self):
+        # pylint: disable=attribute-defined-outside-init
+        super().open()
+        self._records_path: Path = self._temp_path / RECORDS_EXPORT_SUBFOLDER
+        self._records_path.mkdir()
+        self._record_handles: Dict[str, IO[str]] = {}
+        self._entity_counts: Dict[str, int] = {}
+        self._link_count: int = 0
+        self._records_written: bool = False
+
+    def close(self, excepted: bool):
+        if excepted:
+            self._close_record_handles()
+        super().close(excepted)
+
+    def _close_record_handles(self):
+        """Close all open record files."""
+        for handle in self._record_handles.values():
+            handle.close()
+        self._record_handles = {}
+
+    def _write_record(self, filename: str, record: Any):
+        """Append a single record to a record file."""
+        self.assert_within_context()
+        if self._records_written:
+            raise InvalidOperation('database records cannot be written after the node repositories')
+        if filename not in self._record_handles:
+            self._record_handles[filename] = (self._records_path / filename).open('w', encoding='utf8')
+        self._record_handles[filename].write(json.dumps(record) + '\n')
+
+    def _write_data(self):
+        """Add the record files and their index to the zip file, if this was not yet done."""
+        if self._records_written:
+            return
+        self._close_record_handles()
+        for filename in (self.FILENAME_LINKS, self.FILENAME_GROUPS):
+            (self._records_path / filename).touch()
+        (self._records_path / self.FILENAME_INDEX).write_text(
+            json.dumps({
+                'entity_counts': self._entity_counts,
+                'link_count': self._link_count
+            }), encoding='utf8'
+        )
+        for path in sorted(self._records_path.iterdir()):
+            (self._archivepath / RECORDS_EXPORT_SUBFOLDER / path.name).putfile(path)
+            path.unlink()
+        self._records_written = True
+
+    def write_link(self, data: Dict[str, str]):
+        self._write_record(self.FILENAME_LINKS, data)
+        self._link_count += 1
+
+    def write_group_nodes(self, uuid: str, node_uuids: List[str]):
+        self._write_record(self.FILENAME_GROUPS, [uuid, node_uuids])
+
+    def write_entity_data(self, name: str, pk: int, id_key: str, fields: Dict[str, Any]):
+        self._write_record(f'{name}.jsonl', [pk, fields])
+        self._entity_counts[name] = self._entity_counts.get(name, 0) + 1
+
+    def write_node_repo_folder(self, uuid: str, path: Union[str, Path], overwrite: bool = True):
+        self.assert_within_context()
+        self._write_data()
+        super().write_node_repo_folder(uuid, path, overwrite)
+
+    def write_node_repo_folders(
+        self,
+        folders: Iterable[Tuple[str, Union[str, Path]]],
+        processes: int = 1,
+        callback: Callable[[str, Any], None] = null_callback
+    ):
+        self.assert_within_context()
+        self._write_data()
+        super().write_node_repo_folders(folders, processes, callback)
+
+
+class WriterSqliteZip(WriterJsonZip):
+    """An archive writer,
+    which writes database data to an SQLite database and repository data in a zipped folder system.
+
+    The database ``data/data.sqlite`` contains the tables:
+
+    - ``entities``: ``(name, pk, identifier, fields)``, with the fields of each entity as JSON
+      (node fields include attributes and extras)
+    - ``links``: ``(input, output, label, type)``, with the UUIDs of the linked nodes
+    - ``group_nodes``: ``(group_uuid, node_uuid)``
+
+    It is indexed on the entity name and identifier, on the link nodes and on the group UUID, so that readers can count
+    and select records without loading the full database data in memory.
+    The database is added to the zip file before the first node repository, or on close,
+    so that readers can find it quickly in the zip file index.
+    """
+
+    DATA_FORMAT = SQLITE_DATA_FORMAT
+    FILENAME_DATABASE = 'data.sqlite'
+
+    SCHEMA = (
+        'CREATE TABLE entities (name TEXT NOT NULL, pk INTEGER NOT NULL, identifier TEXT, fields TEXT NOT NULL, '
+        'PRIMARY KEY (name, pk))',
+        'CREATE TABLE links (input TEXT NOT NULL, output TEXT NOT NULL, label TEXT NOT NULL, type TEXT NOT NULL)',
+        'CREATE TABLE group_nodes (group_uuid TEXT NOT NULL, node_uuid TEXT NOT NULL)',
+    )
+    # indexes are created once all records are inserted, which is faster than updating them on every insert
+    INDEXES = (
+        'CREATE INDEX ix_entities_identifier ON entities (name, identifier)',
+        'CREATE INDEX ix_links_input ON links (input)',
+        'CREATE INDEX ix_links_output ON links (output)',
+        'CREATE INDEX ix_group_nodes_group_uuid ON group_nodes (group_uuid)',
+    )
+
+    @property
+    def file_format_verbose(self) -> str:
+        return f'SQLite Zip (compression={self._compression})'
+
+    def open(self):
+        # pylint: disable=attribute-defined-outside-init
+        super().open()
+        self._database_path: Path = self._temp_path / self.FILENAME_DATABASE
+        # the database is a temporary file until it is added to the archive, so durability is not required
+        self._connection: Optional[sqlite3.Connection] = sqlite3.connect(str(self._database_path))
+        self._connection.execute('PRAGMA journal_mode = OFF')
+        self._connection.execute('PRAGMA synchronous = OFF')
+        for statement in self.SCHEMA:
+            self._connection.execute(statement)
+        self._database_written: bool = False
+
+    def close(self, excepted: bool):
+        if excepted and self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        super().close(excepted)
+
+    def _execute(self, statement: str, parameters: Iterable[Any], many: bool = False):
+        """Execute a statement on the archive database.
+
+        :param many: whether ``parameters`` is an iterable of parameter tuples, for which to execute the statement
+        """
+        self.assert_within_context()
+        if self._database_written:
+            raise InvalidOperation('database records cannot be written after the node repositories')
+        assert self._connection is not None  # required by mypy
+        if many:
+            self._connection.executemany(statement, parameters)
+        else:
+            self._connection.execute(statement, parameters)
+
+    def _write_data(self):
+        """Index the database and add it to the zip file, if this was not yet done."""
+        if self._database_written:
+            return
+        assert self._connection is not None  # required by mypy
+        for statement in self.INDEXES:
+            self._connection.execute(statement)
+        self._connection.commit()
+        self._connection.close()
+        self._connection = None
+        (self._archivepath / RECORDS_EXPORT_SUBFOLDER / self.FILENAME_DATABASE).putfile(self._database_path)
+        self._database_path.unlink()
+        self._database_written = True
+
+    def write_link(self, data: Dict[str, str]):
+        self._execute(
+            'INSERT INTO links (input, output, label, type) VALUES (?, ?, ?, ?)',
+            (data['input'], data['output'], data['label'], data['type'])
+        )
+
+    def write_group_nodes(self, uuid: str, node_uuids: List[str]):
+        self._execute(
+            'INSERT INTO group_nodes (group_uuid, node_uuid) VALUES (?, ?)',
+            ((uuid, node_uuid) for node_uuid in node_uuids),
+            many=True
+        )
+
+    def write_entity_data(self, name: str, pk: int, id_key: str, fields: Dict[str, Any]):
+        self._execute(
+            'INSERT INTO entities (name, pk, identifier, fields) VALUES (?, ?, ?, ?)',
+            (name, pk, fields.get(id_key, None), json.dumps(fields))
+        )
+
+    def write_node_repo_folder(self, uuid: str, path: Union[str, Path], overwrite: bool = True):
+        self.assert_within_context()
+        self._write_data()
+        super().write_node_repo_folder(uuid, path, overwrite)
+
+    def write_node_repo_folders(
+        self,
+        folders: Iterable[Tuple[str, Union[str, Path]]],
+        processes: int = 1,
+        callback: Callable[[str, Any], None] = null_callback
+    ):
+        self.assert_within_context()
+        self._write_data()
+        super().write_node_repo_folders(folders, processes, callback)
+
 
 class WriterJsonTar(ArchiveWriterAbstract):
     """An archive writer,
@@ -353,8 +664,8 @@ class WriterJsonTar(ArchiveWriterAbstract):
         self.assert_within_context()
         # create a temporary folder in which to perform the write
         self._temp_path: Path = Path(tempfile.mkdtemp())
-        # open a zipfile in in write mode to export to
-        self._archivepath: TarPath = TarPath(self._temp_path / 'export', mode='w:gz', dereference=True)
+        # open a tarfile in in write mode to export to
+        self._archivepath: TarPath = self._open_archive(self._temp_path / 'export')
         # setup data to store
         self._data: Dict[str, Any] = {
             'node_attributes': {},
@@ -367,21 +678,29 @@ class WriterJsonTar(ArchiveWriterAbstract):
     def close(self, excepted: bool):
         self.assert_within_context()
         if excepted:
-            self._archivepath.close()
+            self._close_archive()
             shutil.rmtree(self._temp_path)
             return
         # write data.json
         with self._archivepath.joinpath('data.json').open('wb') as handle:
             json.dump(self._data, handle)
         # compress
-        # close the zipfile to finalise write
-        self._archivepath.close()
+        # close the tarfile to finalise write
+        self._close_archive()
         # move the compressed file to the final path
         self._remove_filepath()
         shutil.move(str(self._archivepath.filepath), str(self.filepath))
         # remove the temporary folder
         shutil.rmtree(self._temp_path)
 
+    def _open_archive(self, path: Path) -> TarPath:
+        """Open the tar file to write to."""
+        return TarPath(path, mode='w:gz', dereference=True)
+
+    def _close_archive(self):
+        """Close the tar file, to finalise the write."""
+        self._archivepath.close()
+
     def write_metadata(self, data: ArchiveMetadata):
         metadata = {
             'export_version': self.export_version,
@@ -417,6 +736,48 @@ class WriterJsonTar(ArchiveWriterAbstract):
         (self._archivepath / NODES_EXPORT_SUBFOLDER / export_shard_uuid(uuid)).puttree(path, check_exists=not overwrite)
 
 
+class WriterJsonTarZstd(WriterJsonTar):
+    """An archive writer,
+    which writes database data as a single JSON and repository data in a folder system.
+
+    The entire containing folder is then compressed as a tar file with Zstandard, which requires the ``zstandard``
+    package. The compression can use multiple threads, and is much faster than gzip for a similar compression ratio.
+    """
+
+    def __init__(self, filepath: Union[str, Path], *, compression_level: int = 3, threads: int = -1, **kwargs):
+        """Initiate the writer.
+
+        :param filepath: the path to the file to export to.
+        :param compression_level: the Zstandard compression level, from 1 (fastest) to 22 (smallest).
+        :param threads: the number of threads to compress with, or -1 to use as many threads as there are CPUs.
+
+        """
+        super().__init__(filepath, **kwargs)
+        self._compression_level = compression_level
+        self._threads = threads
+
+    @property
+    def file_format_verbose(self) -> str:
+        return f'Zstandard compressed tarball (level={self._compression_level})'
+
+    def _open_archive(self, path: Path) -> TarPath:
+        # pylint: disable=attribute-defined-outside-init
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError(f'{str(exc)}. You need to install the zstandard package.')
+        compressor = zstandard.ZstdCompressor(level=self._compression_level, threads=self._threads)
+        self._archive_handle: IO[bytes] = open(path, 'wb')
+        self._archive_stream = compressor.stream_writer(self._archive_handle)
+        # Zstandard frames are written sequentially, so the tar file is written as a stream
+        return TarPath(path, mode='w|', dereference=True, fileobj=self._archive_stream)
+
+    def _close_archive(self):
+        super()._close_archive()
+        self._archive_stream.close()
+        self._archive_handle.close()
+
+
 class WriterJsonFolder(ArchiveWriterAbstract):
     """An archive writer,
     which writes database data as a single JSON and repository data in a folder system.
@@ -499,3 +860,268 @@ class WriterJsonFolder(ArchiveWriterAbstract):
         self.assert_within_context()
         repo_folder = self._folder.get_subfolder(NODES_EXPORT_SUBFOLDER).get_subfolder(export_shard_uuid(uuid))
         repo_folder.insert_path(src=os.path.abspath(path), dest_name='.', overwrite=overwrite)
+
+
+# the chunk size used to read repository files, and the compressed size above which they are spooled to disk
+_DEFLATE_CHUNK_SIZE = 1024 * 1024
+_DEFLATE_SPOOL_SIZE = 8 * 1024 * 1024
+
+
+class _DeflatedMember(NamedTuple):
+    """A zip file member, deflated by :func:`_deflate_folder`."""
+    zinfo: zipfile.ZipInfo
+    # the compressed content, or the path of the file it was spooled to
+    data: bytes
+    spool: Optional[str]
+
+
+# the maximum values of the 32 and 16 bit fields of the zip file format, which mark a value in a ZIP64 field instead
+_ZIP_UINT32_MAX = 0xFFFFFFFF
+_ZIP_UINT16_MAX = 0xFFFF
+# the values from which the ZIP64 extensions are used for sizes and offsets, and for the number of members
+_ZIP64_LIMIT = _ZIP_UINT32_MAX
+_ZIP_FILECOUNT_LIMIT = _ZIP_UINT16_MAX
+# the general purpose flag for file names encoded as UTF-8, and the header ID of the ZIP64 extra field
+_ZIP_UTF8_FLAG = 0x800
+_ZIP64_EXTRA_ID = 0x0001
+
+
+class _DeflatedZipMembers:
+    """A file of zip file members that were deflated by :func:`_deflate_folder`.
+
+    The ``zipfile`` module can only write members that it compresses itself. The members deflated by the worker
+    processes are therefore written, following the zip file format specification, to a separate file, which is then
+    merged with the zip file written by ``zipfile`` on close, by :meth:`merge`.
+    """
+
+    def __init__(self, path: Path):
+        """Create the file of the members.
+
+        :param path: the path of the file
+        """
+        self._path = path
+        self._handle: IO[bytes] = path.open('w+b')
+        self._infos: List[zipfile.ZipInfo] = []
+
+    def close(self):
+        """Close the file of the members."""
+        self._handle.close()
+
+    def write(self, members: List[_DeflatedMember]):
+        """Write the local file headers and the compressed content of the members."""
+        for member in members:
+            zinfo = member.zinfo
+            zinfo.header_offset = self._handle.tell()
+            self._handle.write(_zip_local_file_header(zinfo))
+            if member.spool is None:
+                self._handle.write(member.data)
+            else:
+                with open(member.spool, 'rb') as handle:
+                    shutil.copyfileobj(handle, self._handle)
+                os.remove(member.spool)
+            self._infos.append(zinfo)
+
+    def merge(self, zip_path: Path) -> Path:
+        """Merge the members with those of a zip file and write the central directory, then close the file.
+
+        The members of the zip file are appended to the file of the members, and come first in the central directory.
+
+        :param zip_path: the path to the zip file
+        :return: the path to the merged zip file
+        """
+        with zipfile.ZipFile(zip_path, 'r') as zip_file:
+            infos = zip_file.infolist()
+        with zip_path.open('rb') as handle:
+            data_end = max((_zip_member_end(handle, zinfo) for zinfo in infos), default=0)
+            handle.seek(0)
+            offset = self._handle.tell()
+            _copy_bytes(handle, self._handle, data_end)
+        for zinfo in infos:
+            zinfo.header_offset += offset
+
+        directory_offset = self._handle.tell()
+        for zinfo in infos + self._infos:
+            self._handle.write(_zip_central_directory_header(zinfo))
+        self._handle.write(
+            _zip_end_of_central_directory(
+                len(infos) + len(self._infos), self._handle.tell() - directory_offset, directory_offset
+            )
+        )
+        self.close()
+        return self._path
+
+
+def _copy_bytes(source: IO[bytes], target: IO[bytes], size: int):
+    """Copy a number of bytes from the current position of one file to another."""
+    while size > 0:
+        chunk = source.read(min(size, _DEFLATE_CHUNK_SIZE))
+        if not chunk:
+            raise IOError('unexpected end of file')
+        target.write(chunk)
+        size -= len(chunk)
+
+
+def _zip_member_end(handle: IO[bytes], zinfo: zipfile.ZipInfo) -> int:
+    """Return the offset of the end of the data of a zip file member, from its local file header."""
+    handle.seek(zinfo.header_offset)
+    header = struct.unpack('<4s5H3L2H', handle.read(30))
+    handle.seek(header[9], os.SEEK_CUR)
+    extra = handle.read(header[10])
+    end = zinfo.header_offset + 30 + header[9] + header[10] + zinfo.compress_size
+    # a data descriptor follows the data of the member, if its sizes were not known when writing the header, whose
+    # sizes are 8 bytes if the local file header has a ZIP64 extra field
+    if zinfo.flag_bits & 0x08:
+        handle.seek(end)
+        end += 4 if handle.read(4) == b'PK\x07\x08' else 0
+        end += 20 if _ZIP64_EXTRA_ID in _zip_extra_ids(extra) else 12
+    return end
+
+
+def _zip_extra_ids(extra: bytes) -> List[int]:
+    """Return the header IDs of the fields of the extra data of a zip file member."""
+    header_ids = []
+    while len(extra) >= 4:
+        header_id, size = struct.unpack('<2H', extra[:4])
+        header_ids.append(header_id)
+        extra = extra[4 + size:]
+    return header_ids
+
+
+def _zip_filename(zinfo: zipfile.ZipInfo) -> Tuple[bytes, int]:
+    """Return the encoded file name and the general purpose flags of a zip file member."""
+    flag_bits = zinfo.flag_bits & ~_ZIP_UTF8_FLAG
+    try:
+        return zinfo.filename.encode('ascii'), flag_bits
+    except UnicodeEncodeError:
+        return zinfo.filename.encode('utf-8'), flag_bits | _ZIP_UTF8_FLAG
+
+
+def _zip_dos_date_time(zinfo: zipfile.ZipInfo) -> Tuple[int, int]:
+    """Return the MS-DOS date and time of a zip file member."""
+    year, month, day, hour, minute, second = zinfo.date_time
+    return (year - 1980) << 9 | month << 5 | day, hour << 11 | minute << 5 | second // 2
+
+
+def _zip_local_file_header(zinfo: zipfile.ZipInfo) -> bytes:
+    """Return the local file header of a zip file member, whose sizes and CRC are known."""
+    filename, flag_bits = _zip_filename(zinfo)
+    dosdate, dostime = _zip_dos_date_time(zinfo)
+    file_size, compress_size = zinfo.file_size, zinfo.compress_size
+    extra = b''
+    version = 20
+    if max(file_size, compress_size) >= _ZIP64_LIMIT:
+        extra = struct.pack('<2H2Q', _ZIP64_EXTRA_ID, 16, file_size, compress_size)
+        file_size = compress_size = _ZIP_UINT32_MAX
+        version = 45
+    return struct.pack(
+        '<4s5H3L2H', b'PK\x03\x04', version, flag_bits, zinfo.compress_type, dostime, dosdate, zinfo.CRC,
+        compress_size, file_size, len(filename), len(extra)
+    ) + filename + extra
+
+
+def _zip_central_directory_header(zinfo: zipfile.ZipInfo) -> bytes:
+    """Return the central directory header of a zip file member."""
+    filename, flag_bits = _zip_filename(zinfo)
+    dosdate, dostime = _zip_dos_date_time(zinfo)
+    file_size, compress_size, header_offset = zinfo.file_size, zinfo.compress_size, zinfo.header_offset
+    zip64_fields = []
+    if file_size >= _ZIP64_LIMIT:
+        zip64_fields.append(file_size)
+        file_size = _ZIP_UINT32_MAX
+    if compress_size >= _ZIP64_LIMIT:
+        zip64_fields.append(compress_size)
+        compress_size = _ZIP_UINT32_MAX
+    if header_offset >= _ZIP64_LIMIT:
+        zip64_fields.append(header_offset)
+        header_offset = _ZIP_UINT32_MAX
+
+    # the ZIP64 extra field of a member read from a zip file is replaced, since its offset has changed
+    extra = b''
+    remaining = zinfo.extra
+    while len(remaining) >= 4:
+        header_id, size = struct.unpack('<2H', remaining[:4])
+        if header_id != _ZIP64_EXTRA_ID:
+            extra += remaining[:4 + size]
+        remaining = remaining[4 + size:]
+    version = zinfo.extract_version
+    if zip64_fields:
+        extra = struct.pack(f'<2H{len(zip64_fields)}Q', _ZIP64_EXTRA_ID, 8 * len(zip64_fields), *zip64_fields) + extra
+        version = max(version, 45)
+
+    return struct.pack(
+        '<4s4B4HL2L5H2L', b'PK\x01\x02', max(version, zinfo.create_version), zinfo.create_system, version, 0,
+        flag_bits, zinfo.compress_type, dostime, dosdate, zinfo.CRC, compress_size, file_size, len(filename),
+        len(extra), len(zinfo.comment), 0, zinfo.internal_attr, zinfo.external_attr, header_offset
+    ) + filename + extra + zinfo.comment
+
+
+def _zip_end_of_central_directory(count: int, size: int, offset: int) -> bytes:
+    """Return the end of central directory record, preceded by the ZIP64 record and locator if they are required.
+
+    :param count: the number of members
+    :param size: the size of the central directory
+    :param offset: the offset of the central directory, which is directly followed by the returned records
+    """
+    records = b''
+    if count > _ZIP_FILECOUNT_LIMIT or size >= _ZIP64_LIMIT or offset >= _ZIP64_LIMIT:
+        records = struct.pack('<4sQ2H2L4Q', b'PK\x06\x06', 44, 45, 45, 0, 0, count, count, size, offset)
+        records += struct.pack('<4sLQL', b'PK\x06\x07', 0, offset + size, 1)
+        count, size, offset = min(count, _ZIP_UINT16_MAX), min(size, _ZIP_UINT32_MAX), min(offset, _ZIP_UINT32_MAX)
+    return records + struct.pack('<4s4H2LH', b'PK\x05\x06', 0, 0, count, count, size, offset, 0)
+
+
+def _deflate_folder(path: str, arcname: str, spool_path: str) -> List[_DeflatedMember]:
+    """Deflate a repository folder into zip file members, in the same way as ``ZipPath.puttree``.
+
+    This function is run in the worker processes of :meth:`WriterJsonZip.write_node_repo_folders`.
+
+    :param path: the path to the repository folder on disk
+    :param arcname: the path of the folder within the zip file
+    :param spool_path: the folder in which to spool large compressed files
+
+    """
+    root = Path(path)
+    if not root.is_dir():
+        raise IOError(f'Source is not a directory: {path}')
+    members = [_deflate_directory(root, arcname)]
+    for subpath in root.glob('**/*'):
+        subarcname = f'{arcname}/{subpath.relative_to(root).as_posix()}'
+        if subpath.is_dir():
+            members.append(_deflate_directory(subpath, subarcname))
+        elif subpath.is_file() and not subpath.is_symlink():
+            members.append(_deflate_file(subpath, subarcname, spool_path))
+    return members
+
+
+def _deflate_directory(path: Path, arcname: str) -> _DeflatedMember:
+    """Return the zip file member of a directory."""
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_size = zinfo.CRC = 0
+    return _DeflatedMember(zinfo, b'', None)
+
+
+def _deflate_file(path: Path, arcname: str, spool_path: str) -> _DeflatedMember:
+    """Deflate a file, returning the compressed content in memory or, if large, spooled to disk."""
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    buffer = io.BytesIO()
+    output: IO[bytes] = buffer
+    crc = file_size = 0
+    with path.open('rb') as handle:
+        for chunk in iter(lambda: handle.read(_DEFLATE_CHUNK_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+            output.write(compressor.compress(chunk))
+            if output is buffer and buffer.tell() > _DEFLATE_SPOOL_SIZE:
+                output = tempfile.NamedTemporaryFile(dir=spool_path, delete=False)
+                output.write(buffer.getvalue())
+                buffer = io.BytesIO()
+        output.write(compressor.flush())
+        zinfo.CRC = crc
+        zinfo.file_size = file_size
+        zinfo.compress_size = output.tell()
+    if output is buffer:
+        return _DeflatedMember(zinfo, buffer.getvalue(), None)
+    output.close()
+    return _DeflatedMember(zinfo, b'', output.name)
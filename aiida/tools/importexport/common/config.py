@@ -22,6 +22,9 @@ class ExportFileFormat(str, Enum):
     """Archive file formats"""
     ZIP = 'zip'
     TAR_GZIPPED = 'tar.gz'
+    ZIP_JSONL = 'zip-jsonl'
+    ZIP_SQLITE = 'zip-sqlite'
+    TAR_ZSTD = 'tar.zst'
 
 
 DUPL_SUFFIX = ' (Imported #{})'
@@ -29,6 +32,15 @@ DUPL_SUFFIX = ' (Imported #{})'
 # The name of the subfolder in which the node files are stored
 NODES_EXPORT_SUBFOLDER = 'nodes'
 
+# The name of the subfolder in which the database records of a JSON lines archive are stored
+RECORDS_EXPORT_SUBFOLDER = 'data'
+
+# The value of the `data_format` key in `metadata.json`, for archives storing their database records as JSON lines
+JSONL_DATA_FORMAT = 'jsonl'
+
+# The value of the `data_format` key in `metadata.json`, for archives storing their database records in SQLite
+SQLITE_DATA_FORMAT = 'sqlite'
+
 # Giving names to the various entities. Attributes and links are not AiiDA
 # entities but we will refer to them as entities in the file (to simplify
 # references to them).
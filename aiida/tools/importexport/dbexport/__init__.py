@@ -22,6 +22,7 @@ from typing import (
     DefaultDict,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -42,6 +43,7 @@ from aiida.common.log import LOG_LEVEL_REPORT
 from aiida.common.progress_reporter import get_progress_reporter
 from aiida.common.warnings import AiidaDeprecationWarning
 from aiida.orm.utils._repository import Repository
+from aiida.orm.utils.links import LinkQuadruple
 from aiida.tools.importexport.common import (
     exceptions,
 )
@@ -68,7 +70,9 @@ from aiida.tools.importexport.dbexport.utils import (
     check_process_nodes_sealed,
     deprecated_parameters,
     fill_in_query,
+    get_export_manifest,
     serialize_dict,
+    serialize_field,
     summary,
 )
 
@@ -88,6 +92,8 @@ def export(
     forbidden_licenses: Optional[Union[list, Callable]] = None,
     writer_init: Optional[Dict[str, Any]] = None,
     batch_size: int = 100,
+    processes: int = 1,
+    incremental_from: Optional[Iterable[str]] = None,
     **traversal_rules: bool,
 ) -> ArchiveWriterAbstract:
     """Export AiiDA data to an archive file.
@@ -145,6 +151,17 @@ def export(
 
     :param batch_size: batch database query results in sub-collections to reduce memory usage
 
+    :param processes: the maximum number of worker processes used to compress the node repositories,
+        if supported by the writer. The worker processes are spawned, so a script that exports with more than one
+        process needs to guard its main code with ``if __name__ == '__main__':``
+
+    :param incremental_from: paths to previous archives of the profile, or to export manifests of these
+        (see :func:`~aiida.tools.importexport.dbexport.utils.write_export_manifest`).
+        If given, only the nodes, comments and logs that are new or were modified since are written,
+        together with the links from or to these nodes, and the unmodified nodes at the other end of these links.
+        Only the repositories of new nodes are written, and the archive can only be imported after the archives
+        it is based on.
+
     :param traversal_rules: graph traversal rules. See :const:`aiida.common.links.GraphTraversalRules`
         what rule names are toggleable and what the defaults are.
 
@@ -234,6 +251,11 @@ def export(
 
     EXPORT_LOGGER.debug('STARTING EXPORT...')
 
+    manifest = None
+    if incremental_from is not None:
+        EXPORT_LOGGER.debug('READING EXPORT MANIFEST...')
+        manifest = get_export_manifest(incremental_from)
+
     all_fields_info, unique_identifiers = get_all_fields_info()
     entities_starting_set, given_node_entry_ids = _get_starting_node_ids(entities)
 
@@ -274,15 +296,23 @@ def export(
                     'in': node_ids_to_be_exported
                 }},
             )
-            node_pk_2_uuid_mapping = dict(qbuilder.all(batch_size=batch_size))
+            node_pk_2_uuid_mapping = dict(qbuilder.iterall(batch_size=batch_size))
 
         # check that no nodes are being exported with incorrect licensing
         _check_node_licenses(node_ids_to_be_exported, allowed_licenses, forbidden_licenses)
 
+        # for an incremental export, only write the nodes and links that are not yet in the previous exports
+        links = traverse_output['links']
+        node_ids_to_be_written = node_ids_to_be_exported
+        if manifest is not None:
+            node_ids_to_be_written, links = _get_incremental_nodes(
+                node_ids_to_be_exported, links, node_pk_2_uuid_mapping, manifest[NODE_ENTITY_NAME]
+            )
+
         # write the link data
-        if traverse_output['links'] is not None:
-            with get_progress_reporter()(total=len(traverse_output['links']), desc='Writing links') as progress:
-                for link in traverse_output['links']:
+        if links is not None:
+            with get_progress_reporter()(total=len(links), desc='Writing links') as progress:
+                for link in links:
                     progress.update()
                     writer_context.write_link({
                         'input': node_pk_2_uuid_mapping[link.source_id],
@@ -298,6 +328,8 @@ def export(
             node_pk_2_uuid_mapping,
             include_comments,
             include_logs,
+            node_ids_to_be_written=node_ids_to_be_written,
+            manifest=manifest,
         )
 
         total_entities = sum(query.count() for query in entity_queries.values())
@@ -320,16 +352,27 @@ def export(
             EXPORT_LOGGER.debug('Writing group UUID -> [nodes UUIDs]')
 
             _write_group_mappings(
-                group_pks=exported_entity_pks[GROUP_ENTITY_NAME], batch_size=batch_size, writer=writer_context
+                group_pks=exported_entity_pks[GROUP_ENTITY_NAME],
+                batch_size=batch_size,
+                writer=writer_context,
+                node_uuids=None if manifest is None else
+                {node_pk_2_uuid_mapping[pk] for pk in exported_entity_pks[NODE_ENTITY_NAME]},
             )
 
         # copy all required node repositories
-        if exported_entity_pks[NODE_ENTITY_NAME]:
+        repository_node_pks = exported_entity_pks[NODE_ENTITY_NAME]
+        if manifest is not None:
+            repository_node_pks = {
+                pk for pk in repository_node_pks if node_pk_2_uuid_mapping[pk] not in manifest[NODE_ENTITY_NAME]
+            }
+
+        if repository_node_pks:
 
             _write_node_repositories(
-                node_pks=exported_entity_pks[NODE_ENTITY_NAME],
+                node_pks=repository_node_pks,
                 node_pk_2_uuid_mapping=node_pk_2_uuid_mapping,
-                writer=writer_context
+                writer=writer_context,
+                processes=processes,
             )
 
         EXPORT_LOGGER.info('Finalizing Export...')
@@ -397,7 +440,7 @@ def _get_starting_node_ids(entities: List[Any]) -> Tuple[DefaultDict[str, Set[st
             with get_progress_reporter()(desc='Collecting nodes in groups', total=node_count) as progress:
 
                 pks, uuids = [], []
-                for pk, uuid in node_query.all():
+                for pk, uuid in node_query.iterall():
                     progress.update()
                     pks.append(pk)
                     uuids.append(uuid)
@@ -455,9 +498,17 @@ def _collect_entity_queries(
     node_pk_2_uuid_mapping: Dict[int, str],
     include_comments: bool = True,
     include_logs: bool = True,
+    node_ids_to_be_written: Optional[Set[int]] = None,
+    manifest: Optional[Dict[str, Dict[str, Optional[str]]]] = None,
 ) -> Dict[str, orm.QueryBuilder]:
-    """Gather partial queries for all entities to export."""
-    # pylint: disable=too-many-locals
+    """Gather partial queries for all entities to export.
+
+    For an incremental export, ``node_ids_to_be_written`` are the nodes to write and ``manifest`` is the manifest of
+    the previous exports, which is used to exclude the unmodified comments and logs.
+    """
+    # pylint: disable=too-many-locals,too-many-branches
+    if node_ids_to_be_written is None:
+        node_ids_to_be_written = node_ids_to_be_exported
     given_log_entry_ids = set()
     given_comment_entry_ids = set()
 
@@ -467,15 +518,22 @@ def _collect_entity_queries(
         # Logs
         if include_logs and node_ids_to_be_exported:
             # Get related log(s) - universal for all nodes
-            builder = orm.QueryBuilder()
-            builder.append(
-                orm.Log,
-                filters={'dbnode_id': {
-                    'in': node_ids_to_be_exported
-                }},
-                project='uuid',
-            )
-            res = set(builder.all(flat=True))
+            if manifest is None:
+                builder = orm.QueryBuilder()
+                builder.append(
+                    orm.Log,
+                    filters={'dbnode_id': {
+                        'in': node_ids_to_be_exported
+                    }},
+                    project='uuid',
+                )
+                res = set(builder.all(flat=True))
+            else:
+                res = _get_modified_uuids(
+                    LOG_ENTITY_NAME, {'dbnode_id': {
+                        'in': node_ids_to_be_exported
+                    }}, manifest[LOG_ENTITY_NAME]
+                )
             given_log_entry_ids.update(res)
 
             progress.update()
@@ -483,23 +541,32 @@ def _collect_entity_queries(
         # Comments
         if include_comments and node_ids_to_be_exported:
             # Get related log(s) - universal for all nodes
-            builder = orm.QueryBuilder()
-            builder.append(
-                orm.Comment,
-                filters={'dbnode_id': {
-                    'in': node_ids_to_be_exported
-                }},
-                project='uuid',
-            )
-            res = set(builder.all(flat=True))
+            if manifest is None:
+                builder = orm.QueryBuilder()
+                builder.append(
+                    orm.Comment,
+                    filters={'dbnode_id': {
+                        'in': node_ids_to_be_exported
+                    }},
+                    project='uuid',
+                )
+                res = set(builder.all(flat=True))
+            else:
+                res = _get_modified_uuids(
+                    COMMENT_ENTITY_NAME, {'dbnode_id': {
+                        'in': node_ids_to_be_exported
+                    }}, manifest[COMMENT_ENTITY_NAME]
+                )
             given_comment_entry_ids.update(res)
 
             progress.update()
 
         # Here we get all the columns that we plan to project per entity that we would like to extract
         given_entities = set(entities_starting_set.keys())
-        if node_ids_to_be_exported:
+        if node_ids_to_be_written:
             given_entities.add(NODE_ENTITY_NAME)
+        elif manifest is not None:
+            given_entities.discard(NODE_ENTITY_NAME)
         if given_log_entry_ids:
             given_entities.add(LOG_ENTITY_NAME)
         if given_comment_entry_ids:
@@ -524,7 +591,10 @@ def _collect_entity_queries(
                 elif given_entity == COMMENT_ENTITY_NAME:
                     entry_uuids_to_add = given_comment_entry_ids
             elif given_entity == NODE_ENTITY_NAME:
-                entry_uuids_to_add.update({node_pk_2_uuid_mapping[_] for _ in node_ids_to_be_exported})
+                if manifest is not None:
+                    # the starting nodes may be unmodified
+                    entry_uuids_to_add = set()
+                entry_uuids_to_add.update({node_pk_2_uuid_mapping[_] for _ in node_ids_to_be_written})
 
             builder = orm.QueryBuilder()
             builder.append(
@@ -611,8 +681,17 @@ def _write_entity_data(
     return exported_entity_pks
 
 
-def _write_group_mappings(*, group_pks: Set[int], batch_size: int, writer: ArchiveWriterAbstract):
-    """Query for node UUIDs in exported groups, and write these these mappings to the archive file."""
+def _write_group_mappings(
+    *,
+    group_pks: Set[int],
+    batch_size: int,
+    writer: ArchiveWriterAbstract,
+    node_uuids: Optional[Set[str]] = None,
+):
+    """Query for node UUIDs in exported groups, and write these these mappings to the archive file.
+
+    :param node_uuids: if given, only write these nodes of the groups (for an incremental export)
+    """
     group_uuid_query = orm.QueryBuilder().append(
         orm.Group,
         filters={
@@ -626,32 +705,89 @@ def _write_group_mappings(*, group_pks: Set[int], batch_size: int, writer: Archi
 
     groups_uuid_to_node_uuids = defaultdict(set)
     for group_uuid, node_uuid in group_uuid_query.iterall(batch_size=batch_size):
-        groups_uuid_to_node_uuids[group_uuid].add(node_uuid)
+        if node_uuids is None or node_uuid in node_uuids:
+            groups_uuid_to_node_uuids[group_uuid].add(node_uuid)
 
     for group_uuid, node_uuids in groups_uuid_to_node_uuids.items():
         writer.write_group_nodes(group_uuid, list(node_uuids))
 
 
+def _get_modified_uuids(entity_name: str, filters: Dict[str, Any], manifest: Dict[str, Optional[str]]) -> Set[str]:
+    """Return the UUIDs of the entities matching the filters, which are not in the manifest of the previous exports,
+    or whose modification time differs from the one in the manifest.
+    """
+    all_fields_info, _ = get_all_fields_info()
+    project = ['uuid', 'mtime'] if 'mtime' in all_fields_info[entity_name] else ['uuid']
+    builder = orm.QueryBuilder().append(entity_names_to_entities[entity_name], filters=filters, project=project)
+
+    modified_uuids = set()
+    for row in builder.iterall():
+        uuid = str(row[0])
+        if uuid not in manifest or (len(row) > 1 and serialize_field(row[1]) != manifest[uuid]):
+            modified_uuids.add(uuid)
+
+    return modified_uuids
+
+
+def _get_incremental_nodes(
+    node_ids_to_be_exported: Set[int],
+    links: Optional[Iterable[LinkQuadruple]],
+    node_pk_2_uuid_mapping: Dict[int, str],
+    manifest: Dict[str, Optional[str]],
+) -> Tuple[Set[int], Optional[List[LinkQuadruple]]]:
+    """Return the nodes and links to write in an incremental export.
+
+    These are the nodes that are new or were modified since the previous exports, the links from or to them,
+    and the unmodified nodes at the other end of these links, which are required to import the links.
+
+    :param manifest: the node entries of the manifest of the previous exports
+    :return: node PKs, links
+    """
+    node_ids_to_be_written: Set[int] = set()
+    if node_ids_to_be_exported:
+        node_uuid_2_pk_mapping = {uuid: pk for pk, uuid in node_pk_2_uuid_mapping.items()}
+        modified_uuids = _get_modified_uuids(NODE_ENTITY_NAME, {'id': {'in': node_ids_to_be_exported}}, manifest)
+        node_ids_to_be_written = {node_uuid_2_pk_mapping[uuid] for uuid in modified_uuids}
+
+    if links is None:
+        return node_ids_to_be_written, None
+
+    links_to_be_written = [
+        link for link in links if link.source_id in node_ids_to_be_written or link.target_id in node_ids_to_be_written
+    ]
+    for link in links_to_be_written:
+        node_ids_to_be_written.update((link.source_id, link.target_id))
+
+    return node_ids_to_be_written, links_to_be_written
+
+
 def _write_node_repositories(
-    *, node_pks: Set[int], node_pk_2_uuid_mapping: Dict[int, str], writer: ArchiveWriterAbstract
+    *, node_pks: Set[int], node_pk_2_uuid_mapping: Dict[int, str], writer: ArchiveWriterAbstract, processes: int = 1
 ):
     """Write all exported node repositories to the archive file."""
     with get_progress_reporter()(total=len(node_pks), desc='Exporting node repositories: ') as progress:
 
-        for pk in node_pks:
+        def iter_folders() -> Iterator[Tuple[str, str]]:
+            for pk in node_pks:
 
-            uuid = node_pk_2_uuid_mapping[pk]
+                uuid = node_pk_2_uuid_mapping[pk]
 
-            progress.set_description_str(f'Exporting node repositories: {pk}', refresh=False)
-            progress.update()
+                progress.set_description_str(f'Exporting node repositories: {pk}', refresh=False)
 
-            src = RepositoryFolder(section=Repository._section_name, uuid=uuid)  # pylint: disable=protected-access
-            if not src.exists():
-                raise exceptions.ArchiveExportError(
-                    f'Unable to find the repository folder for Node with UUID={uuid} '
-                    'in the local repository'
-                )
-            writer.write_node_repo_folder(uuid, src._abspath)  # pylint: disable=protected-access
+                src = RepositoryFolder(section=Repository._section_name, uuid=uuid)  # pylint: disable=protected-access
+                if not src.exists():
+                    raise exceptions.ArchiveExportError(
+                        f'Unable to find the repository folder for Node with UUID={uuid} '
+                        'in the local repository'
+                    )
+                yield uuid, src._abspath  # pylint: disable=protected-access
+
+        def callback(action: str, value: Any):
+            # the progress is only updated once a repository is written, not when it is handed to the writer
+            if action == 'update':
+                progress.update(value)
+
+        writer.write_node_repo_folders(iter_folders(), processes=processes, callback=callback)
 
 
 # THESE FUNCTIONS ARE ONLY ADDED FOR BACK-COMPATIBILITY
@@ -9,19 +9,25 @@
 ###########################################################################
 """ Utility functions for export of AiiDA entities """
 # pylint: disable=too-many-locals,too-many-branches,too-many-nested-blocks
+from typing import Dict, Iterable, Optional
 import warnings
 
 from aiida.orm import QueryBuilder, ProcessNode
+from aiida.common import json
 from aiida.common.log import AIIDA_LOGGER, LOG_LEVEL_REPORT
 from aiida.common.warnings import AiidaDeprecationWarning
 
 from aiida.tools.importexport.common import exceptions
 from aiida.tools.importexport.common.config import (
-    file_fields_to_model_fields, entity_names_to_entities, get_all_fields_info
+    COMMENT_ENTITY_NAME, LOG_ENTITY_NAME, NODE_ENTITY_NAME, file_fields_to_model_fields, entity_names_to_entities,
+    get_all_fields_info
 )
 
 EXPORT_LOGGER = AIIDA_LOGGER.getChild('export')
 
+# the entities that an incremental export only writes if they are new or were modified
+MANIFEST_ENTITY_NAMES = (NODE_ENTITY_NAME, COMMENT_ENTITY_NAME, LOG_ENTITY_NAME)
+
 
 def fill_in_query(partial_query, originating_entity_str, current_entity_str, tag_suffixes=None, entity_separator='_'):
     """
@@ -309,3 +315,50 @@ def deprecated_parameters(old, new):
         warnings.warn(message, AiidaDeprecationWarning)  # pylint: disable=no-member
 
     return new['value']
+
+
+def get_export_manifest(paths: Iterable[str]) -> Dict[str, Dict[str, Optional[str]]]:
+    """Return the manifest of the entities contained in previous exports, for an incremental export.
+
+    The manifest maps the name of each entity in ``MANIFEST_ENTITY_NAMES`` to a mapping of the UUIDs of its exported
+    instances to their serialized modification time, or ``None`` for entities that have no modification time.
+
+    :param paths: paths to archives, or to manifests written by :func:`write_export_manifest`
+    :return: the union of the manifests of all paths
+
+    :raises `~aiida.tools.importexport.common.exceptions.ArchiveExportError`: if a path is neither an archive
+        nor a manifest
+    """
+    from aiida.tools.importexport.archive.common import detect_archive_type
+    from aiida.tools.importexport.archive.readers import get_reader
+
+    manifest: Dict[str, Dict[str, Optional[str]]] = {name: {} for name in MANIFEST_ENTITY_NAMES}
+
+    for path in paths:
+        try:
+            reader_cls = get_reader(detect_archive_type(path))
+        except exceptions.ImportValidationError:
+            try:
+                with open(path, 'r', encoding='utf8') as handle:
+                    entities = json.load(handle)['entities']
+                for name in MANIFEST_ENTITY_NAMES:
+                    manifest[name].update(entities.get(name, {}))
+            except (IOError, ValueError, KeyError, TypeError, AttributeError) as exception:
+                raise exceptions.ArchiveExportError(f'{path} is neither an archive nor an export manifest: {exception}')
+            continue
+
+        with reader_cls(path) as reader:
+            reader.check_version()
+            for name in MANIFEST_ENTITY_NAMES:
+                if name not in reader.entity_names:
+                    continue
+                for _, fields in reader.iter_entity_fields(name, fields=('uuid', 'mtime')):
+                    manifest[name][fields['uuid']] = fields.get('mtime', None)
+
+    return manifest
+
+
+def write_export_manifest(manifest: Dict[str, Dict[str, Optional[str]]], path: str):
+    """Write the manifest returned by :func:`get_export_manifest` to a JSON file."""
+    with open(path, 'w', encoding='utf8') as handle:
+        json.dump({'entities': manifest}, handle)
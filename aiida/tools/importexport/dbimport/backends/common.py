@@ -9,11 +9,17 @@
 ###########################################################################
 """Common import functions for both database backend"""
 import copy
-from typing import List, Optional
+from datetime import datetime
+import io
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from aiida.common import timezone
+from aiida.common import json, timezone
+from aiida.common.exceptions import InvalidOperation
 from aiida.common.folders import RepositoryFolder
-from aiida.common.progress_reporter import get_progress_reporter, create_callback
+from aiida.common.links import LinkType, validate_link_label
+from aiida.common.progress_reporter import get_progress_reporter
 from aiida.orm import Group, ImportGroup, Node, QueryBuilder
 from aiida.orm.utils._repository import Repository
 from aiida.tools.importexport.archive.readers import ArchiveReaderAbstract
@@ -23,28 +29,124 @@ from aiida.tools.importexport.dbimport.utils import IMPORT_LOGGER
 MAX_COMPUTERS = 100
 MAX_GROUPS = 100
 
+# For each link type, the node type prefixes of the valid source and target nodes, and the outdegree and indegree
+# character, as defined in `aiida.orm.utils.links.validate_link`
+LINK_TYPE_RULES = {
+    LinkType.CALL_CALC.value: ('process.workflow.', 'process.calculation.', 'unique_triple', 'unique'),
+    LinkType.CALL_WORK.value: ('process.workflow.', 'process.workflow.', 'unique_triple', 'unique'),
+    LinkType.CREATE.value: ('process.calculation.', 'data.', 'unique_pair', 'unique'),
+    LinkType.INPUT_CALC.value: ('data.', 'process.calculation.', 'unique_triple', 'unique_pair'),
+    LinkType.INPUT_WORK.value: ('data.', 'process.workflow.', 'unique_triple', 'unique_pair'),
+    LinkType.RETURN.value: ('process.workflow.', 'data.', 'unique_pair', 'unique_triple'),
+}
 
-def _copy_node_repositories(*, uuids_to_create: List[str], reader: ArchiveReaderAbstract):
-    """Copy repositories of new nodes from the archive to the AiiDa profile.
+# A link as the tuple of the input node PK, output node PK, label and type
+LinkRow = Tuple[int, int, str, str]
 
-    :param uuids_to_create: the node UUIDs to copy
-    :param reader: the archive reader
 
+class _NodeRepositoryCopier:
+    """Copy the repositories of new nodes from the archive to the AiiDA profile, in the background.
+
+    A background thread has the reader copy the node repositories directly from the archive to the profile repository,
+    without unpacking them to a temporary folder first. Readers that support it spread the many small file writes over
+    a pool of threads, and in any case they overlap with the storing of the database entities.
+
+    It is used as a context manager around the import transaction::
+
+        with _NodeRepositoryCopier(reader) as repository_copier, transaction():
+            repository_copier.start(uuids)
+            ...  # store the database entities
+            repository_copier.wait()
+
+    such that the transaction is only committed once all repositories are copied, and the copied repositories are
+    removed if the import fails, including if the transaction fails to commit.
     """
-    if not uuids_to_create:
-        return
-    IMPORT_LOGGER.debug('CREATING NEW NODE REPOSITORIES...')
-    with get_progress_reporter()(total=1, desc='Creating new node repos') as progress:
 
-        _callback = create_callback(progress)
+    def __init__(self, reader: ArchiveReaderAbstract, *, max_workers: Optional[int] = None):
+        """Construct the copier.
+
+        :param reader: the archive reader
+        :param max_workers: the number of threads that copy the repositories, by default as for a
+            ``concurrent.futures.ThreadPoolExecutor``
+        """
+        self._reader = reader
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._uuids: List[str] = []
+        self._thread: Optional[threading.Thread] = None
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._copied = 0
+        self._errors: List[Exception] = []
+
+    def __enter__(self) -> '_NodeRepositoryCopier':
+        return self
+
+    def __exit__(self, exctype, excinst, exctb):
+        if exctype is None:
+            self.wait()
+        else:
+            self.rollback()
+
+    def start(self, uuids: List[str]):
+        """Start copying the repositories of the given nodes in the background.
+
+        :param uuids: the node UUIDs to copy
+        """
+        if self._thread is not None:
+            raise InvalidOperation('the node repositories are already being copied')
+        if not uuids:
+            return
+        IMPORT_LOGGER.debug('CREATING NEW NODE REPOSITORIES...')
+        self._uuids = list(uuids)
+        self._thread = threading.Thread(target=self._produce, name='import-node-repositories', daemon=True)
+        self._thread.start()
+
+    def _produce(self):
+        """Copy the node repositories from the archive to the profile repository."""
+        section = Repository._section_name  # pylint: disable=protected-access
+        try:
+            for _ in self._reader.copy_node_repos(
+                self._uuids, lambda uuid: RepositoryFolder(section=section, uuid=uuid), max_workers=self._max_workers
+            ):
+                with self._lock:
+                    self._copied += 1
+                if self._cancelled.is_set():
+                    break
+        except Exception as exception:  # pylint: disable=broad-except
+            self._errors.append(exception)
+
+    def wait(self):
+        """Wait until all node repositories are copied.
+
+        :raises: the first exception that occurred while extracting or copying the repositories
+        """
+        if self._thread is None:
+            return
 
-        for import_entry_uuid, subfolder in zip(
-            uuids_to_create, reader.iter_node_repos(uuids_to_create, callback=_callback)
-        ):
-            destdir = RepositoryFolder(section=Repository._section_name, uuid=import_entry_uuid)  # pylint: disable=protected-access
-            # Replace the folder, possibly destroying existing previous folders, and move the files
-            # (faster if we are on the same filesystem, and in any case the source is a SandboxFolder)
-            destdir.replace_with_folder(subfolder.abspath, move=True, overwrite=True)
+        if self._thread.is_alive():
+            with get_progress_reporter()(total=len(self._uuids), desc='Creating new node repos') as progress:
+                reported = 0
+                while self._thread.is_alive():
+                    self._thread.join(0.1)
+                    with self._lock:
+                        copied = self._copied
+                    progress.update(copied - reported)
+                    reported = copied
+
+        if self._errors:
+            raise self._errors[0]
+
+    def rollback(self):
+        """Stop copying and remove the repositories of the nodes that were to be copied.
+
+        Since these are new nodes, they have no repository that needs to be preserved.
+        """
+        if self._thread is None:
+            return
+        self._cancelled.set()
+        self._thread.join()
+        for uuid in self._uuids:
+            RepositoryFolder(section=Repository._section_name, uuid=uuid).erase()  # pylint: disable=protected-access
 
 
 def _make_import_group(*, group: Optional[ImportGroup], node_pks: List[int]) -> ImportGroup:
@@ -97,6 +199,53 @@ def _make_import_group(*, group: Optional[ImportGroup], node_pks: List[int]) ->
     return group
 
 
+def _copy_value(value: Any) -> str:
+    """Return the value in the text format of the PostgreSQL ``COPY`` command."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif isinstance(value, datetime):
+        value = value.isoformat()
+    else:
+        value = str(value)
+    return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def _find_existing_entities(*, cursor, table: str, unique_identifier: str, unique_ids: Iterable[str],
+                            batch_size: int) -> Dict[str, int]:
+    """Return the mapping of the unique identifiers of the entities already in the database to their PK.
+
+    The unique identifiers of the archive are streamed with ``COPY`` into a temporary lookup table, which is joined
+    with the table of the entity, such that only the identifier and PK columns of the existing entities are returned.
+
+    :param cursor: a ``psycopg2`` cursor of the connection of the backend, which is not closed by this function
+    :param table: the database table of the entity
+    :param unique_ids: the unique identifiers of the entities in the archive
+    """
+    lookup_table = 'import_unique_id_lookup'
+    unique_ids = list(unique_ids)
+    existing: Dict[str, int] = {}
+
+    cursor.execute(f'CREATE TEMPORARY TABLE {lookup_table} AS SELECT {unique_identifier} FROM {table} WITH NO DATA')
+    for index in range(0, len(unique_ids), batch_size):
+        batch = unique_ids[index:index + batch_size]
+        buffer = io.StringIO(''.join(f'{_copy_value(unique_id)}\n' for unique_id in batch))
+        cursor.copy_expert(f'COPY {lookup_table} ({unique_identifier}) FROM STDIN', buffer)
+
+    cursor.execute(
+        f'SELECT entity.{unique_identifier}, entity.id FROM {table} AS entity '
+        f'JOIN {lookup_table} AS lookup ON entity.{unique_identifier} = lookup.{unique_identifier}'
+    )
+    for unique_id, pk in cursor.fetchall():
+        # Note: UUIDs need to be converted to strings
+        existing[str(unique_id)] = pk
+
+    cursor.execute(f'DROP TABLE {lookup_table}')
+
+    return existing
+
+
 def _sanitize_extras(fields: dict) -> dict:
     """Remove unwanted extra keys.
 
@@ -108,3 +257,78 @@ def _sanitize_extras(fields: dict) -> dict:
     if fields.get('node_type', '').endswith('code.Code.'):
         fields['extras'] = {key: value for key, value in fields['extras'].items() if not key == 'hidden'}
     return fields
+
+
+def _validate_links(links: List[LinkRow], nodes: Dict[int, Tuple[str, str]],
+                    existing_links: Set[LinkRow]) -> List[LinkRow]:
+    """Validate a batch of links to import against the rules of their link type, and return the new links.
+
+    Rather than validating each link with queries for the linked nodes and their links, as
+    `aiida.orm.utils.links.validate_link` does, the links are checked against the given sets, which are retrieved
+    with a single query each for the whole batch.
+
+    :param links: the links to import
+    :param nodes: mapping of the PK of every linked node to its UUID and node type
+    :param existing_links: the stored links of which a linked node is the input node of a link to import, or the
+        output node of a link to import
+    :return: the links that do not exist yet, in order and without duplicates
+    :raises `~aiida.tools.importexport.common.exceptions.ImportValidationError`: if a new link is invalid
+    """
+    outgoing_unique = {(link[0], link[3]) for link in existing_links}
+    outgoing_unique_pair = {(link[0], link[2], link[3]) for link in existing_links}
+    incoming_unique = {(link[1], link[3]) for link in existing_links}
+    incoming_unique_pair = {(link[1], link[2], link[3]) for link in existing_links}
+    existing_links = set(existing_links)
+
+    new_links = []
+
+    for link in links:
+        in_id, out_id, label, link_type = link
+
+        # an existing link is equivalent to an existing triple link (i.e. `unique_triple`)
+        if link in existing_links:
+            continue
+
+        try:
+            validate_link_label(label)
+        except ValueError as why:
+            raise exceptions.ImportValidationError(f'Error during Link label validation: {why}')
+
+        if in_id == out_id:
+            raise exceptions.ImportValidationError('Cannot add a link to oneself')
+
+        try:
+            type_source, type_target, outdegree, indegree = LINK_TYPE_RULES[link_type]
+        except KeyError:
+            raise exceptions.ImportValidationError(f'Unknown link type: {link_type}')
+
+        source_uuid, source_type = nodes[in_id]
+        target_uuid, target_type = nodes[out_id]
+
+        if not source_type.startswith(type_source) or not target_type.startswith(type_target):
+            raise exceptions.ImportValidationError(f'Cannot add a {link_type} link from {source_type} to {target_type}')
+
+        if outdegree == 'unique' and (in_id, link_type) in outgoing_unique:
+            raise exceptions.ImportValidationError(f'Node<{source_uuid}> already has an outgoing {link_type} link')
+
+        if outdegree == 'unique_pair' and (in_id, label, link_type) in outgoing_unique_pair:
+            raise exceptions.ImportValidationError(
+                f'Node<{source_uuid}> already has an outgoing {link_type} link with label "{label}"'
+            )
+
+        if indegree == 'unique' and (out_id, link_type) in incoming_unique:
+            raise exceptions.ImportValidationError(f'Node<{target_uuid}> already has an incoming {link_type} link')
+
+        if indegree == 'unique_pair' and (out_id, label, link_type) in incoming_unique_pair:
+            raise exceptions.ImportValidationError(
+                f'Node<{target_uuid}> already has an incoming {link_type} link with label "{label}"'
+            )
+
+        new_links.append(link)
+        existing_links.add(link)
+        outgoing_unique.add((in_id, link_type))
+        outgoing_unique_pair.add((in_id, label, link_type))
+        incoming_unique.add((out_id, link_type))
+        incoming_unique_pair.add((out_id, label, link_type))
+
+    return new_links
@@ -13,7 +13,6 @@ from itertools import chain
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 import warnings
 
-from aiida.common.links import LinkType, validate_link_label
 from aiida.common.progress_reporter import get_progress_reporter
 from aiida.common.utils import get_object_from_string, validate_uuid
 from aiida.common.warnings import AiidaDeprecationWarning
@@ -34,7 +33,8 @@ from aiida.tools.importexport.archive.common import detect_archive_type
 from aiida.tools.importexport.archive.readers import ArchiveReaderAbstract, get_reader
 
 from aiida.tools.importexport.dbimport.backends.common import (
-    _copy_node_repositories, _make_import_group, _sanitize_extras, MAX_COMPUTERS, MAX_GROUPS
+    _find_existing_entities, _make_import_group, _sanitize_extras, _validate_links, _NodeRepositoryCopier, LinkRow,
+    MAX_COMPUTERS, MAX_GROUPS
 )
 
 
@@ -203,7 +203,7 @@ def import_data_dj(
         # batch size for bulk create operations
         batch_size: int = get_config_option('db.batch_size')
 
-        with transaction.atomic():
+        with _NodeRepositoryCopier(reader) as repository_copier, transaction.atomic():
 
             # entity_name -> str(pk) -> fields
             new_entries: Dict[str, Dict[str, dict]] = {}
@@ -220,6 +220,7 @@ def import_data_dj(
                     existing_entries=existing_entries,
                     foreign_ids_reverse_mappings=foreign_ids_reverse_mappings,
                     extras_mode_new=extras_mode_new,
+                    batch_size=batch_size,
                 )
 
             IMPORT_LOGGER.debug('STORING ENTITIES...')
@@ -233,6 +234,7 @@ def import_data_dj(
                     existing_entries=existing_entries,
                     foreign_ids_reverse_mappings=foreign_ids_reverse_mappings,
                     import_unique_ids_mappings=import_unique_ids_mappings,
+                    repository_copier=repository_copier,
                     ret_dict=ret_dict,
                     batch_size=batch_size,
                     # session=session
@@ -266,6 +268,9 @@ def import_data_dj(
                 foreign_ids_reverse_mappings=foreign_ids_reverse_mappings
             )
 
+            # only commit the transaction once the node repositories are stored
+            repository_copier.wait()
+
         ######################################
         # Put everything in a specific group #
         ######################################
@@ -281,9 +286,11 @@ def import_data_dj(
 def _select_entity_data(
     *, entity_name: str, reader: ArchiveReaderAbstract, new_entries: Dict[str, Dict[str, dict]],
     existing_entries: Dict[str, Dict[str, dict]], foreign_ids_reverse_mappings: Dict[str, Dict[str, int]],
-    extras_mode_new: str
+    extras_mode_new: str, batch_size: int
 ):
     """Select the data to import by comparing the AiiDA database to the archive contents."""
+    from django.db import connection  # pylint: disable=import-error,no-name-in-module
+
     cls_signature = entity_names_to_signatures[entity_name]
     model = get_object_from_string(cls_signature)
     unique_identifier = reader.metadata.unique_identifiers.get(entity_name, None)
@@ -304,20 +311,19 @@ def _select_entity_data(
         f[unique_identifier] for _, f in reader.iter_entity_fields(entity_name, fields=(unique_identifier,))
     )
 
-    relevant_db_entries = {}
+    relevant_db_entries: Dict[str, int] = {}
     if import_unique_ids:
-        relevant_db_entries_result = model.objects.filter(**{f'{unique_identifier}__in': import_unique_ids})
-        if relevant_db_entries_result.count():
-            with get_progress_reporter()(
-                desc=f'Finding existing entities - {entity_name}', total=relevant_db_entries_result.count()
-            ) as progress:
-                # Imitating QueryBuilder.iterall() with default settings
-                for object_ in relevant_db_entries_result.iterator(chunk_size=100):
-                    progress.update()
-                    # Note: UUIDs need to be converted to strings
-                    relevant_db_entries.update({str(getattr(object_, unique_identifier)): object_})
+        with connection.cursor() as cursor:
+            relevant_db_entries = _find_existing_entities(
+                cursor=cursor,
+                table=model._meta.db_table,
+                unique_identifier=unique_identifier,
+                unique_ids=import_unique_ids,
+                batch_size=batch_size
+            )
+        IMPORT_LOGGER.debug('Found %s existing entities - %s', len(relevant_db_entries), entity_name)
 
-    foreign_ids_reverse_mappings[entity_name] = {k: v.pk for k, v in relevant_db_entries.items()}
+    foreign_ids_reverse_mappings[entity_name] = relevant_db_entries
 
     entity_count = reader.entity_count(entity_name)
     if not entity_count:
@@ -373,7 +379,7 @@ def _store_entity_data(
     *, reader: ArchiveReaderAbstract, entity_name: str, comment_mode: str, extras_mode_existing: str,
     new_entries: Dict[str, Dict[str, dict]], existing_entries: Dict[str, Dict[str, dict]],
     foreign_ids_reverse_mappings: Dict[str, Dict[str, int]], import_unique_ids_mappings: Dict[str, Dict[int, str]],
-    ret_dict: dict, batch_size: int
+    repository_copier: _NodeRepositoryCopier, ret_dict: dict, batch_size: int
 ):
     """Store the entity data on the AiiDA profile."""
     from aiida.backends.djsite.db import models
@@ -445,10 +451,10 @@ def _store_entity_data(
 
     if entity_name == NODE_ENTITY_NAME:
 
-        # Before storing entries in the DB, I store the files (if these are nodes).
+        # Start storing the files in the background (if these are nodes), while the entries are stored in the DB.
         # Note: only for new entries!
         uuids_to_create = [obj.uuid for obj in objects_to_create]
-        _copy_node_repositories(uuids_to_create=uuids_to_create, reader=reader)
+        repository_copier.start(uuids_to_create)
 
         # For the existing nodes that are also in the imported list we also update their extras if necessary
         if existing_entries[entity_name]:
@@ -522,51 +528,28 @@ def _store_node_links(
     ret_dict: dict,
     batch_size: int,
 ):
-    """Store node links to the database."""
-    from aiida.backends.djsite.db import models
-
-    links_to_store = []
-
-    # Needed, since QueryBuilder does not yet work for recently saved Nodes
-    existing_links = {
-        (l[0], l[1], l[2], l[3]) for l in models.DbLink.objects.all().values_list('input', 'output', 'label', 'type')
-    }
-    existing_outgoing_unique = {(l[0], l[3]) for l in existing_links}
-    existing_outgoing_unique_pair = {(l[0], l[2], l[3]) for l in existing_links}
-    existing_incoming_unique = {(l[1], l[3]) for l in existing_links}
-    existing_incoming_unique_pair = {(l[1], l[2], l[3]) for l in existing_links}
-
-    calculation_node_types = 'process.calculation.'
-    workflow_node_types = 'process.workflow.'
-    data_node_types = 'data.'
-
-    link_mapping = {
-        LinkType.CALL_CALC: (workflow_node_types, calculation_node_types, 'unique_triple', 'unique'),
-        LinkType.CALL_WORK: (workflow_node_types, workflow_node_types, 'unique_triple', 'unique'),
-        LinkType.CREATE: (calculation_node_types, data_node_types, 'unique_pair', 'unique'),
-        LinkType.INPUT_CALC: (data_node_types, calculation_node_types, 'unique_triple', 'unique_pair'),
-        LinkType.INPUT_WORK: (data_node_types, workflow_node_types, 'unique_triple', 'unique_pair'),
-        LinkType.RETURN: (workflow_node_types, data_node_types, 'unique_pair', 'unique_triple'),
-    }
+    """Store node links to the database.
 
+    The links are validated and stored in batches, see `_store_node_link_batch`.
+    """
     link_count = reader.link_count
-
     if not link_count:
         IMPORT_LOGGER.debug('   (0 new links...)')
         return
 
-    pbar_base_str = 'Links - '
-    with get_progress_reporter()(total=link_count, desc=pbar_base_str) as progress_bar:
+    node_ids = foreign_ids_reverse_mappings.get(NODE_ENTITY_NAME, {})
+    batch: List[LinkRow] = []
+
+    with get_progress_reporter()(total=link_count, desc='Links') as progress_bar:
 
         for link in reader.iter_link_data():
 
-            progress_bar.set_description_str(f"{pbar_base_str}label={link['label']}", refresh=False)
             progress_bar.update()
 
             # Check for dangling Links within the, supposed, self-consistent archive
             try:
-                in_id = foreign_ids_reverse_mappings[NODE_ENTITY_NAME][link['input']]
-                out_id = foreign_ids_reverse_mappings[NODE_ENTITY_NAME][link['output']]
+                in_id = node_ids[link['input']]
+                out_id = node_ids[link['output']]
             except KeyError:
                 if ignore_unknown_nodes:
                     continue
@@ -575,90 +558,53 @@ def _store_node_links(
                     'label={}, type={})'.format(link['input'], link['output'], link['label'], link['type'])
                 )
 
-            # Check if link already exists, skip if it does
-            # This is equivalent to an existing triple link (i.e. unique_triple from below)
-            if (in_id, out_id, link['label'], link['type']) in existing_links:
-                continue
+            batch.append((in_id, out_id, link['label'], link['type']))
 
-            # Since backend specific Links (DbLink) are not validated upon creation, we will now validate them.
-            try:
-                validate_link_label(link['label'])
-            except ValueError as why:
-                raise exceptions.ImportValidationError(f'Error during Link label validation: {why}')
+            if len(batch) >= batch_size:
+                _store_node_link_batch(links=batch, ret_dict=ret_dict, batch_size=batch_size)
+                batch = []
 
-            source = models.DbNode.objects.get(id=in_id)
-            target = models.DbNode.objects.get(id=out_id)
+        if batch:
+            _store_node_link_batch(links=batch, ret_dict=ret_dict, batch_size=batch_size)
 
-            if source.uuid == target.uuid:
-                raise exceptions.ImportValidationError('Cannot add a link to oneself')
+    IMPORT_LOGGER.debug('   (%d new links...)', len(ret_dict.get('Link', {}).get('new', [])))
 
-            link_type = LinkType(link['type'])
-            type_source, type_target, outdegree, indegree = link_mapping[link_type]
 
-            # Check if source Node is a valid type
-            if not source.node_type.startswith(type_source):
-                raise exceptions.ImportValidationError(
-                    f'Cannot add a {link_type} link from {source.node_type} to {target.node_type}'
-                )
+def _store_node_link_batch(*, links: List[LinkRow], ret_dict: dict, batch_size: int):
+    """Validate a batch of links and store the new ones.
 
-            # Check if target Node is a valid type
-            if not target.node_type.startswith(type_target):
-                raise exceptions.ImportValidationError(
-                    f'Cannot add a {link_type} link from {source.node_type} to {target.node_type}'
-                )
+    The UUIDs and types of the linked nodes, and the stored links of the input nodes and output nodes of the batch,
+    are retrieved with one query each. Since the links of previous batches are created in the same transaction, they
+    are taken into account as well. The new links are then created with a bulk create.
+    """
+    from django.db.models import Q  # pylint: disable=import-error,no-name-in-module
+    from aiida.backends.djsite.db import models
 
-            # If the outdegree is `unique` there cannot already be any other outgoing link of that type,
-            # i.e., the source Node may not have a LinkType of current LinkType, going out, existing already.
-            if outdegree == 'unique' and (in_id, link['type']) in existing_outgoing_unique:
-                raise exceptions.ImportValidationError(f'Node<{source.uuid}> already has an outgoing {link_type} link')
-
-            # If the outdegree is `unique_pair`,
-            # then the link labels for outgoing links of this type should be unique,
-            # i.e., the source Node may not have a LinkType of current LinkType, going out,
-            # that also has the current Link label, existing already.
-            elif outdegree == 'unique_pair' and \
-            (in_id, link['label'], link['type']) in existing_outgoing_unique_pair:
-                raise exceptions.ImportValidationError(
-                    f"Node<{source.uuid}> already has an outgoing {link_type} link with label \"{link['label']}\""
-                )
+    input_ids = {link[0] for link in links}
+    output_ids = {link[1] for link in links}
 
-            # If the indegree is `unique` there cannot already be any other incoming links of that type,
-            # i.e., the target Node may not have a LinkType of current LinkType, coming in, existing already.
-            if indegree == 'unique' and (out_id, link['type']) in existing_incoming_unique:
-                raise exceptions.ImportValidationError(f'Node<{target.uuid}> already has an incoming {link_type} link')
-
-            # If the indegree is `unique_pair`,
-            # then the link labels for incoming links of this type should be unique,
-            # i.e., the target Node may not have a LinkType of current LinkType, coming in
-            # that also has the current Link label, existing already.
-            elif indegree == 'unique_pair' and \
-            (out_id, link['label'], link['type']) in existing_incoming_unique_pair:
-                raise exceptions.ImportValidationError(
-                    f"Node<{target.uuid}> already has an incoming {link_type} link with label \"{link['label']}\""
-                )
+    # note: convert uuids from type UUID to strings
+    nodes = {
+        pk: (str(uuid), node_type) for pk, uuid, node_type in models.DbNode.objects.filter(
+            id__in=input_ids | output_ids
+        ).values_list('id', 'uuid', 'node_type')
+    }
+    existing_links = set(
+        models.DbLink.objects.filter(Q(input_id__in=input_ids) | Q(output_id__in=output_ids)
+                                     ).values_list('input_id', 'output_id', 'label', 'type')
+    )
 
-            # New link
-            links_to_store.append(
-                models.DbLink(input_id=in_id, output_id=out_id, label=link['label'], type=link['type'])
-            )
-            if 'Link' not in ret_dict:
-                ret_dict['Link'] = {'new': []}
-            ret_dict['Link']['new'].append((in_id, out_id))
-
-            # Add new Link to sets of existing Links 'input PK', 'output PK', 'label', 'type'
-            existing_links.add((in_id, out_id, link['label'], link['type']))
-            existing_outgoing_unique.add((in_id, link['type']))
-            existing_outgoing_unique_pair.add((in_id, link['label'], link['type']))
-            existing_incoming_unique.add((out_id, link['type']))
-            existing_incoming_unique_pair.add((out_id, link['label'], link['type']))
-
-    # Store new links
-    if links_to_store:
-        IMPORT_LOGGER.debug('   (%d new links...)', len(links_to_store))
-
-        models.DbLink.objects.bulk_create(links_to_store, batch_size=batch_size)
-    else:
-        IMPORT_LOGGER.debug('   (0 new links...)')
+    new_links = _validate_links(links, nodes, existing_links)
+
+    if not new_links:
+        return
+
+    links_to_store = [
+        models.DbLink(input_id=in_id, output_id=out_id, label=label, type=link_type)
+        for in_id, out_id, label, link_type in new_links
+    ]
+    models.DbLink.objects.bulk_create(links_to_store, batch_size=batch_size)
+    ret_dict.setdefault('Link', {'new': []})['new'].extend((link[0], link[1]) for link in new_links)
 
 
 def _add_nodes_to_groups(
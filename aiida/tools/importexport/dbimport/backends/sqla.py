@@ -10,19 +10,19 @@
 # pylint: disable=too-many-nested-blocks,fixme,too-many-arguments,too-many-locals,too-many-branches,too-many-statements
 """ SQLAlchemy-specific import of AiiDA entities """
 from contextlib import contextmanager
+import io
 from itertools import chain
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 import warnings
 
 from sqlalchemy.orm import Session
 
-from aiida.common import json
-from aiida.common.links import LinkType
+from aiida.common import json, timezone
 from aiida.common.progress_reporter import get_progress_reporter
 from aiida.common.utils import get_object_from_string, validate_uuid
 from aiida.common.warnings import AiidaDeprecationWarning
+from aiida.manage.configuration import get_config_option
 from aiida.orm import QueryBuilder, Node, Group
-from aiida.orm.utils.links import link_triple_exists, validate_link
 
 from aiida.tools.importexport.common import exceptions
 from aiida.tools.importexport.common.config import DUPL_SUFFIX
@@ -40,7 +40,8 @@ from aiida.tools.importexport.archive.common import detect_archive_type
 from aiida.tools.importexport.archive.readers import ArchiveReaderAbstract, get_reader
 
 from aiida.tools.importexport.dbimport.backends.common import (
-    _copy_node_repositories, _make_import_group, _sanitize_extras, MAX_COMPUTERS, MAX_GROUPS
+    _copy_value, _find_existing_entities, _make_import_group, _sanitize_extras, _validate_links, _NodeRepositoryCopier,
+    LinkRow, MAX_COMPUTERS, MAX_GROUPS
 )
 
 
@@ -207,7 +208,10 @@ def import_data_sqla(
         ###########################################
         # IMPORT ALL DATA IN A SINGLE TRANSACTION #
         ###########################################
-        with sql_transaction() as session:  # type: Session
+        # batch size for bulk operations
+        batch_size: int = get_config_option('db.batch_size')
+
+        with _NodeRepositoryCopier(reader) as repository_copier, sql_transaction() as session:  # type: Session
 
             # entity_name -> str(pk) -> fields
             new_entries: Dict[str, Dict[str, dict]] = {}
@@ -224,6 +228,8 @@ def import_data_sqla(
                     existing_entries=existing_entries,
                     foreign_ids_reverse_mappings=foreign_ids_reverse_mappings,
                     extras_mode_new=extras_mode_new,
+                    batch_size=batch_size,
+                    session=session
                 )
 
             IMPORT_LOGGER.debug('STORING ENTITIES...')
@@ -237,8 +243,9 @@ def import_data_sqla(
                     existing_entries=existing_entries,
                     foreign_ids_reverse_mappings=foreign_ids_reverse_mappings,
                     import_unique_ids_mappings=import_unique_ids_mappings,
+                    repository_copier=repository_copier,
                     ret_dict=ret_dict,
-                    # batch_size=batch_size,
+                    batch_size=batch_size,
                     session=session
                 )
 
@@ -259,7 +266,7 @@ def import_data_sqla(
                 ignore_unknown_nodes=ignore_unknown_nodes,
                 foreign_ids_reverse_mappings=foreign_ids_reverse_mappings,
                 ret_dict=ret_dict,
-                # batch_size=batch_size,
+                batch_size=batch_size,
                 session=session
             )
 
@@ -270,6 +277,9 @@ def import_data_sqla(
                 foreign_ids_reverse_mappings=foreign_ids_reverse_mappings
             )
 
+            # only commit the transaction once the node repositories are stored
+            repository_copier.wait()
+
         ######################################
         # Put everything in a specific group #
         ######################################
@@ -300,7 +310,7 @@ def sql_transaction():
 def _select_entity_data(
     *, entity_name: str, reader: ArchiveReaderAbstract, new_entries: Dict[str, Dict[str, dict]],
     existing_entries: Dict[str, Dict[str, dict]], foreign_ids_reverse_mappings: Dict[str, Dict[str, int]],
-    extras_mode_new: str
+    extras_mode_new: str, batch_size: int, session: Session
 ):
     """Select the data to import by comparing the AiiDA database to the archive contents."""
     entity = entity_names_to_entities[entity_name]
@@ -324,21 +334,23 @@ def _select_entity_data(
         f[unique_identifier] for _, f in reader.iter_entity_fields(entity_name, fields=(unique_identifier,))
     )
 
-    relevant_db_entries = {}
+    relevant_db_entries: Dict[str, int] = {}
     if import_unique_ids:
-        builder = QueryBuilder()
-        builder.append(entity, filters={unique_identifier: {'in': import_unique_ids}}, project='*')
-
-        if builder.count():
-            with get_progress_reporter()(
-                desc=f'Finding existing entities - {entity_name}', total=builder.count()
-            ) as progress:
-                for object_ in builder.iterall():
-                    progress.update()
-                    # Note: UUIDs need to be converted to strings
-                    relevant_db_entries.update({str(getattr(object_[0], unique_identifier)): object_[0]})
+        # the cursor of the connection of the session, such that the lookup is done in the same transaction
+        cursor = session.connection().connection.cursor()
+        try:
+            relevant_db_entries = _find_existing_entities(
+                cursor=cursor,
+                table=get_object_from_string(entity_names_to_sqla_schema[entity_name]).__tablename__,
+                unique_identifier=unique_identifier,
+                unique_ids=import_unique_ids,
+                batch_size=batch_size
+            )
+        finally:
+            cursor.close()
+        IMPORT_LOGGER.debug('Found %s existing entities - %s', len(relevant_db_entries), entity_name)
 
-    foreign_ids_reverse_mappings[entity_name] = {k: v.pk for k, v in relevant_db_entries.items()}
+    foreign_ids_reverse_mappings[entity_name] = relevant_db_entries
 
     entity_count = reader.entity_count(entity_name)
     if not entity_count:
@@ -410,13 +422,18 @@ def _store_entity_data(
     *, reader: ArchiveReaderAbstract, entity_name: str, comment_mode: str, extras_mode_existing: str,
     new_entries: Dict[str, Dict[str, dict]], existing_entries: Dict[str, Dict[str, dict]],
     foreign_ids_reverse_mappings: Dict[str, Dict[str, int]], import_unique_ids_mappings: Dict[str, Dict[int, str]],
-    ret_dict: dict, session: Session
+    repository_copier: _NodeRepositoryCopier, ret_dict: dict, batch_size: int, session: Session
 ):
-    """Store the entity data on the AiiDA profile."""
+    """Store the entity data on the AiiDA profile.
+
+    On PostgreSQL through ``psycopg2``, new nodes are not created through the ORM but streamed to the database with
+    ``COPY``, see `_copy_nodes`.
+    """
     from aiida.backends.sqlalchemy.utils import flag_modified
     from aiida.backends.sqlalchemy.models.node import DbNode
 
     entity = entity_names_to_entities[entity_name]
+    copy_rows = entity_name == NODE_ENTITY_NAME and session.get_bind().dialect.driver == 'psycopg2'
 
     fields_info = reader.metadata.all_fields_info.get(entity_name, {})
     unique_identifier = reader.metadata.unique_identifiers.get(entity_name, None)
@@ -462,6 +479,8 @@ def _store_entity_data(
 
     # Store all objects for this model in a list, and store them all in once at the end.
     objects_to_create = []
+    # Or, if they are copied, the rows of the objects
+    rows_to_create = []
     # In the following list we add the objects to be updated
     objects_to_update = []
     # This is needed later to associate the import entry with the new pk
@@ -503,17 +522,19 @@ def _store_entity_data(
                 import_data[model_fkey] = import_data[file_fkey]
                 import_data.pop(file_fkey, None)
 
-        db_entity = get_object_from_string(entity_names_to_sqla_schema[entity_name])
-
-        objects_to_create.append(db_entity(**import_data))
+        if copy_rows:
+            rows_to_create.append(import_data)
+        else:
+            db_entity = get_object_from_string(entity_names_to_sqla_schema[entity_name])
+            objects_to_create.append(db_entity(**import_data))
         import_new_entry_pks[unique_id] = import_entry_pk
 
     if entity_name == NODE_ENTITY_NAME:
 
-        # Before storing entries in the DB, I store the files (if these are nodes).
+        # Start storing the files in the background (if these are nodes), while the entries are stored in the DB.
         # Note: only for new entries!
-        uuids_to_create = [obj.uuid for obj in objects_to_create]
-        _copy_node_repositories(uuids_to_create=uuids_to_create, reader=reader)
+        uuids_to_create = [obj.uuid for obj in objects_to_create] + [row['uuid'] for row in rows_to_create]
+        repository_copier.start(uuids_to_create)
 
         # For the existing nodes that are also in the imported list we also update their extras if necessary
         if existing_entries[entity_name]:
@@ -559,18 +580,21 @@ def _store_entity_data(
 
         just_saved = {}
 
-        builder = QueryBuilder()
-        builder.append(
-            entity,
-            filters={unique_identifier: {
-                'in': list(import_new_entry_pks.keys())
-            }},
-            project=[unique_identifier, 'id']
-        )
+        if rows_to_create:
+            just_saved = _copy_nodes(rows=rows_to_create, batch_size=batch_size, session=session, progress=progress)
+        else:
+            builder = QueryBuilder()
+            builder.append(
+                entity,
+                filters={unique_identifier: {
+                    'in': list(import_new_entry_pks.keys())
+                }},
+                project=[unique_identifier, 'id']
+            )
 
-        for entry in builder.iterall():
-            progress.update()
-            just_saved.update({entry[0]: entry[1]})
+            for entry in builder.iterall():
+                progress.update()
+                just_saved.update({entry[0]: entry[1]})
 
         # Now I have the PKs, print the info
         # Moreover, add newly created Nodes to foreign_ids_reverse_mappings
@@ -588,34 +612,94 @@ def _store_entity_data(
             # IMPORT_LOGGER.debug(f'New {entity_name}: {unique_id} ({import_entry_pk}->{new_pk})')
 
 
+# The columns of the node table that are filled with ``COPY``, and the defaults for those absent from the archive
+NODE_COPY_COLUMNS = (
+    'uuid', 'node_type', 'process_type', 'label', 'description', 'ctime', 'mtime', 'attributes', 'extras',
+    'dbcomputer_id', 'user_id'
+)
+NODE_COPY_DEFAULTS = {'label': '', 'description': '', 'attributes': {}, 'extras': {}}
+
+
+def _copy_nodes(*, rows: List[Dict[str, Any]], batch_size: int, session: Session, progress) -> Dict[str, int]:
+    """Store new nodes with ``COPY`` and return the mapping of their UUID to their new PK.
+
+    The rows are streamed in batches into a temporary staging table, from which they are moved to the node table with
+    an ``INSERT ... SELECT ... RETURNING`` that also returns the new PKs. This bypasses the construction of an ORM
+    object for every node and the (de)serialization of the attributes and extras by the session.
+
+    :param rows: the deserialized fields of the nodes, keyed on the names of the node table columns
+    :param progress: the progress bar to update for every stored node
+    """
+    now = timezone.now()
+    columns = ', '.join(NODE_COPY_COLUMNS)
+    staging_table = 'import_dbnode_staging'
+    uuid_to_pk: Dict[str, int] = {}
+
+    # the cursor of the connection of the session, such that the rows are stored in the same transaction
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.execute(f'CREATE TEMPORARY TABLE {staging_table} AS SELECT {columns} FROM db_dbnode WITH NO DATA')
+
+        for index in range(0, len(rows), batch_size):
+            buffer = io.StringIO()
+            for row in rows[index:index + batch_size]:
+                values = []
+                for column in NODE_COPY_COLUMNS:
+                    if column in ('ctime', 'mtime'):
+                        value = row.get(column, None) or now
+                    else:
+                        value = row.get(column, NODE_COPY_DEFAULTS.get(column, None))
+                    values.append(_copy_value(value))
+                buffer.write('\t'.join(values) + '\n')
+            buffer.seek(0)
+
+            cursor.copy_expert(f'COPY {staging_table} ({columns}) FROM STDIN', buffer)
+            cursor.execute(
+                f'INSERT INTO db_dbnode ({columns}) SELECT {columns} FROM {staging_table} RETURNING uuid, id'
+            )
+            for uuid, pk in cursor.fetchall():
+                progress.update()
+                uuid_to_pk[str(uuid)] = pk
+            cursor.execute(f'TRUNCATE {staging_table}')
+
+        cursor.execute(f'DROP TABLE {staging_table}')
+    finally:
+        cursor.close()
+
+    return uuid_to_pk
+
+
 def _store_node_links(
     *,
     reader: ArchiveReaderAbstract,
     ignore_unknown_nodes: bool,
     foreign_ids_reverse_mappings: Dict[str, Dict[str, int]],
     ret_dict: dict,
+    batch_size: int,
     session: Session,
 ):
-    """Store node links to the database."""
-    from aiida.backends.sqlalchemy.models.node import DbLink
+    """Store node links to the database.
 
+    The links are validated and stored in batches, see `_store_node_link_batch`.
+    """
     link_count = reader.link_count
     if not link_count:
         IMPORT_LOGGER.debug('   (0 new links...)')
         return
 
-    pbar_base_str = 'Links - '
-    with get_progress_reporter()(total=link_count, desc=pbar_base_str) as progress_bar:
+    node_ids = foreign_ids_reverse_mappings.get(NODE_ENTITY_NAME, {})
+    batch: List[LinkRow] = []
+
+    with get_progress_reporter()(total=link_count, desc='Links') as progress_bar:
 
         for link in reader.iter_link_data():
 
-            progress_bar.set_description_str(f"{pbar_base_str}label={link['label']}", refresh=False)
             progress_bar.update()
 
             # Check for dangling Links within the, supposed, self-consistent archive
             try:
-                in_id = foreign_ids_reverse_mappings[NODE_ENTITY_NAME][link['input']]
-                out_id = foreign_ids_reverse_mappings[NODE_ENTITY_NAME][link['output']]
+                in_id = node_ids[link['input']]
+                out_id = node_ids[link['output']]
             except KeyError:
                 if ignore_unknown_nodes:
                     continue
@@ -624,31 +708,54 @@ def _store_node_links(
                     'label={}, type={})'.format(link['input'], link['output'], link['label'], link['type'])
                 )
 
-            # Since backend specific Links (DbLink) are not validated upon creation, we will now validate them.
-            source = QueryBuilder().append(Node, filters={'id': in_id}, project='*').first()[0]
-            target = QueryBuilder().append(Node, filters={'id': out_id}, project='*').first()[0]
-            link_type = LinkType(link['type'])
-
-            # Check for existence of a triple link, i.e. unique triple.
-            # If it exists, then the link already exists, continue to next link, otherwise, validate link.
-            if link_triple_exists(source, target, link_type, link['label']):
-                continue
+            batch.append((in_id, out_id, link['label'], link['type']))
 
-            # Since backend specific Links (DbLink) are not validated upon creation, we will now validate them.
-            try:
-                validate_link(source, target, link_type, link['label'])
-            except ValueError as why:
-                raise exceptions.ImportValidationError(f'Error occurred during Link validation: {why}')
+            if len(batch) >= batch_size:
+                _store_node_link_batch(links=batch, ret_dict=ret_dict, session=session)
+                batch = []
 
-            # New link
-            session.add(DbLink(input_id=in_id, output_id=out_id, label=link['label'], type=link['type']))
-            if 'Link' not in ret_dict:
-                ret_dict['Link'] = {'new': []}
-            ret_dict['Link']['new'].append((in_id, out_id))
+        if batch:
+            _store_node_link_batch(links=batch, ret_dict=ret_dict, session=session)
 
     IMPORT_LOGGER.debug('   (%d new links...)', len(ret_dict.get('Link', {}).get('new', [])))
 
 
+def _store_node_link_batch(*, links: List[LinkRow], ret_dict: dict, session: Session):
+    """Validate a batch of links and store the new ones.
+
+    The UUIDs and types of the linked nodes, and the stored links of the input nodes and output nodes of the batch,
+    are retrieved with one query each. Since the links of previous batches are inserted in the same transaction, they
+    are taken into account as well. The new links are then inserted with a single multi-row insert.
+    """
+    from sqlalchemy import or_
+    from aiida.backends.sqlalchemy.models.node import DbLink, DbNode
+
+    input_ids = {link[0] for link in links}
+    output_ids = {link[1] for link in links}
+
+    nodes = {
+        pk: (uuid, node_type) for pk, uuid, node_type in session.query(DbNode.id, DbNode.uuid, DbNode.node_type).
+        filter(DbNode.id.in_(input_ids | output_ids))
+    }
+    existing_links = set(
+        session.query(DbLink.input_id, DbLink.output_id, DbLink.label,
+                      DbLink.type).filter(or_(DbLink.input_id.in_(input_ids), DbLink.output_id.in_(output_ids)))
+    )
+
+    new_links = _validate_links(links, nodes, existing_links)
+
+    if not new_links:
+        return
+
+    session.execute(
+        DbLink.__table__.insert().values([  # pylint: disable=no-member
+            {'input_id': in_id, 'output_id': out_id, 'label': label, 'type': link_type}
+            for in_id, out_id, label, link_type in new_links
+        ])
+    )
+    ret_dict.setdefault('Link', {'new': []})['new'].extend((link[0], link[1]) for link in new_links)
+
+
 def _add_nodes_to_groups(
     *, group_count: int, group_uuids: Iterable[Tuple[str, Set[str]]], foreign_ids_reverse_mappings: Dict[str, Dict[str,
                                                                                                                    int]]
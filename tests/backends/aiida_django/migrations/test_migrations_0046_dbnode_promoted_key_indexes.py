@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=import-error,no-name-in-module,invalid-name
+"""Test migration that adds the expression indexes on the promoted keys of the `DbNode` model."""
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+from aiida.common.utils import Capturing
+
+from .test_migrations_common import TestMigrations
+
+INDEXES = {
+    'ix_db_dbnode_attributes_process_state',
+    'ix_db_dbnode_attributes_exit_status',
+    'ix_db_dbnode_attributes_sealed',
+    'ix_db_dbnode_extras__aiida_hash',
+}
+
+
+def get_indexes():
+    """Return the names of the indexes of the `db_dbnode` table."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT indexname FROM pg_indexes WHERE tablename = 'db_dbnode';")
+        return {row[0] for row in cursor.fetchall()}
+
+
+class TestPromotedKeyIndexesMigration(TestMigrations):
+    """Test migration that adds the expression indexes on the promoted keys of the `DbNode` model."""
+
+    migrate_from = '0045_dbgroup_extras'
+    migrate_to = '0046_dbnode_promoted_key_indexes'
+
+    def setUpBeforeMigration(self):
+        self.assertEqual(get_indexes() & INDEXES, set())
+
+    def test_indexes(self):
+        """Test that the indexes exist after the migration and are dropped again by reverting it."""
+        self.assertEqual(get_indexes() & INDEXES, INDEXES)
+
+        executor = MigrationExecutor(connection)
+        with Capturing():
+            executor.migrate([(self.app, '0045_dbgroup_extras')])
+
+        self.assertEqual(get_indexes() & INDEXES, set())
@@ -1747,3 +1747,37 @@ class TestGroupExtrasMigration(TestMigrationsSQLA):
                 self.assertEqual(group.extras, {})
             finally:
                 session.close()
+
+
+class TestPromotedKeyIndexesMigration(TestMigrationsSQLA):
+    """Test migration that adds the expression indexes on the promoted keys of the `DbNode` model."""
+
+    migrate_from = '0edcdd5a30f0'  # 0edcdd5a30f0_dbgroup_extras.py
+    migrate_to = '3f8d1b2a9c4e'  # 3f8d1b2a9c4e_dbnode_promoted_key_indexes.py
+
+    indexes = {
+        'ix_db_dbnode_attributes_process_state',
+        'ix_db_dbnode_attributes_exit_status',
+        'ix_db_dbnode_attributes_sealed',
+        'ix_db_dbnode_extras__aiida_hash',
+    }
+
+    @staticmethod
+    def get_indexes():
+        """Return the names of the indexes of the `db_dbnode` table."""
+        from sqlalchemy.sql import text
+
+        with sa.ENGINE.begin() as connection:
+            results = connection.execute(text("SELECT indexname FROM pg_indexes WHERE tablename = 'db_dbnode'"))
+            return {row[0] for row in results}
+
+    def setUpBeforeMigration(self):
+        """Check that the indexes do not exist yet."""
+        self.assertEqual(self.get_indexes() & self.indexes, set())
+
+    def test_indexes(self):
+        """Test that the indexes exist after the migration and are dropped again by the downgrade."""
+        self.assertEqual(self.get_indexes() & self.indexes, self.indexes)
+
+        self.migrate_db_down(self.migrate_from)
+        self.assertEqual(self.get_indexes() & self.indexes, set())
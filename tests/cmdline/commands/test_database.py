@@ -180,3 +180,26 @@ def tests_database_version(run_cli_command, manager):
     result = run_cli_command(cmd_database.database_version)
     assert result.output_lines[0].endswith(backend_manager.get_schema_generation_database())
     assert result.output_lines[1].endswith(backend_manager.get_schema_version_database())
+
+
+@pytest.mark.usefixtures('aiida_profile')
+def tests_database_gin_indexes(run_cli_command, manager):
+    """Test the ``verdi database gin-indexes`` command."""
+    from aiida.manage.database.indexes import GIN_INDEXES, get_gin_indexes
+
+    backend = manager.get_backend()
+
+    try:
+        result = run_cli_command(cmd_database.database_gin_indexes)
+        assert get_gin_indexes(backend) == set(GIN_INDEXES)
+        for name in GIN_INDEXES:
+            assert name in result.output
+
+        # Creating the indexes again is a no-op
+        result = run_cli_command(cmd_database.database_gin_indexes)
+        assert get_gin_indexes(backend) == set(GIN_INDEXES)
+        assert 'created index' not in result.output
+    finally:
+        run_cli_command(cmd_database.database_gin_indexes, ['--drop'])
+
+    assert get_gin_indexes(backend) == set()
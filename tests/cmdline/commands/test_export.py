@@ -126,6 +126,31 @@ class TestVerdiExport(AiidaTestCase):
         finally:
             delete_temporary_file(filename)
 
+    def test_manifest(self):
+        """Test that the manifest of an archive records its nodes, and can be used for an incremental export."""
+        from aiida.common import json
+
+        filename = next(tempfile._get_candidate_names())  # pylint: disable=protected-access
+        filename_manifest = f'{filename}.json'
+        filename_incremental = f'{filename}.incremental'
+        try:
+            result = self.cli_runner.invoke(cmd_export.create, ['-N', self.node.pk, filename])
+            self.assertIsNone(result.exception, result.output)
+
+            result = self.cli_runner.invoke(cmd_export.manifest, [filename_manifest, filename])
+            self.assertIsNone(result.exception, result.output)
+            with open(filename_manifest, 'r', encoding='utf8') as handle:
+                self.assertIn(self.node.uuid, json.load(handle)['entities']['Node'])
+
+            options = ['-N', self.node.pk, '--incremental-from', filename_manifest, filename_incremental]
+            result = self.cli_runner.invoke(cmd_export.create, options)
+            self.assertIsNone(result.exception, result.output)
+            with ReaderJsonZip(filename_incremental) as reader:
+                self.assertEqual(reader.entity_count('Node'), 0)
+        finally:
+            for path in (filename, filename_manifest, filename_incremental):
+                delete_temporary_file(path)
+
     def test_create_tar_gz(self):
         """Test that creating an archive for a set of various ORM entities works with the tar.gz format."""
         filename = next(tempfile._get_candidate_names())  # pylint: disable=protected-access
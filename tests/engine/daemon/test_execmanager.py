@@ -90,3 +90,45 @@ def test_upload_local_copy_list(fixture_sandbox, aiida_localhost, aiida_local_co
         execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
 
     assert node.list_object_names() == []
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_upload_local_copy_list_uuid_formats(fixture_sandbox, aiida_localhost, aiida_local_code_factory):
+    """Test that nodes in the ``local_copy_list`` are found for any representation of their UUID.
+
+    Identifiers that are not a valid full UUID, such as a prefix, are loaded one by one and should not cause the
+    nodes with a valid UUID to fail to load.
+    """
+    from uuid import UUID
+    from aiida.common.datastructures import CalcInfo, CodeInfo
+    from aiida.orm import CalcJobNode, SinglefileData
+
+    node_a = SinglefileData(io.BytesIO(b'content_a')).store()
+    node_b = SinglefileData(io.BytesIO(b'content_b')).store()
+    node_c = SinglefileData(io.BytesIO(b'content_c')).store()
+
+    node = CalcJobNode(computer=aiida_localhost)
+    node.store()
+
+    code = aiida_local_code_factory('arithmetic.add', '/bin/bash').store()
+    code_info = CodeInfo()
+    code_info.code_uuid = code.uuid
+
+    calc_info = CalcInfo()
+    calc_info.uuid = node.uuid
+    calc_info.codes_info = [code_info]
+    calc_info.local_copy_list = [
+        (node_a.uuid.upper(), node_a.filename, 'file_a'),
+        (UUID(node_b.uuid), node_b.filename, 'file_b'),
+        (node_c.uuid[:12], node_c.filename, 'file_c'),
+        ('not-a-uuid', 'missing', 'file_d'),
+    ]
+
+    with LocalTransport() as transport:
+        execmanager.upload_calculation(node, transport, calc_info, fixture_sandbox)
+
+    for filename, content in [('file_a', b'content_a'), ('file_b', b'content_b'), ('file_c', b'content_c')]:
+        with fixture_sandbox.open(filename, 'rb') as handle:
+            assert handle.read() == content
+
+    assert not os.path.exists(os.path.join(fixture_sandbox.abspath, 'file_d'))
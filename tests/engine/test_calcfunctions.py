@@ -30,6 +30,11 @@ def return_stored_calcfunction():
     return Int(2).store()
 
 
+@calcfunction
+def many_outputs_calcfunction(data):
+    return {f'output_{index}': Int(data.value + index) for index in range(data.value)}
+
+
 @calcfunction
 def execution_counter_calcfunction(data):
     global EXECUTION_COUNTER  # pylint: disable=global-statement
@@ -66,6 +71,15 @@ class TestCalcFunction(AiidaTestCase):
         self.assertEqual(len(node.get_outgoing(link_type=LinkType.CREATE).all()), 1)
         self.assertEqual(len(node.get_outgoing(link_type=LinkType.RETURN).all()), 0)
 
+    def test_calcfunction_many_outputs(self):
+        """Verify that all outputs of a calcfunction with many outputs are stored and linked."""
+        _, node = many_outputs_calcfunction.run_get_node(Int(50))
+
+        outputs = node.get_outgoing(link_type=LinkType.CREATE).all()
+        self.assertEqual(len(outputs), 50)
+        self.assertTrue(all(entry.node.is_stored for entry in outputs))
+        self.assertEqual({entry.node.value for entry in outputs}, set(range(50, 100)))
+
     def test_calcfunction_return_stored(self):
         """Verify that a calcfunction will raise when a stored node is returned."""
 
@@ -93,6 +93,31 @@ class TestLaunchers(AiidaTestCase):
         self.assertEqual(result, self.result)
         self.assertTrue(isinstance(pk, int))
 
+    def test_calcfunction_run_map_get_node(self):
+        """Test running a map of calcfunctions in a process pool."""
+        inputs_list = [{'term_a': orm.Int(index), 'term_b': self.term_b} for index in range(4)]
+        results = launch.run_map_get_node(add, inputs_list, max_workers=2)
+
+        self.assertEqual(len(results), 4)
+        for index, (result, node) in enumerate(results):
+            self.assertEqual(result, index + self.term_b.value)
+            self.assertTrue(node.is_finished_ok)
+            self.assertEqual(result.creator.pk, node.pk)
+            self.assertEqual(node.inputs.term_a.value, index)
+
+    def test_calcfunction_run_map_lazy(self):
+        """Test running a map of more calcfunctions than can be pending at once, from a generator of inputs."""
+        inputs_list = ({'term_a': orm.Int(index), 'term_b': self.term_b} for index in range(5))
+        results = launch.run_map(add, inputs_list, max_workers=1)
+
+        self.assertEqual([result.value for result in results], [index + self.term_b.value for index in range(5)])
+        self.assertTrue(all(isinstance(result, orm.Int) and result.is_stored for result in results))
+
+    def test_run_map_invalid_process(self):
+        """Test that `run_map` only accepts calcfunctions."""
+        with self.assertRaises(ValueError):
+            launch.run_map(AddWorkChain, [])
+
     def test_workchain_run(self):
         """Test workchain run."""
         result = launch.run(AddWorkChain, term_a=self.term_a, term_b=self.term_b)
@@ -149,6 +149,13 @@ class TestProcessFunction(AiidaTestCase):
         self.assertEqual(node.is_finished_ok, True)
         self.assertEqual(node.is_failed, False)
 
+    def test_process_state_change_timestamp(self):
+        """Test that the process state change timestamp is updated when a process function terminates."""
+        from aiida.engine.utils import get_process_state_change_timestamp
+
+        _, node = self.function_return_true.run_get_node()
+        self.assertGreaterEqual(get_process_state_change_timestamp('calculation'), node.ctime)
+
     def test_process_type(self):
         """Test that the process type correctly contains the module and name of original decorated function."""
         _, node = self.function_defaults.run_get_node()
@@ -9,6 +9,7 @@
 ###########################################################################
 # pylint: disable=redefined-outer-name
 """Module to test process runners."""
+import functools
 import threading
 import asyncio
 
@@ -70,3 +71,25 @@ def test_call_on_process_finish(create_runner):
 
     assert not future.exception()
     assert future.result()
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_call_on_process_finish_polling(create_runner):
+    """Test that the shared polling mechanism calls the callbacks of all terminated processes that are awaited."""
+    runner = create_runner(poll_interval=0)
+    loop = runner.loop
+    nodes = [WorkflowNode().store() for _ in range(3)]
+    called = []
+
+    for node in nodes:
+        runner.call_on_process_finish(node.pk, functools.partial(called.append, node.pk))
+
+    # Terminate the processes without a broadcast, such that only the polling mechanism can detect it
+    for node in nodes[:2]:
+        node.set_process_state(plumpy.ProcessState.FINISHED)
+
+    loop.call_later(0.5, the_hans_klok_comeback, runner.loop)
+    loop.run_forever()
+
+    assert sorted(called) == sorted(node.pk for node in nodes[:2])
+    assert list(runner._poll_callbacks) == [nodes[2].pk]  # pylint: disable=protected-access
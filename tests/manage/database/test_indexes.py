@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the optional database indexes."""
+import pytest
+
+from aiida.manage.database.indexes import GIN_INDEXES, create_gin_indexes, drop_gin_indexes, get_gin_indexes
+
+
+@pytest.fixture
+def backend(manager):
+    """Return the database backend, making sure that the optional GIN indexes are dropped afterwards."""
+    backend = manager.get_backend()
+    yield backend
+    drop_gin_indexes(backend)
+
+
+@pytest.mark.usefixtures('aiida_profile')
+def test_create_drop_gin_indexes(backend):
+    """Test that the GIN indexes are created and dropped, and that both operations are idempotent."""
+    drop_gin_indexes(backend)
+    assert get_gin_indexes(backend) == set()
+
+    create_gin_indexes(backend)
+    assert get_gin_indexes(backend) == set(GIN_INDEXES)
+    create_gin_indexes(backend)
+    assert get_gin_indexes(backend) == set(GIN_INDEXES)
+
+    drop_gin_indexes(backend)
+    assert get_gin_indexes(backend) == set()
+    drop_gin_indexes(backend)
+    assert get_gin_indexes(backend) == set()
+
+
+@pytest.mark.usefixtures('aiida_profile')
+def test_gin_indexes_filters(backend):
+    """Test that the containment filters return the same results with and without the GIN indexes."""
+    from aiida import orm
+
+    node = orm.Data()
+    node.set_attribute('nested', {'key': 'value', 'list': [1, 2]})
+    node.store()
+    orm.Data().store()
+
+    filters = [
+        {'attributes.nested.key': 'value'},
+        {'attributes.nested.list': {'contains': [2]}},
+        {'attributes.nested.list': {'~contains': [2]}},
+    ]
+
+    def query():
+        return [sorted(orm.QueryBuilder().append(orm.Data, filters=filter_, project='id').all(flat=True))
+                for filter_ in filters]
+
+    expected = query()
+    create_gin_indexes(backend)
+    assert query() == expected
@@ -8,6 +8,8 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Tests for the `aiida.manage.external.rmq` module."""
+import asyncio
+
 from kiwipy.rmq import RmqThreadCommunicator
 import pytest
 
@@ -54,3 +56,49 @@ def test_add_rpc_subscriber(communicator):
 def test_add_broadcast_subscriber(communicator):
     """Test ``add_broadcast_subscriber``."""
     communicator.add_broadcast_subscriber(None)
+
+
+@pytest.mark.parametrize(('overloaded', 'num_active_tasks', 'expected'), (
+    (False, 10, 100),
+    (False, 95, 110),
+    (True, 95, 90),
+    (True, 30, 30),
+    (True, 0, 20),
+))  # yapf: disable
+def test_adaptive_process_slots_compute_slots(overloaded, num_active_tasks, expected):
+    """Test the computation of the number of slots of ``AdaptiveProcessSlots``."""
+    slots = rmq.AdaptiveProcessSlots(None, None, None, initial=100, minimum=20, maximum=1000)
+    assert slots.compute_slots(overloaded, num_active_tasks) == expected
+
+
+def test_adaptive_process_slots_bounds():
+    """Test that the number of slots of ``AdaptiveProcessSlots`` respects the bounds."""
+    slots = rmq.AdaptiveProcessSlots(None, None, None, initial=500, minimum=20, maximum=100)
+    assert slots.slots == 100
+    assert slots.compute_slots(False, 100) == 100
+
+    with pytest.raises(ValueError):
+        rmq.AdaptiveProcessSlots(None, None, None, initial=100, minimum=200, maximum=100)
+
+
+def test_adaptive_process_slots_is_overloaded():
+    """Test the overload detection of ``AdaptiveProcessSlots``."""
+    slots = rmq.AdaptiveProcessSlots(
+        None, None, None, initial=100, minimum=20, maximum=1000, max_loop_lag=1, max_cpu_percent=90,
+        max_memory_percent=80
+    )
+    assert not slots.is_overloaded(0.1, 50, 50)
+    assert slots.is_overloaded(2, 50, 50)
+    assert slots.is_overloaded(0.1, 95, 50)
+    assert slots.is_overloaded(0.1, 50, 85)
+
+
+def test_set_task_queue_prefetch_count_unsupported():
+    """Test that setting the prefetch count fails gracefully if the communicator does not expose the task queue."""
+    coroutine = rmq._set_task_queue_prefetch_count(object(), 10)  # pylint: disable=protected-access
+    loop = asyncio.new_event_loop()
+
+    try:
+        assert loop.run_until_complete(coroutine) is False
+    finally:
+        loop.close()
@@ -408,6 +408,81 @@ class TestNodeLinks(AiidaTestCase):
         self.assertEqual(link_triple.link_type, LinkType.INPUT_CALC)
         self.assertEqual(link_triple.link_label, 'input')
 
+    def test_prefetch_links(self):
+        """Test that prefetched links are used by `get_incoming` and `get_outgoing` and discarded when adding links."""
+        from unittest.mock import patch
+        from aiida.orm import QueryBuilder
+        from aiida.orm.utils.links import prefetch_links
+
+        data = Data().store()
+        calculations = []
+        for index in range(3):
+            calculation = CalculationNode()
+            calculation.add_incoming(data, LinkType.INPUT_CALC, f'input_{index}')
+            calculation.store()
+            calculations.append(calculation)
+
+        output = Data()
+        output.add_incoming(calculations[0], LinkType.CREATE, 'output')
+        output.store()
+
+        prefetch_links(calculations)
+
+        # None of the link lookups should hit the database
+        with patch.object(QueryBuilder, 'get_query', side_effect=AssertionError('query was issued')):
+            for index, calculation in enumerate(calculations):
+                self.assertEqual(calculation.get_incoming().one().node.pk, data.pk)
+                self.assertEqual(calculation.get_incoming().one().link_label, f'input_{index}')
+                self.assertEqual(calculation.get_incoming(link_label_filter='input_%').one().node.pk, data.pk)
+                self.assertEqual(calculation.get_incoming(link_type=LinkType.INPUT_WORK).all(), [])
+                self.assertEqual(calculation.get_incoming(node_class=CalculationNode).all(), [])
+                self.assertEqual(calculation.get_incoming(only_uuid=True).one().node, data.uuid)
+
+            self.assertEqual(calculations[0].get_outgoing().one().node.pk, output.pk)
+            self.assertEqual(calculations[1].get_outgoing().all(), [])
+
+        # Links of types that were not prefetched are loaded from the database
+        prefetch_links([data], link_direction='outgoing', link_type=LinkType.INPUT_CALC)
+        self.assertEqual(len(data.get_outgoing(link_type=LinkType.INPUT_CALC).all()), 3)
+        self.assertEqual(len(data.get_outgoing(link_type=(LinkType.INPUT_CALC, LinkType.INPUT_WORK)).all()), 3)
+
+        # Adding a link discards the prefetched links of both nodes
+        calculation = CalculationNode().store()
+        calculation.add_incoming(data, LinkType.INPUT_CALC, 'input')
+        self.assertEqual(len(data.get_outgoing(link_type=LinkType.INPUT_CALC).all()), 4)
+
+        # Storing a target whose incoming links are cached also discards the prefetched links of their source
+        prefetch_links([data], link_direction='outgoing')
+        calculation = CalculationNode()
+        calculation.add_incoming(data, LinkType.INPUT_CALC, 'input')
+        self.assertEqual(len(data.get_outgoing(link_type=LinkType.INPUT_CALC).all()), 4)
+        calculation.store()
+        self.assertEqual(len(data.get_outgoing(link_type=LinkType.INPUT_CALC).all()), 5)
+
+        with self.assertRaises(ValueError):
+            prefetch_links([data], link_direction='sideways')
+
+        with self.assertRaises(TypeError):
+            prefetch_links([data], link_type='input_calc')
+
+    def test_format_call_graph_discards_prefetched_links(self):
+        """Test that formatting the call graph does not leave prefetched links on the nodes of the graph."""
+        from aiida.cmdline.utils.ascii_vis import format_call_graph
+
+        workflow = WorkflowNode().store()
+        calculation = CalculationNode()
+        calculation.add_incoming(workflow, LinkType.CALL_CALC, 'call_0')
+        calculation.store()
+
+        self.assertEqual(format_call_graph(workflow, info_fn=lambda node: str(node.pk)).count('\n'), 1)
+
+        # A call that is made afterwards, through another instance of the node, should be returned
+        calculation = CalculationNode()
+        calculation.add_incoming(load_node(workflow.pk), LinkType.CALL_CALC, 'call_1')
+        calculation.store()
+
+        self.assertEqual(len(workflow.called), 2)
+
     def test_validate_incoming_ipsum(self):
         """Test the `validate_incoming` method with respect to linking ourselves."""
         with self.assertRaises(ValueError):
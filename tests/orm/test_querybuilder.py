@@ -407,6 +407,293 @@ class TestQueryBuilder(AiidaTestCase):
         self.assertEqual(dictionary['*'].pk, node.pk)
         self.assertEqual(dictionary['id'], node.pk)
 
+    def test_columnar(self):
+        """Test that the `.columnar()` accumulator returns one array per projection with the correct values."""
+        import numpy
+
+        nodes = []
+        for value in [1.5, 2.5, 3.5]:
+            node = orm.Data()
+            node.set_attribute('energy', value)
+            nodes.append(node.store())
+
+        pks = [node.pk for node in nodes]
+        builder = orm.QueryBuilder().append(
+            orm.Data, filters={'id': {'in': pks}}, project=['id', 'uuid', 'attributes.energy', '*'], tag='data'
+        ).order_by({'data': 'id'})
+        columns = builder.columnar(batch_size=2)
+
+        self.assertEqual(list(columns.keys()), ['data'])
+        self.assertEqual(set(columns['data'].keys()), {'id', 'uuid', 'attributes.energy', '*'})
+        self.assertTrue(all(isinstance(column, numpy.ndarray) for column in columns['data'].values()))
+        self.assertEqual(columns['data']['id'].dtype.kind, 'i')
+        self.assertEqual(columns['data']['id'].tolist(), pks)
+        self.assertEqual(columns['data']['uuid'].tolist(), [node.uuid for node in nodes])
+        self.assertEqual(columns['data']['attributes.energy'].dtype.kind, 'f')
+        self.assertEqual(columns['data']['attributes.energy'].sum(), 7.5)
+        self.assertTrue(all(isinstance(node, orm.Data) for node in columns['data']['*']))
+        self.assertEqual([node.pk for node in columns['data']['*']], pks)
+
+        # A single projection of the entire entity should also be transposed correctly
+        builder = orm.QueryBuilder().append(orm.Data, filters={'id': {'in': pks}}, tag='data')
+        self.assertEqual(sorted(node.pk for node in builder.columnar()['data']['*']), pks)
+
+        with self.assertRaises(ValueError):
+            builder.columnar(output='invalid')
+
+    def test_columnar_mixed_types(self):
+        """Test that the `.columnar()` accumulator does not coerce values of different types or `None` values."""
+        import numpy
+
+        for values, kind in [
+            ([1, 'a'], 'O'),
+            ([True, 2], 'O'),
+            ([1, 2.5], 'O'),
+            ([1, None], 'O'),
+            (['a', None], 'O'),
+            ([True, False], 'b'),
+            (['a', 'b'], 'U'),
+        ]:
+            pks = []
+            for value in values:
+                node = orm.Data()
+                if value is not None:
+                    node.set_attribute('value', value)
+                pks.append(node.store().pk)
+
+            builder = orm.QueryBuilder().append(
+                orm.Data, filters={'id': {'in': pks}}, project='attributes.value', tag='data'
+            ).order_by({'data': 'id'})
+            column = builder.columnar()['data']['attributes.value']
+
+            self.assertIsInstance(column, numpy.ndarray)
+            self.assertEqual(column.dtype.kind, kind)
+            self.assertEqual(column.tolist(), values)
+            self.assertEqual([type(value) for value in column.tolist()], [type(value) for value in values])
+
+    def test_iterall_server_side_cursor(self):
+        """Test that `iterall` streams the results through a server-side cursor in batches."""
+        pks = [orm.Data().store().pk for _ in range(5)]
+        builder = orm.QueryBuilder().append(orm.Data, filters={'id': {'in': pks}}, project='id')
+
+        query = builder._impl.yield_per(builder.get_query(), 2)  # pylint: disable=protected-access
+        self.assertEqual(query.get_execution_options()['stream_results'], True)
+        self.assertEqual(query.get_execution_options()['max_row_buffer'], 2)
+
+        self.assertEqual(sorted(pk for pk, in builder.iterall(batch_size=2)), pks)
+
+    def test_query_template_cache(self):
+        """Test that query builders that only differ in their filter values reuse the same query template."""
+        from unittest.mock import patch
+        from aiida.orm.querybuilder import QUERY_TEMPLATE_CACHE
+
+        nodes = []
+        for label in ['alpha', 'beta', 'gamma']:
+            node = orm.Data(label=label)
+            node.set_attribute('energy', len(label))
+            nodes.append(node.store())
+
+        def get_builder(node):
+            return orm.QueryBuilder().append(
+                orm.Data,
+                filters={
+                    'id': {'in': [node.pk, -1]},
+                    'label': {'like': f'{node.label[:2]}%'},
+                    'attributes.energy': {'>=': len(node.label)},
+                },
+                project=['id', 'label']
+            )
+
+        QUERY_TEMPLATE_CACHE.clear()
+
+        with patch.object(orm.QueryBuilder, '_build', autospec=True, side_effect=orm.QueryBuilder._build) as build:
+            for node in nodes:
+                self.assertEqual(get_builder(node).all(), [[node.pk, node.label]])
+
+            # The query is only built once, with sentinel values, for the template
+            self.assertEqual(build.call_count, 1)
+            self.assertEqual(len(QUERY_TEMPLATE_CACHE), 1)
+
+            # A different shape requires a new template
+            builder = orm.QueryBuilder().append(orm.Data, filters={'id': nodes[0].pk}, project='label')
+            self.assertEqual(builder.all(flat=True), [nodes[0].label])
+            self.assertEqual(build.call_count, 2)
+            self.assertEqual(len(QUERY_TEMPLATE_CACHE), 2)
+
+        # The count and the SQL representation should also have the substituted values
+        builder = get_builder(nodes[1])
+        self.assertEqual(builder.count(), 1)
+        self.assertIn(str(nodes[1].pk), str(builder))
+
+    def test_after(self):
+        """Test the keyset pagination with `QueryBuilder.after`."""
+        from aiida.common.exceptions import InputValidationError
+
+        nodes = []
+        for index in range(7):
+            node = orm.Data(label=f'node-{index % 3}')
+            nodes.append(node.store())
+        pks = [node.pk for node in nodes]
+
+        def get_pages(order_by):
+            builder = orm.QueryBuilder().append(orm.Data, filters={'id': {'in': pks}}, project=['label', 'id'], tag='n')
+            builder.order_by({'n': order_by}).limit(3)
+            pages = []
+            page = builder.all()
+            while page:
+                pages.append(page)
+                builder.after(page[-1])
+                page = builder.all()
+            return pages
+
+        # Same direction for all keys
+        pages = get_pages(['label', 'id'])
+        self.assertEqual([len(page) for page in pages], [3, 3, 1])
+        self.assertEqual([row for page in pages for row in page], sorted([node.label, node.pk] for node in nodes))
+
+        # Mixed directions
+        pages = get_pages([{'label': 'desc'}, {'id': 'asc'}])
+        expected = sorted(([node.label, node.pk] for node in nodes), key=lambda row: (-int(row[0][-1]), row[1]))
+        self.assertEqual([row for page in pages for row in page], expected)
+
+        # The `after` values are part of the queryhelp
+        builder = orm.QueryBuilder().append(orm.Data, filters={'id': {'in': pks}}, project='id', tag='n')
+        builder.order_by({'n': 'id'}).after([pks[3]])
+        self.assertEqual(orm.QueryBuilder(**builder.queryhelp).all(flat=True), pks[4:])
+
+        with self.assertRaises(InputValidationError):
+            orm.QueryBuilder().append(orm.Data).after([1]).all()
+
+        with self.assertRaises(InputValidationError):
+            builder.after([1, 2]).all()
+
+    def test_aggregate_group_by(self):
+        """Test the projections with aggregate functions in combination with `QueryBuilder.group_by`."""
+        from aiida.common.exceptions import InputValidationError
+
+        pks = []
+        for label, value in [('a', 1), ('a', 3), ('b', 2), ('b', 4), ('b', 9)]:
+            node = orm.Data(label=label)
+            node.set_attribute('value', value)
+            pks.append(node.store().pk)
+
+        def get_builder(func, cast='i'):
+            builder = orm.QueryBuilder().append(
+                orm.Data,
+                filters={'id': {'in': pks}},
+                project=['label', {'attributes.value': {'func': func, 'cast': cast}}],
+                tag='data'
+            )
+            return builder.group_by({'data': 'label'}).order_by({'data': 'label'})
+
+        self.assertEqual(get_builder('count').all(), [['a', 2], ['b', 3]])
+        self.assertEqual(get_builder('sum').all(), [['a', 4], ['b', 15]])
+        self.assertEqual(get_builder('min').all(), [['a', 1], ['b', 2]])
+        self.assertEqual(get_builder('max').all(), [['a', 3], ['b', 9]])
+        self.assertEqual(get_builder('avg', 'f').all(), [['a', 2.], ['b', 5.]])
+        self.assertIsInstance(get_builder('sum').all()[0][1], int)
+        self.assertIsInstance(get_builder('avg').all()[0][1], float)
+        self.assertEqual(get_builder('count').count(), 2)
+
+        # The grouping is part of the queryhelp and can also be done on attributes
+        builder = orm.QueryBuilder().append(
+            orm.Data, filters={'id': {'in': pks}}, project=['attributes.value', {'id': {'func': 'count'}}], tag='data'
+        ).group_by({'data': 'attributes.value'})
+        self.assertEqual(sorted(orm.QueryBuilder(**builder.queryhelp).all()), [[value, 1] for value in [1, 2, 3, 4, 9]])
+
+        with self.assertRaises(InputValidationError):
+            orm.QueryBuilder().append(orm.Data, tag='data').group_by({'data': {'label': {'order': 'asc'}}})
+
+    def test_promoted_keys(self):
+        """Test that equality filters on promoted keys use their indexed text value and match the same nodes.
+
+        Negated filters should not use the promoted keys, as the indexed expression does not match nodes without the
+        key.
+        """
+        calculation = orm.CalculationNode()
+        calculation.set_attribute('process_state', 'finished')
+        calculation.set_attribute('exit_status', 0)
+        calculation.set_attribute('sealed', True)
+        calculation.store()
+
+        # Nodes whose values have the same text representation but a different JSON type should not match
+        data = orm.Data()
+        data.set_attribute('process_state', 'finished')
+        data.set_attribute('exit_status', '0')
+        data.set_attribute('sealed', 'true')
+        data.store()
+
+        # Negated filters should also match nodes that do not have the key, such as processes that did not finish yet
+        created = orm.CalculationNode().store()
+
+        pks = [calculation.pk, data.pk, created.pk]
+
+        for filters, expected, promoted in [
+            ({'attributes.exit_status': 0}, [calculation.pk], True),
+            ({'attributes.exit_status': '0'}, [data.pk], False),
+            ({'attributes.sealed': True}, [calculation.pk], True),
+            ({'attributes.process_state': {'in': ['finished', 'excepted']}}, sorted([calculation.pk, data.pk]), True),
+            ({'attributes.exit_status': {'!==': 0}}, sorted([data.pk, created.pk]), False),
+            ({'attributes.process_state': {'!in': ['finished', 'excepted']}}, [created.pk], False),
+        ]:
+            filters['id'] = {'in': pks}
+            builder = orm.QueryBuilder().append(orm.Node, filters=filters, project='id')
+            self.assertEqual(sorted(builder.all(flat=True)), expected)
+            self.assertEqual('->>' in str(builder), promoted)
+
+    def test_containment_filters(self):
+        """Test that equality and `contains` filters on attributes use a containment of the column where possible."""
+        node_a = orm.Data()
+        node_a.set_attribute('nested', {'key': 'value', 'number': 1, 'list': [1, 2, 3]})
+        node_a.set_attribute('list', ['a', 'b'])
+        node_a.store()
+
+        node_b = orm.Data()
+        node_b.set_attribute('nested', {'key': 'other', 'number': 1.0, 'list': [3, 4]})
+        node_b.set_attribute('list', [['a', 'b'], 'c'])
+        node_b.store()
+
+        pks = [node_a.pk, node_b.pk]
+
+        for filters, expected, containment in [
+            ({'attributes.nested.key': 'value'}, [node_a.pk], True),
+            ({'attributes.nested.number': 1}, sorted(pks), True),
+            ({'attributes.nested.list': {'contains': [3]}}, sorted(pks), True),
+            ({'attributes.nested.list': {'contains': [1, 3]}}, [node_a.pk], True),
+            ({'attributes.list': {'contains': ['a']}}, [node_a.pk], True),
+            ({'attributes.list.0': {'contains': ['a']}}, [node_b.pk], False),
+            ({'attributes.nested.number': {'>': 0}}, sorted(pks), False),
+        ]:
+            filters['id'] = {'in': pks}
+            builder = orm.QueryBuilder().append(orm.Node, filters=filters, project='id')
+            self.assertEqual(sorted(builder.all(flat=True)), expected)
+            self.assertEqual('jsonb_build_object' in str(builder), containment)
+
+    def test_containment_filters_negated(self):
+        """Test that a negated `contains` filter does not match nodes that do not have the attribute."""
+        node_a = orm.Data()
+        node_a.set_attribute('list', ['a', 'b'])
+        node_a.store()
+
+        node_b = orm.Data()
+        node_b.set_attribute('list', ['c'])
+        node_b.store()
+
+        node_c = orm.Data()
+        node_c.set_attribute('other', ['a'])
+        node_c.store()
+
+        pks = [node_a.pk, node_b.pk, node_c.pk]
+
+        for operator in ('~contains', '!contains'):
+            filters = {'id': {'in': pks}, 'attributes.list': {operator: ['a']}}
+            builder = orm.QueryBuilder().append(orm.Node, filters=filters, project='id')
+            self.assertEqual(builder.all(flat=True), [node_b.pk])
+
+            filters = {'id': {'in': pks}, 'attributes.nested.list': {operator: ['a']}}
+            builder = orm.QueryBuilder().append(orm.Node, filters=filters, project='id')
+            self.assertEqual(builder.all(flat=True), [])
+
     def test_operators_eq_lt_gt(self):
         nodes = [orm.Data() for _ in range(8)]
 
@@ -1294,6 +1581,61 @@ class QueryBuilderPath(AiidaTestCase):
         # qb.add_filter('edge', {'depth': 5})
         # self.assertTrue(set(next(zip(*qb.all()))), set([5]))
 
+    def test_query_path_recursion_options(self):
+        """Test the `max_depth`, `link_types` and `prune` options of the recursive joins."""
+        from aiida.common.exceptions import InputValidationError
+
+        n1 = orm.Data().store()
+        n2 = orm.CalculationNode()
+        n2.add_incoming(n1, link_type=LinkType.INPUT_CALC, link_label='link1')
+        n2.store()
+        n3 = orm.Data()
+        n3.add_incoming(n2, link_type=LinkType.CREATE, link_label='link2')
+        n3.store()
+        n4 = orm.Data()
+        n4.add_incoming(n2, link_type=LinkType.CREATE, link_label='link3')
+        n4.store()
+        n5 = orm.CalculationNode()
+        n5.add_incoming(n3, link_type=LinkType.INPUT_CALC, link_label='link4')
+        n5.add_incoming(n4, link_type=LinkType.INPUT_CALC, link_label='link5')
+        n5.store()
+
+        def get_descendants(**kwargs):
+            builder = orm.QueryBuilder().append(orm.Node, filters={'id': n1.pk}, tag='anc')
+            builder.append(orm.Node, with_ancestors='anc', project='id', **kwargs)
+            return sorted(builder.all(flat=True))
+
+        def get_ancestors(**kwargs):
+            builder = orm.QueryBuilder().append(orm.Node, filters={'id': n5.pk}, tag='desc')
+            builder.append(orm.Node, with_descendants='desc', project='id', **kwargs)
+            return sorted(builder.all(flat=True))
+
+        # Node 5 is reached through two paths, one through node 3 and one through node 4
+        self.assertEqual(get_descendants(), sorted([n2.pk, n3.pk, n4.pk, n5.pk, n5.pk]))
+        self.assertEqual(get_descendants(prune=True), sorted([n2.pk, n3.pk, n4.pk, n5.pk]))
+        self.assertEqual(get_descendants(max_depth=1), sorted([n2.pk, n3.pk, n4.pk]))
+        self.assertEqual(get_descendants(max_depth=0), [n2.pk])
+        self.assertEqual(get_descendants(link_types=[LinkType.INPUT_CALC]), [n2.pk])
+        self.assertEqual(get_descendants(link_types='input_calc'), [n2.pk])
+
+        self.assertEqual(get_ancestors(), sorted([n1.pk, n1.pk, n2.pk, n2.pk, n3.pk, n4.pk]))
+        self.assertEqual(get_ancestors(prune=True), sorted([n1.pk, n2.pk, n3.pk, n4.pk]))
+        self.assertEqual(get_ancestors(prune=True, max_depth=1), sorted([n2.pk, n3.pk, n4.pk]))
+
+        # The options should survive the round trip through the queryhelp
+        builder = orm.QueryBuilder().append(orm.Node, filters={'id': n1.pk}, tag='anc')
+        builder.append(orm.Node, with_ancestors='anc', project='id', max_depth=1, prune=True)
+        self.assertEqual(sorted(orm.QueryBuilder(**builder.queryhelp).all(flat=True)), sorted([n2.pk, n3.pk, n4.pk]))
+
+        with self.assertRaises(InputValidationError):
+            orm.QueryBuilder().append(orm.Node, tag='anc').append(orm.Node, with_incoming='anc', max_depth=1)
+
+        with self.assertRaises(InputValidationError):
+            orm.QueryBuilder().append(orm.Node, tag='anc').append(orm.Node, with_ancestors='anc', max_depth=-1)
+
+        with self.assertRaises(InputValidationError):
+            orm.QueryBuilder().append(orm.Node, tag='anc').append(orm.Node, with_ancestors='anc', link_types=['bogus'])
+
 
 class TestConsistency(AiidaTestCase):
 
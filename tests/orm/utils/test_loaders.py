@@ -10,9 +10,9 @@
 """Module to test orm utilities to load nodes, codes etc."""
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common.exceptions import NotExistent
-from aiida.orm import Node, Group, Data
-from aiida.orm.utils import load_entity, load_code, load_computer, load_group, load_node
-from aiida.orm.utils.loaders import NodeEntityLoader
+from aiida.orm import Node, Group, Data, CalculationNode
+from aiida.orm.utils import load_entity, load_code, load_computer, load_group, load_node, load_nodes
+from aiida.orm.utils.loaders import NodeEntityLoader, identity_map, get_identity_map
 
 
 class TestOrmUtils(AiidaTestCase):
@@ -211,3 +211,48 @@ class TestOrmUtils(AiidaTestCase):
 
         with self.assertRaises(NotExistent):
             load_group('non-existent-uuid')
+
+    def test_load_nodes(self):
+        """Test the functionality of load_nodes."""
+        nodes = [Data().store() for _ in range(3)]
+        calculation = CalculationNode().store()
+
+        # The order of the identifiers should be respected and pks and uuids can be mixed
+        identifiers = [nodes[2].pk, nodes[0].uuid, nodes[1].pk, nodes[2].uuid]
+        self.assertEqual([node.uuid for node in load_nodes(identifiers)], [nodes[i].uuid for i in (2, 0, 1, 2)])
+        self.assertEqual([node.pk for node in load_nodes(pks=[nodes[1].pk])], [nodes[1].pk])
+        self.assertEqual([node.pk for node in load_nodes(uuids=[nodes[1].uuid])], [nodes[1].pk])
+        self.assertEqual(load_nodes([]), [])
+
+        with self.assertRaises(NotExistent):
+            load_nodes([nodes[0].pk, calculation.pk], sub_classes=(Data,))
+
+        # Partial uuids do not uniquely define a node
+        with self.assertRaises(ValueError):
+            load_nodes([nodes[0].uuid[:8]])
+
+        with self.assertRaises(ValueError):
+            load_nodes([nodes[0].pk], pks=[nodes[0].pk])
+
+    def test_identity_map(self):
+        """Test that nodes loaded within an identity map are the same instances."""
+        node = Data().store()
+
+        self.assertIsNone(get_identity_map())
+        self.assertIsNot(load_node(node.pk), load_node(node.pk))
+
+        with identity_map() as entities:
+            loaded = load_node(node.pk)
+            self.assertIs(load_node(node.pk), loaded)
+            self.assertIs(load_node(node.uuid), loaded)
+            self.assertIs(load_nodes([node.uuid, node.pk])[0], loaded)
+            self.assertEqual(len(entities), 1)
+
+            # Nested contexts share the identity map
+            with identity_map() as nested:
+                self.assertIs(nested, entities)
+
+            with self.assertRaises(NotExistent):
+                load_node(node.pk, sub_classes=(CalculationNode,))
+
+        self.assertIsNone(get_identity_map())
@@ -19,7 +19,7 @@ from aiida.common.folders import SandboxFolder
 from aiida.common.links import LinkType
 from aiida.common.utils import get_new_uuid
 from aiida.tools.importexport import import_data, export
-from aiida.tools.importexport.common.exceptions import DanglingLinkError
+from aiida.tools.importexport.common.exceptions import DanglingLinkError, ImportValidationError
 
 from tests.utils.configuration import with_temp_dir
 from tests.tools.importexport.utils import get_all_node_links
@@ -740,3 +740,30 @@ class TestLinks(AiidaTestCase):
             msg=f'Exactly two Links are expected, instead {len(links)} were found (in, out, label, type): {links}'
         )
         self.assertListEqual(sorted(links), sorted(before_links))
+
+    def test_validate_links(self):
+        """Test the set based validation of the links to import."""
+        from aiida.tools.importexport.dbimport.backends.common import _validate_links
+
+        nodes = {
+            1: ('uuid-data', 'data.int.Int.'),
+            2: ('uuid-calc', 'process.calculation.calcfunction.CalcFunctionNode.'),
+            3: ('uuid-other', 'data.int.Int.'),
+        }
+        create = (2, 1, 'result', LinkType.CREATE.value)
+        input_calc = (1, 2, 'x', LinkType.INPUT_CALC.value)
+
+        # existing and duplicate links are skipped
+        self.assertEqual(_validate_links([create, input_calc, input_calc], nodes, {create}), [input_calc])
+
+        # a second incoming `CREATE` link for the same node violates the `unique` indegree
+        with self.assertRaises(ImportValidationError):
+            _validate_links([(2, 1, 'other', LinkType.CREATE.value)], nodes, {create})
+
+        # a second outgoing `CREATE` link with the same label violates the `unique_pair` outdegree
+        with self.assertRaises(ImportValidationError):
+            _validate_links([create, (2, 3, 'result', LinkType.CREATE.value)], nodes, set())
+
+        # the node types must match the link type
+        with self.assertRaises(ImportValidationError):
+            _validate_links([(1, 3, 'x', LinkType.INPUT_CALC.value)], nodes, set())
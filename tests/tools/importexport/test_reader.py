@@ -83,3 +83,79 @@ def test_empty_archive(archive_reader):
     with pytest.raises(CorruptArchive, match='input file cannot be read'):
         with archive_reader('empty.aiida') as archive:
             assert archive.export_version == EXPORT_VERSION
+
+
+@pytest.mark.parametrize('file_format', ('zip-jsonl', 'zip-sqlite'))
+def test_reader_records(aiida_profile, tmp_path, file_format):
+    """Test that an archive written in a format without ``data.json`` is read back with the same content."""
+    from aiida import orm
+    from aiida.common.links import LinkType
+    from aiida.tools.importexport import export, detect_archive_type
+
+    aiida_profile.reset_db()
+
+    data = orm.Int(1).store()
+    calc = orm.CalculationNode()
+    calc.add_incoming(data, LinkType.INPUT_CALC, 'input')
+    calc.store()
+    group = orm.Group(label='records').store()
+    group.add_nodes([data, calc])
+    orm.Group(label='records_empty').store()
+
+    filename = str(tmp_path / 'export.aiida')
+    export([group, orm.load_group('records_empty')], filename=filename, file_format=file_format)
+
+    assert detect_archive_type(filename) == file_format
+    with get_reader(detect_archive_type(filename))(filename) as archive:
+        assert archive.export_version == EXPORT_VERSION
+        assert archive.entity_count('Node') == 2
+        assert archive.entity_count('Group') == 2
+        assert archive.entity_count('Log') == 0
+        assert sum(1 for _ in archive.iter_entity_fields('Node')) == 2
+        assert sorted(archive.iter_node_uuids()) == sorted([data.uuid, calc.uuid])
+        assert dict(archive.iter_group_uuids()) == {
+            group.uuid: {data.uuid, calc.uuid},
+            orm.load_group('records_empty').uuid: set()
+        }
+        assert archive.link_count == 1
+        assert list(archive.iter_link_data()) == [{
+            'input': data.uuid,
+            'output': calc.uuid,
+            'label': 'input',
+            'type': LinkType.INPUT_CALC.value
+        }]
+        _, fields = next(archive.iter_entity_fields('Node', fields=('uuid', 'attributes')))
+        assert set(fields) == {'uuid', 'attributes'}
+        assert archive.node_repository(data.uuid).exists()
+
+
+@pytest.mark.parametrize('file_format', ('zip', 'zip-jsonl', 'tar.gz', 'tar.zst'))
+def test_copy_node_repos(aiida_profile, tmp_path, file_format):
+    """Test that the node repositories are copied directly from the archive to their destination."""
+    import io
+
+    from aiida import orm
+    from aiida.common.folders import Folder
+    from aiida.tools.importexport import export
+
+    aiida_profile.reset_db()
+
+    nodes = []
+    for index in range(3):
+        node = orm.Data()
+        node.put_object_from_filelike(io.StringIO(f'content {index}'), 'sub/file.txt')
+        nodes.append(node.store())
+
+    filename = str(tmp_path / 'export.aiida')
+    export(nodes, filename=filename, file_format=file_format)
+
+    uuids = [node.uuid for node in nodes]
+    destination = tmp_path / 'repositories'
+    with get_reader(file_format)(filename) as archive:
+        copied = list(archive.copy_node_repos(uuids, lambda uuid: Folder(str(destination / uuid)), max_workers=2))
+        assert sorted(copied) == sorted(uuids)
+        with pytest.raises(CorruptArchive, match='Unable to find required folder in archive'):
+            list(archive.copy_node_repos(['0' * 32], lambda uuid: Folder(str(destination / uuid))))
+
+    for index, uuid in enumerate(uuids):
+        assert (destination / uuid / 'path' / 'sub' / 'file.txt').read_text() == f'content {index}'
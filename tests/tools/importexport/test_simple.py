@@ -17,11 +17,11 @@ from aiida.common import json
 from aiida.common.exceptions import LicensingException
 from aiida.common.folders import SandboxFolder
 from aiida.common.links import LinkType
-from aiida.tools.importexport import import_data, export
+from aiida.tools.importexport import detect_archive_type, get_reader, import_data, export
 from aiida.tools.importexport.common import exceptions
 
 
-@pytest.mark.parametrize('file_format', ('zip', 'tar.gz'))
+@pytest.mark.parametrize('file_format', ('zip', 'zip-jsonl', 'zip-sqlite', 'tar.gz', 'tar.zst'))
 def test_base_data_nodes(aiida_profile, tmp_path, file_format):
     """Test ex-/import of Base Data nodes"""
     aiida_profile.reset_db()
@@ -45,7 +45,7 @@ def test_base_data_nodes(aiida_profile, tmp_path, file_format):
         assert orm.load_node(uuid).value == refval
 
 
-@pytest.mark.parametrize('file_format', ('zip', 'tar.gz'))
+@pytest.mark.parametrize('file_format', ('zip', 'zip-jsonl', 'zip-sqlite', 'tar.gz', 'tar.zst'))
 def test_calc_of_structuredata(aiida_profile, tmp_path, file_format):
     """Simple ex-/import of CalcJobNode with input StructureData"""
     aiida_profile.reset_db()
@@ -94,6 +94,170 @@ def test_calc_of_structuredata(aiida_profile, tmp_path, file_format):
             assert attrs[uuid][k] == node.get_attribute(k)
 
 
+@pytest.mark.parametrize('file_format', ('zip', 'zip-jsonl', 'zip-sqlite'))
+def test_repository_processes(aiida_profile, tmp_path, file_format):
+    """Test ex-/import of node repositories compressed by multiple processes."""
+    import io
+
+    aiida_profile.reset_db()
+
+    nodes = []
+    contents = {}
+    for index in range(5):
+        node = orm.FolderData()
+        node.put_object_from_filelike(io.StringIO(f'content {index}'), 'file.txt')
+        node.put_object_from_filelike(io.StringIO('nested'), 'sub/folder/nested.txt')
+        nodes.append(node.store())
+        contents[node.uuid] = f'content {index}'
+
+    filename = str(tmp_path / 'export.aiida')
+    export(nodes, filename=filename, file_format=file_format, processes=2)
+
+    aiida_profile.reset_db()
+
+    import_data(filename)
+    for uuid, content in contents.items():
+        node = orm.load_node(uuid)
+        assert node.get_object_content('file.txt') == content
+        assert node.get_object_content('sub/folder/nested.txt') == 'nested'
+
+
+@pytest.mark.parametrize('processes', (1, 2))
+def test_write_node_repo_folders(tmp_path, processes):
+    """Test that the zip writer writes the node repositories to a valid zip file, reporting on each repository."""
+    import zipfile
+
+    from aiida.tools.importexport.archive import get_writer
+
+    folders = []
+    for index in range(5):
+        path = tmp_path / 'repositories' / str(index)
+        (path / 'sub').mkdir(parents=True)
+        (path / 'file.txt').write_text(f'content {index}')
+        (path / 'sub' / 'nested.txt').write_text('nested' * 1000)
+        folders.append((f'{index:0>32}', str(path)))
+
+    updates = []
+    filename = str(tmp_path / 'export.zip')
+    with get_writer('zip')(filename) as writer:
+        writer.write_node_repo_folders(folders, processes=processes, callback=lambda *args: updates.append(args))
+
+    assert updates == [('update', 1)] * len(folders)
+    with zipfile.ZipFile(filename) as zip_file:
+        assert zip_file.testzip() is None
+        assert 'data.json' in zip_file.namelist()
+        for index, (uuid, _) in enumerate(folders):
+            prefix = f'nodes/{uuid[:2]}/{uuid[2:4]}/{uuid[4:]}'
+            assert zip_file.read(f'{prefix}/file.txt').decode() == f'content {index}'
+            assert zip_file.read(f'{prefix}/sub/nested.txt').decode() == 'nested' * 1000
+
+
+@pytest.mark.parametrize('cache_zipinfo', (False, True))
+def test_write_node_repo_folders_zip64(tmp_path, monkeypatch, cache_zipinfo):
+    """Test that the members deflated by worker processes are merged into a valid zip file with ZIP64 extensions.
+
+    The limits from which the ZIP64 extensions are used are lowered, such that the sizes and offsets of the members,
+    the number of members and the offset of the central directory all require them.
+    """
+    import zipfile
+
+    from aiida.tools.importexport.archive import get_writer, writers
+
+    monkeypatch.setattr(writers, '_ZIP64_LIMIT', 1000)
+    monkeypatch.setattr(writers, '_ZIP_FILECOUNT_LIMIT', 10)
+
+    folders = []
+    for index in range(5):
+        path = tmp_path / 'repositories' / str(index)
+        (path / 'sub').mkdir(parents=True)
+        (path / 'file.txt').write_text(f'content {index}')
+        (path / 'sub' / 'nested.txt').write_text('nested' * 1000)
+        folders.append((f'{index:0>32}', str(path)))
+
+    filename = tmp_path / 'export.zip'
+    with get_writer('zip')(str(filename), cache_zipinfo=cache_zipinfo) as writer:
+        writer.write_node_repo_folders(folders, processes=2)
+
+    assert b'PK\x06\x06' in filename.read_bytes()
+    with zipfile.ZipFile(str(filename)) as zip_file:
+        assert zip_file.testzip() is None
+        assert len(zip_file.infolist()) > 10
+        assert max(info.header_offset for info in zip_file.infolist()) > 1000
+        for index, (uuid, _) in enumerate(folders):
+            prefix = f'nodes/{uuid[:2]}/{uuid[2:4]}/{uuid[4:]}'
+            assert zip_file.getinfo(f'{prefix}/sub/nested.txt').file_size == 6000
+            assert zip_file.read(f'{prefix}/file.txt').decode() == f'content {index}'
+            assert zip_file.read(f'{prefix}/sub/nested.txt').decode() == 'nested' * 1000
+
+
+def test_incremental_export(aiida_profile, tmp_path):
+    """Test an incremental export, and the import of the chain of archives."""
+    aiida_profile.reset_db()
+
+    unrelated = orm.Int(1).store()
+    data_input = orm.Int(2).store()
+    filename_base = str(tmp_path / 'base.aiida')
+    export([unrelated, data_input], filename=filename_base)
+
+    calc = orm.CalculationNode()
+    calc.add_incoming(data_input, link_type=LinkType.INPUT_CALC, link_label='input')
+    calc.store()
+    data_output = orm.Int(3)
+    data_output.add_incoming(calc, link_type=LinkType.CREATE, link_label='output')
+    data_output.store()
+    calc.seal()
+
+    filename_incremental = str(tmp_path / 'incremental.aiida')
+    export([unrelated, calc], filename=filename_incremental, incremental_from=[filename_base])
+
+    with get_reader(detect_archive_type(filename_incremental))(filename_incremental) as reader:
+        node_uuids = set(reader.iter_node_uuids())
+        link_count = reader.link_count
+    # the unmodified input node is required to import its link
+    assert node_uuids == {data_input.uuid, calc.uuid, data_output.uuid}
+    assert link_count == 2
+
+    uuids = [unrelated.uuid, data_input.uuid, calc.uuid, data_output.uuid]
+    aiida_profile.reset_db()
+
+    with pytest.raises(exceptions.CorruptArchive):
+        import_data(filename_incremental)
+
+    import_data(filename_base)
+    import_data(filename_incremental)
+    for uuid in uuids:
+        orm.load_node(uuid)
+    assert orm.load_node(uuids[2]).get_incoming().one().node.uuid == uuids[1]
+
+
+def test_import_existing_entities(aiida_profile, tmp_path):
+    """Test that the entities of an archive that already exist in the database are matched to their PKs."""
+    aiida_profile.reset_db()
+
+    existing = orm.Int(1).store()
+    existing.add_comment('comment')
+    new = orm.Int(2).store()
+    filename_existing = str(tmp_path / 'existing.aiida')
+    export([existing], filename=filename_existing)
+    filename = str(tmp_path / 'export.aiida')
+    export([existing, new], filename=filename)
+
+    uuids = {existing.uuid: existing.pk, new.uuid: new.pk}
+    ret_dict = import_data(filename)
+    assert not ret_dict['Node']['new']
+    assert sorted(pk for _, pk in ret_dict['Node']['existing']) == sorted(uuids.values())
+
+    aiida_profile.reset_db()
+
+    import_data(filename_existing)
+    existing_pk = orm.load_node(existing.uuid).pk
+    ret_dict = import_data(filename)
+    assert [pk for _, pk in ret_dict['Node']['existing']] == [existing_pk]
+    assert len(ret_dict['Node']['new']) == 1
+    orm.load_node(new.uuid)
+    assert len(orm.load_node(existing.uuid).get_comments()) == 1
+
+
 def test_check_for_export_format_version(aiida_profile, tmp_path):
     """Test the check for the export format version."""
     # Creating a folder for the archive files
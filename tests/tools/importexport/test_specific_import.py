@@ -9,6 +9,7 @@
 ###########################################################################
 """Tests for the export and import routines"""
 
+import io
 import os
 import shutil
 import tempfile
@@ -78,6 +79,43 @@ class TestSpecificImport(AiidaTestCase):
             import_data(handle.name, silent=True)
             self.assertEqual(orm.QueryBuilder().append(orm.Node).count(), len(nodes))
 
+    def test_import_node_fields(self):
+        """Test that the fields of imported nodes are preserved, including values that need escaping when copied."""
+        value = 'tab\tnewline\ncarriage\rbackslash\\N null \u00e9\u2603'
+        node = orm.Dict(dict={'value': value, 'nested': {'list': [1, 2.5, None, True]}})
+        node.label = value
+        node.description = value
+        node.set_extra('value', value)
+        node.store()
+
+        expected = {
+            'attributes': node.attributes,
+            'extras': {key: val for key, val in node.extras.items() if not key.startswith('_aiida_')},
+            'label': node.label,
+            'description': node.description,
+            'ctime': node.ctime,
+            'mtime': node.mtime,
+            'user': node.user.email,
+        }
+        uuid = node.uuid
+
+        with tempfile.NamedTemporaryFile() as handle:
+            export([node], filename=handle.name, overwrite=True)
+            self.clean_db()
+            self.create_user()
+            import_data(handle.name)
+
+        imported = orm.load_node(uuid)
+        self.assertEqual(imported.attributes, expected['attributes'])
+        self.assertEqual(
+            {key: val for key, val in imported.extras.items() if not key.startswith('_aiida_')}, expected['extras']
+        )
+        self.assertEqual(imported.label, expected['label'])
+        self.assertEqual(imported.description, expected['description'])
+        self.assertEqual(imported.ctime, expected['ctime'])
+        self.assertEqual(imported.mtime, expected['mtime'])
+        self.assertEqual(imported.user.email, expected['user'])
+
     def test_cycle_structure_data(self):
         """
         Create an export with some orm.CalculationNode and Data nodes and import it after having
@@ -203,6 +241,39 @@ class TestSpecificImport(AiidaTestCase):
         self.assertIn(f'Unable to find the repository folder for Node with UUID={node_uuid}', str(exc.exception))
         self.assertFalse(os.path.exists(filename), msg='The archive file should not exist')
 
+    @with_temp_dir
+    def test_node_repositories_rollback(self, temp_dir):
+        """Test that the imported node repositories are removed if the import transaction fails."""
+        from unittest.mock import patch
+
+        node = orm.Dict(dict={'a': 1})
+        node.put_object_from_filelike(io.StringIO('content'), 'file.txt')
+        node.store()
+        node_uuid = node.uuid
+
+        filename = os.path.join(temp_dir, 'export.aiida')
+        export([node], filename=filename)
+        self.reset_database()
+
+        node_repo = RepositoryFolder(section=Repository._section_name, uuid=node_uuid)  # pylint: disable=protected-access
+        node_repo.erase()
+
+        from aiida.manage import configuration
+        backend = 'sqla' if configuration.PROFILE.database_backend == 'sqlalchemy' else 'django'
+        with patch(
+            f'aiida.tools.importexport.dbimport.backends.{backend}._store_node_links',
+            side_effect=RuntimeError('failure')
+        ):
+            with self.assertRaises(RuntimeError):
+                import_data(filename)
+
+        self.assertFalse(node_repo.exists())
+        self.assertEqual(orm.QueryBuilder().append(orm.Node).count(), 0)
+
+        # the import succeeds afterwards and the repository is copied
+        import_data(filename)
+        self.assertEqual(orm.load_node(node_uuid).get_object_content('file.txt'), 'content')
+
     @with_temp_dir
     def test_missing_node_repo_folder_import(self, temp_dir):
         """